@@ -2,6 +2,7 @@ import QtQuick 2.13
 
 import easyApp.Gui.Charts 1.0 as EaCharts
 
+import Gui.Logic 1.0 as ExLogic
 import Gui.Globals 1.0 as ExGlobals
 
 EaCharts.BaseQtCharts {
@@ -22,5 +23,26 @@ EaCharts.BaseQtCharts {
     }
     yDifferenceAxisTitle: "Imeas - Icalc"
 
-    Component.onCompleted: ExGlobals.Variables.analysisChart = this
+    // Series are decimated to about 2 points per pixel of the plot width,
+    // over the x range shown by the axis
+    property var xAxis: null
+
+    function updateVisibleRange() {
+        if (xAxis)
+            ExGlobals.Constants.proxy.plotting1d.setVisibleRange('analysis', xAxis.min, xAxis.max)
+    }
+
+    Connections {
+        target: xAxis
+        ignoreUnknownSignals: true
+        onMinChanged: Qt.callLater(updateVisibleRange)
+        onMaxChanged: Qt.callLater(updateVisibleRange)
+    }
+
+    onWidthChanged: ExGlobals.Constants.proxy.plotting1d.setPixelCount('analysis', Math.max(Math.round(width), 1))
+
+    Component.onCompleted: {
+        ExGlobals.Variables.analysisChart = this
+        xAxis = ExLogic.Helpers.horizontalAxis(this)
+    }
 }
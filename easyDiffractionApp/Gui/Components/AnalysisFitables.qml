@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -19,27 +18,12 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        id: fitablesModel
+    model: ExGlobals.Constants.proxy.parametersModel
 
-        //xml: ExGlobals.Constants.proxy.fitablesListAsXml
-        xml: ExGlobals.Constants.proxy.parametersAsXml
-
-        query: "/root/item"
-
-        XmlRole { name: "id"; query: "id/string()" }
-        XmlRole { name: "number"; query: "number/number()" }
-        XmlRole { name: "label"; query: "label/string()" }
-        XmlRole { name: "value"; query: "value/number()" }
-        XmlRole { name: "unit"; query: "unit/string()" }
-        XmlRole { name: "error"; query: "error/number()" }
-        XmlRole { name: "fit"; query: "fit/number()" }
-
-        onStatusChanged: {
-            if (status === XmlListModel.Ready) {
-                storeCurrentParameter()
-            }
-        }
+    Connections {
+        target: table.model
+        onModelReset: storeCurrentParameter()
+        onDataChanged: storeCurrentParameter()
     }
 
     // Table rows
@@ -129,7 +113,7 @@ EaComponents.TableView {
     // Logic
 
     function storeCurrentParameter() {
-        if (typeof model.get(currentIndex) === "undefined")
+        if (!model.get(currentIndex))
             return
         ExGlobals.Variables.currentParameterId = model.get(currentIndex).id
         ExGlobals.Variables.currentParameterValue = model.get(currentIndex).value
@@ -160,7 +144,7 @@ EaComponents.TableView {
         const last = list.length - 1
 
         // Modify previous label to list
-        let previousLabel = index > 0 ? fitablesModel.get(index - 1).label : ""
+        let previousLabel = index > 0 ? table.model.get(index - 1).label : ""
         previousLabel = previousLabel.replace(".background.", ".")
         previousLabel = previousLabel.replace("Uiso.Uiso", "Uiso")
         previousLabel = previousLabel.replace("fract_", "fract.")
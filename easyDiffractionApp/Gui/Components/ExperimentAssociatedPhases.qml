@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -17,12 +16,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        xml: ExGlobals.Constants.proxy.phasesAsXml
-        query: "/root/item"
-
-        XmlRole { name: "label"; query: "name/string()" }
-    }
+    model: ExGlobals.Constants.proxy.phasesModel
 
     // Table rows
 
@@ -46,7 +40,7 @@ EaComponents.TableView {
                    - EaStyle.Sizes.tableColumnSpacing * 4
                    - EaStyle.Sizes.borderThickness * 2
             headerText: "Label"
-            text: model.label
+            text: model.name
         }
 
         EaComponents.TableViewTextInput {
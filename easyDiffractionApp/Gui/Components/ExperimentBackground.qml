@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -16,18 +15,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        xml: ExGlobals.Constants.proxy.backgroundProxy.asXml
-        query: "/root/item"
-
-        XmlRole { name: "x"; query: "x/value/number()" }
-        XmlRole { name: "y"; query: "y/value/number()" }
-
-        XmlRole { name: "pointName"; query: "name/string()" }
-
-        XmlRole { name: "xId"; query: "x/key[4]/string()" }
-        XmlRole { name: "yId"; query: "y/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.backgroundProxy.asModel
 
     // Table rows
 
@@ -44,8 +32,8 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignRight
             width: EaStyle.Sizes.fontPixelSize * 11.6
             headerText: "2θ"
-            text: EaLogic.Utils.toFixed(model.x)
-            onEditingFinished: editParameterValue(model.xId, text)
+            text: EaLogic.Utils.toFixed(model.x.value)
+            onEditingFinished: editParameterValue(model.x['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
@@ -53,8 +41,8 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignRight
             width: xLabel.width
             headerText: "Intensity"
-            text: EaLogic.Utils.toFixed(model.y)
-            onEditingFinished: editParameterValue(model.yId, text)
+            text: EaLogic.Utils.toFixed(model.y.value)
+            onEditingFinished: editParameterValue(model.y['@id'], text)
         }
 
         EaComponents.TableViewLabel {
@@ -65,7 +53,7 @@ EaComponents.TableView {
             headerText: "Del."
             fontIcon: "minus-circle"
             ToolTip.text: qsTr("Remove this point")
-            onClicked: ExGlobals.Constants.proxy.backgroundProxy.removePoint(model.pointName)
+            onClicked: ExGlobals.Constants.proxy.backgroundProxy.removePoint(model.name)
         }
 
     }
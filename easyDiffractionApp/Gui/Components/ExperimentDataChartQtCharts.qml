@@ -1,12 +1,35 @@
+import QtQuick 2.13
+
 import easyApp.Gui.Charts 1.0 as EaCharts
 
+import Gui.Logic 1.0 as ExLogic
 import Gui.Globals 1.0 as ExGlobals
 
 EaCharts.BaseQtCharts {
-    measuredData: ExGlobals.Constants.proxy.plotting1d.qtchartsMeasuredDataObj
+    measuredData: ExGlobals.Constants.proxy.plotting1d.qtchartsExperimentMeasuredDataObj
 
     plotRanges: ExGlobals.Constants.proxy.plotting1d.experimentPlotRangesObj
 
     xAxisTitle: "2θ (deg)"
     yMainAxisTitle: "Imeas"
+
+    // Series are decimated to about 2 points per pixel of the plot width,
+    // over the x range shown by the axis
+    property var xAxis: null
+
+    function updateVisibleRange() {
+        if (xAxis)
+            ExGlobals.Constants.proxy.plotting1d.setVisibleRange('experiment', xAxis.min, xAxis.max)
+    }
+
+    Connections {
+        target: xAxis
+        ignoreUnknownSignals: true
+        onMinChanged: Qt.callLater(updateVisibleRange)
+        onMaxChanged: Qt.callLater(updateVisibleRange)
+    }
+
+    onWidthChanged: ExGlobals.Constants.proxy.plotting1d.setPixelCount('experiment', Math.max(Math.round(width), 1))
+
+    Component.onCompleted: xAxis = ExLogic.Helpers.horizontalAxis(this)
 }
@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -17,12 +16,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        xml: ExGlobals.Constants.proxy.experimentDataAsXml
-        query: "/root/item"
-
-        XmlRole { name: "label"; query: "name/string()" }
-    }
+    model: ExGlobals.Constants.proxy.experimentDataModel
 
     // Table rows
 
@@ -38,7 +32,7 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignLeft
             width: EaStyle.Sizes.fontPixelSize * 27.9
             headerText: "Label"
-            text: model.label
+            text: model.name
             onEditingFinished: ExGlobals.Constants.proxy.setCurrentExperimentDatasetName(text)
         }
 
@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -17,18 +16,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        xml: ExGlobals.Constants.proxy.instrumentParametersAsXml
-        query: `/root/item`
-
-        XmlRole { name: "u"; query: "resolution_u/value/number()" }
-        XmlRole { name: "v"; query: "resolution_v/value/number()" }
-        XmlRole { name: "w"; query: "resolution_w/value/number()" }
-
-        XmlRole { name: "uId"; query: "resolution_u/key[4]/string()" }
-        XmlRole { name: "vId"; query: "v_resolution/key[4]/string()" }
-        XmlRole { name: "wId"; query: "resolution_w/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.instrumentParametersModel
 
     // Table rows
 
@@ -37,22 +25,22 @@ EaComponents.TableView {
         EaComponents.TableViewTextInput {
             width: tableView.width / contentRowData.length
             headerText: "U"
-            text: EaLogic.Utils.toFixed(model.u)
-            onEditingFinished: editParameterValue(model.uId, text)
+            text: EaLogic.Utils.toFixed(model.resolution_u.value)
+            onEditingFinished: editParameterValue(model.resolution_u['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: tableView.width / contentRowData.length
             headerText: "V"
-            text: EaLogic.Utils.toFixed(model.v)
-            onEditingFinished: editParameterValue(model.vId, text)
+            text: EaLogic.Utils.toFixed(model.resolution_v.value)
+            onEditingFinished: editParameterValue(model.resolution_v['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: tableView.width / contentRowData.length
             headerText: "W"
-            text: EaLogic.Utils.toFixed(model.w)
-            onEditingFinished: editParameterValue(model.wId, text)
+            text: EaLogic.Utils.toFixed(model.resolution_w.value)
+            onEditingFinished: editParameterValue(model.resolution_w['@id'], text)
         }
     }
 
@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -17,16 +16,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        xml: ExGlobals.Constants.proxy.instrumentParametersAsXml
-        query: `/root/item`
-
-        XmlRole { name: "x"; query: "resolution_x/value/number()" }
-        XmlRole { name: "y"; query: "resolution_y/value/number()" }
-
-        XmlRole { name: "xId"; query: "resolution_x/key[4]/string()" }
-        XmlRole { name: "yId"; query: "resolution_y/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.instrumentParametersModel
 
     // Table rows
 
@@ -35,15 +25,15 @@ EaComponents.TableView {
         EaComponents.TableViewTextInput {
             width: tableView.width / contentRowData.length
             headerText: "X"
-            text: EaLogic.Utils.toFixed(model.x)
-            onEditingFinished: editParameterValue(model.xId, text)
+            text: EaLogic.Utils.toFixed(model.resolution_x.value)
+            onEditingFinished: editParameterValue(model.resolution_x['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: tableView.width / contentRowData.length
             headerText: "Y"
-            text: EaLogic.Utils.toFixed(model.y)
-            onEditingFinished: editParameterValue(model.yId, text)
+            text: EaLogic.Utils.toFixed(model.resolution_y.value)
+            onEditingFinished: editParameterValue(model.resolution_y['@id'], text)
         }
 
     }
@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -14,35 +13,18 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        property int phaseIndex: ExGlobals.Constants.proxy.currentPhaseIndex + 1
-
-        xml: ExGlobals.Constants.proxy.phasesAsXml
-        query: `/root/item[${phaseIndex}]/atoms/data/item`
-
-        XmlRole { name: "label"; query: "label/value/string()" }
-        XmlRole { name: "adpType"; query: "adp/adp_type/value/string()" }
-        XmlRole { name: "adpIso"; query: `adp/adp_class/Uiso/value/number()` }
-        XmlRole { name: "adpAni11"; query: "adp_ani_11/number()" }
-        XmlRole { name: "adpAni22"; query: "adp_ani_22/number()" }
-        XmlRole { name: "adpAni33"; query: "adp_ani_33/number()" }
-        XmlRole { name: "adpAni12"; query: "adp_ani_12/number()" }
-        XmlRole { name: "adpAni13"; query: "adp_ani_13/number()" }
-        XmlRole { name: "adpAni23"; query: "adp_ani_23/number()" }
-
-        XmlRole { name: "adpIsoId"; query: "adp/adp_class/Uiso/key[4]/string()" }
-        XmlRole { name: "adpAni11Id"; query: "adp_ani_11/key[4]/string()" }
-        XmlRole { name: "adpAni22Id"; query: "adp_ani_22/key[4]/string()" }
-        XmlRole { name: "adpAni33Id"; query: "adp_ani_33/key[4]/string()" }
-        XmlRole { name: "adpAni12Id"; query: "adp_ani_12/key[4]/string()" }
-        XmlRole { name: "adpAni13Id"; query: "adp_ani_13/key[4]/string()" }
-        XmlRole { name: "adpAni23Id"; query: "adp_ani_23/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.currentPhaseAtomsModel
 
     // Table rows
 
     delegate: EaComponents.TableViewDelegate {
-        property string modelAdpType: model.adpType
+        property string modelAdpType: model.adp.adp_type.value
+        property var adpAni11: adpAniParameter(model.adp, "11")
+        property var adpAni22: adpAniParameter(model.adp, "22")
+        property var adpAni33: adpAniParameter(model.adp, "33")
+        property var adpAni12: adpAniParameter(model.adp, "12")
+        property var adpAni13: adpAniParameter(model.adp, "13")
+        property var adpAni23: adpAniParameter(model.adp, "23")
 
         EaComponents.TableViewLabel {
             width: EaStyle.Sizes.fontPixelSize * 2.5
@@ -55,7 +37,7 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignLeft
             width: EaStyle.Sizes.fontPixelSize * 3.8
             headerText: "Label"
-            text: model.label
+            text: model.label.value
         }
 
         EaComponents.TableViewComboBox {
@@ -70,56 +52,74 @@ EaComponents.TableView {
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
             headerText: "Iso"
-            text: EaLogic.Utils.toFixed(model.adpIso)
-            onEditingFinished: editParameterValue(model.adpIsoId, text)
+            text: EaLogic.Utils.toFixed(model.adp.adp_class.Uiso.value)
+            onEditingFinished: editParameterValue(model.adp.adp_class.Uiso['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni11 !== undefined
             headerText: "Ani11"
-            text: EaLogic.Utils.toFixed(model.adpAni11)
-            onEditingFinished: editParameterValue(model.adpAniId11, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni11.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni11['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni22 !== undefined
             headerText: "Ani22"
-            text: EaLogic.Utils.toFixed(model.adpAni22)
-            onEditingFinished: editParameterValue(model.adpAniId22, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni22.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni22['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni33 !== undefined
             headerText: "Ani33"
-            text: EaLogic.Utils.toFixed(model.adpAni33)
-            onEditingFinished: editParameterValue(model.adpAniId33, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni33.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni33['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni12 !== undefined
             headerText: "Ani12"
-            text: EaLogic.Utils.toFixed(model.adpAni12)
-            onEditingFinished: editParameterValue(model.adpAniId12, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni12.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni12['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni13 !== undefined
             headerText: "Ani13"
-            text: EaLogic.Utils.toFixed(model.adpAni13)
-            onEditingFinished: editParameterValue(model.adpAniId13, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni13.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni13['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: adpAtomLabel.width
+            enabled: adpAni23 !== undefined
             headerText: "Ani23"
-            text: EaLogic.Utils.toFixed(model.adpAni23)
-            onEditingFinished: editParameterValue(model.adpAniId23, text)
+            text: enabled ? EaLogic.Utils.toFixed(adpAni23.value) : ""
+            onEditingFinished: if (enabled) editParameterValue(adpAni23['@id'], text)
         }
 
     }
 
     // Logic
 
+    // Anisotropic ADP parameter, e.g. U_11 of Uani or B_11 of Bani, of the
+    // atom: undefined for isotropic ADPs
+    function adpAniParameter(adp, indices) {
+        const adpClass = adp.adp_class
+        for (const name in adpClass) {
+            if (name.endsWith(indices)) {
+                return adpClass[name]
+            }
+        }
+        return undefined
+    }
+
     function editParameterValue(id, value) {
         ExGlobals.Constants.proxy.editParameter(id, parseFloat(value))
     }
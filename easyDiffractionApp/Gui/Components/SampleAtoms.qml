@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -19,32 +18,12 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        property int phaseIndex: ExGlobals.Constants.proxy.currentPhaseIndex + 1
-
-        xml: ExGlobals.Constants.proxy.phasesAsXml
-        query: `/root/item[${phaseIndex}]/atoms/data/item`
-
-        XmlRole { name: "label"; query: "label/value/string()" }
-        XmlRole { name: "type"; query: "specie/value/string()" }
-        //XmlRole { name: "color"; query: "color/string()" }
-        XmlRole { name: "x"; query: "fract_x/value/number()" }
-        XmlRole { name: "y"; query: "fract_y/value/number()" }
-        XmlRole { name: "z"; query: "fract_z/value/number()" }
-        XmlRole { name: "occupancy"; query: "occupancy/value/number()" }
-
-        XmlRole { name: "labelId"; query: "label/key[4]/string()" }
-        XmlRole { name: "typeId"; query: "specie/key[4]/string()" }
-        XmlRole { name: "xId"; query: "fract_x/key[4]/string()" }
-        XmlRole { name: "yId"; query: "fract_y/key[4]/string()" }
-        XmlRole { name: "zId"; query: "fract_z/key[4]/string()" }
-        XmlRole { name: "occupancyId"; query: "occupancy/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.currentPhaseAtomsModel
 
     // Table rows
 
     delegate: EaComponents.TableViewDelegate {
-        property string modelType: model.type
+        property string modelType: model.specie.value
 
         EaComponents.TableViewLabel {
             width: EaStyle.Sizes.fontPixelSize * 2.5
@@ -57,8 +36,8 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignLeft
             width: EaStyle.Sizes.fontPixelSize * 4.22
             headerText: "Label"
-            text: model.label
-            onEditingFinished: editDescriptorValue(model.labelId, text)
+            text: model.label.value
+            onEditingFinished: editDescriptorValue(model.label['@id'], text)
         }
 
         /*
@@ -73,41 +52,41 @@ EaComponents.TableView {
             width: atomLabel.width
             horizontalAlignment: Text.AlignLeft
             headerText: "Atom"
-            text: model.type
-            onEditingFinished: editDescriptorValue(model.typeId, text)
+            text: model.specie.value
+            onEditingFinished: editDescriptorValue(model.specie['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: atomLabel.width
             headerText: "x"
-            text: EaLogic.Utils.toFixed(model.x)
-            onEditingFinished: editParameterValue(model.xId, text)
+            text: EaLogic.Utils.toFixed(model.fract_x.value)
+            onEditingFinished: editParameterValue(model.fract_x['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: atomLabel.width
             headerText: "y"
-            text: EaLogic.Utils.toFixed(model.y)
-            onEditingFinished: editParameterValue(model.yId, text)
+            text: EaLogic.Utils.toFixed(model.fract_y.value)
+            onEditingFinished: editParameterValue(model.fract_y['@id'], text)
        }
 
         EaComponents.TableViewTextInput {
             width: atomLabel.width
             headerText: "z"
-            text: EaLogic.Utils.toFixed(model.z)
-            onEditingFinished: editParameterValue(model.zId, text)
+            text: EaLogic.Utils.toFixed(model.fract_z.value)
+            onEditingFinished: editParameterValue(model.fract_z['@id'], text)
         }
 
         EaComponents.TableViewTextInput {
             width: atomLabel.width
             headerText: "Occ."
-            text: EaLogic.Utils.toFixed(model.occupancy)
-            onEditingFinished: editParameterValue(model.occupancyId, text)
+            text: EaLogic.Utils.toFixed(model.occupancy.value)
+            onEditingFinished: editParameterValue(model.occupancy['@id'], text)
         }
 
         EaComponents.TableViewLabel {
             headerText: "Color"
-            backgroundColor: jmolAtomColor(model.type)
+            backgroundColor: jmolAtomColor(model.specie.value)
         }
 
         EaComponents.TableViewButton {
@@ -116,7 +95,7 @@ EaComponents.TableView {
             headerText: "Del." //"\uf2ed"
             fontIcon: "minus-circle"
             ToolTip.text: qsTr("Remove this atom")
-            onClicked: ExGlobals.Constants.proxy.removeAtom(model.label)
+            onClicked: ExGlobals.Constants.proxy.removeAtom(model.label.value)
         }
 
     }
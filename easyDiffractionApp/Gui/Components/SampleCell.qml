@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -14,33 +13,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        property int phaseIndex: ExGlobals.Constants.proxy.currentPhaseIndex + 1
-
-        xml: ExGlobals.Constants.proxy.phasesAsXml
-        query: `/root/item[${phaseIndex}]`
-
-        XmlRole { name: "a"; query: "cell/length_a/value/number()" }
-        XmlRole { name: "b"; query: "cell/length_b/value/number()" }
-        XmlRole { name: "c"; query: "cell/length_c/value/number()" }
-        XmlRole { name: "alpha"; query: "cell/angle_alpha/value/number()" }
-        XmlRole { name: "beta"; query: "cell/angle_beta/value/number()" }
-        XmlRole { name: "gamma"; query: "cell/angle_gamma/value/number()" }
-
-        XmlRole { name: "a_enabled"; query: "cell/length_a/enabled/string()"}
-        XmlRole { name: "b_enabled"; query: "cell/length_b/enabled/string()"}
-        XmlRole { name: "c_enabled"; query: "cell/length_c/enabled/string()"}
-        XmlRole { name: "alpha_enabled"; query: "cell/angle_alpha/enabled/string()" }
-        XmlRole { name: "beta_enabled"; query: "cell/angle_beta/enabled/string()"}
-        XmlRole { name: "gamma_enabled"; query: "cell/angle_gamma/enabled/string()"}
-
-        XmlRole { name: "aId"; query: "cell/length_a/key[4]/string()" }
-        XmlRole { name: "bId"; query: "cell/length_b/key[4]/string()" }
-        XmlRole { name: "cId"; query: "cell/length_c/key[4]/string()" }
-        XmlRole { name: "alphaId"; query: "cell/angle_alpha/key[4]/string()" }
-        XmlRole { name: "betaId"; query: "cell/angle_beta/key[4]/string()" }
-        XmlRole { name: "gammaId"; query: "cell/angle_gamma/key[4]/string()" }
-    }
+    model: ExGlobals.Constants.proxy.currentPhaseModel
 
     // Table rows
 
@@ -50,50 +23,50 @@ EaComponents.TableView {
             id: cellLengthALabel
             width: EaStyle.Sizes.fontPixelSize * 5.8
             headerText: "a (Å)"
-            text: EaLogic.Utils.toFixed(model.a)
-            onEditingFinished: editParameterValue(model.aId, text)
-            enabled: model.a_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.length_a.value)
+            onEditingFinished: editParameterValue(model.cell.length_a['@id'], text)
+            enabled: model.cell.length_a.enabled
             Component.onCompleted: ExGlobals.Variables.cellLengthALabel = this
         }
 
         EaComponents.TableViewTextInput {
             width: cellLengthALabel.width
             headerText: "b (Å)"
-            text: EaLogic.Utils.toFixed(model.b)
-            onEditingFinished: editParameterValue(model.bId, text)
-            enabled: model.b_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.length_b.value)
+            onEditingFinished: editParameterValue(model.cell.length_b['@id'], text)
+            enabled: model.cell.length_b.enabled
         }
 
         EaComponents.TableViewTextInput {
             width: cellLengthALabel.width
             headerText: "c (Å)"
-            text: EaLogic.Utils.toFixed(model.c)
-            onEditingFinished: editParameterValue(model.cId, text)
-            enabled: model.c_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.length_c.value)
+            onEditingFinished: editParameterValue(model.cell.length_c['@id'], text)
+            enabled: model.cell.length_c.enabled
         }
 
         EaComponents.TableViewTextInput {
             width: cellLengthALabel.width
             headerText: "alpha (°)"
-            text: EaLogic.Utils.toFixed(model.alpha)
-            onEditingFinished: editParameterValue(model.alphaId, text)
-            enabled: model.alpha_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.angle_alpha.value)
+            onEditingFinished: editParameterValue(model.cell.angle_alpha['@id'], text)
+            enabled: model.cell.angle_alpha.enabled
         }
 
         EaComponents.TableViewTextInput {
             width: cellLengthALabel.width
             headerText: "beta (°)"
-            text: EaLogic.Utils.toFixed(model.beta)
-            onEditingFinished: editParameterValue(model.betaId, text)
-            enabled: model.beta_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.angle_beta.value)
+            onEditingFinished: editParameterValue(model.cell.angle_beta['@id'], text)
+            enabled: model.cell.angle_beta.enabled
         }
 
         EaComponents.TableViewTextInput {
             width: cellLengthALabel.width
             headerText: "gamma (°)"
-            text: EaLogic.Utils.toFixed(model.gamma)
-            onEditingFinished: editParameterValue(model.gammaId, text)
-            enabled: model.gamma_enabled === 'True'
+            text: EaLogic.Utils.toFixed(model.cell.angle_gamma.value)
+            onEditingFinished: editParameterValue(model.cell.angle_gamma['@id'], text)
+            enabled: model.cell.angle_gamma.enabled
         }
 
     }
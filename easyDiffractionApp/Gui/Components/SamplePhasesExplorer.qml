@@ -1,6 +1,5 @@
 import QtQuick 2.13
 import QtQuick.Controls 2.13
-import QtQuick.XmlListModel 2.13
 
 import easyApp.Gui.Globals 1.0 as EaGlobals
 import easyApp.Gui.Style 1.0 as EaStyle
@@ -17,15 +16,7 @@ EaComponents.TableView {
 
     // Table model
 
-    model: XmlListModel {
-        property int phaseIndex: ExGlobals.Constants.proxy.currentPhaseIndex + 1
-
-        xml: ExGlobals.Constants.proxy.phasesAsXml
-        query: "/root/item"
-
-        XmlRole { name: "label"; query: "name/string()" }
-        XmlRole { name: "color"; query: "color/string()" }
-    }
+    model: ExGlobals.Constants.proxy.phasesModel
 
     // Table rows
 
@@ -42,7 +33,7 @@ EaComponents.TableView {
             horizontalAlignment: Text.AlignLeft
             width: EaStyle.Sizes.fontPixelSize * 27.9
             headerText: "Label"
-            text: model.label
+            text: model.name
             onEditingFinished: ExGlobals.Constants.proxy.setCurrentPhaseName(text)
         }
 
@@ -57,7 +48,7 @@ EaComponents.TableView {
             headerText: "Del." //"\uf2ed"
             fontIcon: "minus-circle"
             ToolTip.text: qsTr("Remove this phase")
-            onClicked: ExGlobals.Constants.proxy.removePhase(model.label)
+            onClicked: ExGlobals.Constants.proxy.removePhase(model.name)
         }
 
     }
@@ -17,3 +17,22 @@ function removeCifSyntaxHighlighting(html)
         .replace(/<style.+style>/ig, "")  // remove html style group
         .replace(/<\/?[^>]+>/ig, "")      // remove html tags
 }
+
+// Horizontal axis of the first ChartView found in the item tree, or null
+function horizontalAxis(item)
+{
+    if (!item)
+        return null
+    if (item.axes !== undefined && typeof item.axisX === "function") {
+        for (let i = 0; i < item.axes.length; ++i)
+            if (item.axes[i].orientation === Qt.Horizontal)
+                return item.axes[i]
+    }
+    const children = item.children || []
+    for (let i = 0; i < children.length; ++i) {
+        const axis = horizontalAxis(children[i])
+        if (axis)
+            return axis
+    }
+    return null
+}
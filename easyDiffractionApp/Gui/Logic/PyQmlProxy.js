@@ -5,6 +5,9 @@ class Plotting1d {
     get currentLib() {
         return 'bokeh'
     }
+    get fullResolution() {
+        return false
+    }
     get experimentPlotRangesObj() {
         return {
             max_x: 45,
@@ -65,6 +68,9 @@ class Plotting1d {
             "xy_lower":[{"x":40,"y":619.8},{"x":40.05,"y":727.9},{"x":40.1,"y":839.1},{"x":40.15,"y":963.2},{"x":40.2,"y":1062.6},{"x":40.25,"y":1147.1},{"x":40.3,"y":1207.7},{"x":40.35,"y":1212.7},{"x":40.4,"y":1172.9},{"x":40.45,"y":1082.5},{"x":40.5,"y":951.3},{"x":40.55,"y":821.2},{"x":40.6,"y":697.1},{"x":40.65,"y":577.1},{"x":40.7,"y":502.8},{"x":40.75,"y":427.5},{"x":40.8,"y":382.9},{"x":40.85,"y":376},{"x":40.9,"y":362.1},{"x":40.95,"y":382.9},{"x":41,"y":410.6},{"x":41.05,"y":439.4},{"x":41.1,"y":481},{"x":41.15,"y":557.3},{"x":41.2,"y":615.8},{"x":41.25,"y":676.3},{"x":41.3,"y":723.9},{"x":41.35,"y":768.6},{"x":41.4,"y":770.6},{"x":41.45,"y":733.9},{"x":41.5,"y":710},{"x":41.55,"y":651.5},{"x":41.6,"y":585},{"x":41.65,"y":517.6},{"x":41.7,"y":437.4},{"x":41.75,"y":384.9},{"x":41.8,"y":327.5},{"x":41.85,"y":293.9},{"x":41.9,"y":269.2},{"x":41.95,"y":245},{"x":42,"y":236.1},{"x":42.05,"y":223.3},{"x":42.1,"y":203.5},{"x":42.15,"y":209.5},{"x":42.2,"y":212.4},{"x":42.25,"y":208.5},{"x":42.3,"y":203.5},{"x":42.35,"y":202.5},{"x":42.4,"y":206.5},{"x":42.45,"y":204.5},{"x":42.5,"y":203.5},{"x":42.55,"y":204.5},{"x":42.6,"y":199.6},{"x":42.65,"y":203.5},{"x":42.7,"y":205.5},{"x":42.75,"y":205.5},{"x":42.8,"y":210.4},{"x":42.85,"y":199.6},{"x":42.9,"y":198.6},{"x":42.95,"y":196.6},{"x":43,"y":195.6},{"x":43.05,"y":194.7},{"x":43.1,"y":201.6},{"x":43.15,"y":199.6},{"x":43.2,"y":196.6},{"x":43.25,"y":203.5},{"x":43.3,"y":196.6},{"x":43.35,"y":197.6},{"x":43.4,"y":200.6},{"x":43.45,"y":200.6},{"x":43.5,"y":194.7},{"x":43.55,"y":188.7},{"x":43.6,"y":193.7},{"x":43.65,"y":198.6},{"x":43.7,"y":199.6},{"x":43.75,"y":204.5},{"x":43.8,"y":201.6},{"x":43.85,"y":199.6},{"x":43.9,"y":204.5},{"x":43.95,"y":198.6},{"x":44,"y":197.6},{"x":44.05,"y":196.6},{"x":44.1,"y":199.6},{"x":44.15,"y":195.6},{"x":44.2,"y":195.6},{"x":44.25,"y":201.6},{"x":44.3,"y":191.7},{"x":44.35,"y":192.7},{"x":44.4,"y":197.6},{"x":44.45,"y":203.5},{"x":44.5,"y":203.5},{"x":44.55,"y":202.5},{"x":44.6,"y":198.6},{"x":44.65,"y":203.5},{"x":44.7,"y":193.7},{"x":44.75,"y":198.6},{"x":44.8,"y":200.6},{"x":44.85,"y":195.6},{"x":44.9,"y":199.6},{"x":44.95,"y":196.6},{"x":45,"y":198.6}],
             "xy_upper":[{"x":40,"y":640.2},{"x":40.05,"y":750.1},{"x":40.1,"y":862.9},{"x":40.15,"y":988.8},{"x":40.2,"y":1089.4},{"x":40.25,"y":1174.9},{"x":40.3,"y":1236.3},{"x":40.35,"y":1241.3},{"x":40.4,"y":1201.1},{"x":40.45,"y":1109.5},{"x":40.5,"y":976.7},{"x":40.55,"y":844.8},{"x":40.6,"y":718.9},{"x":40.65,"y":596.9},{"x":40.7,"y":521.2},{"x":40.75,"y":444.5},{"x":40.8,"y":399.1},{"x":40.85,"y":392},{"x":40.9,"y":377.9},{"x":40.95,"y":399.1},{"x":41,"y":427.4},{"x":41.05,"y":456.6},{"x":41.1,"y":499},{"x":41.15,"y":576.7},{"x":41.2,"y":636.2},{"x":41.25,"y":697.7},{"x":41.3,"y":746.1},{"x":41.35,"y":791.4},{"x":41.4,"y":793.4},{"x":41.45,"y":756.1},{"x":41.5,"y":732},{"x":41.55,"y":672.5},{"x":41.6,"y":605},{"x":41.65,"y":536.4},{"x":41.7,"y":454.6},{"x":41.75,"y":401.1},{"x":41.8,"y":342.5},{"x":41.85,"y":308.1},{"x":41.9,"y":282.8},{"x":41.95,"y":257},{"x":42,"y":247.9},{"x":42.05,"y":234.7},{"x":42.1,"y":214.5},{"x":42.15,"y":220.5},{"x":42.2,"y":223.6},{"x":42.25,"y":219.5},{"x":42.3,"y":214.5},{"x":42.35,"y":213.5},{"x":42.4,"y":217.5},{"x":42.45,"y":215.5},{"x":42.5,"y":214.5},{"x":42.55,"y":215.5},{"x":42.6,"y":210.4},{"x":42.65,"y":214.5},{"x":42.7,"y":216.5},{"x":42.75,"y":216.5},{"x":42.8,"y":221.6},{"x":42.85,"y":210.4},{"x":42.9,"y":209.4},{"x":42.95,"y":207.4},{"x":43,"y":206.4},{"x":43.05,"y":205.3},{"x":43.1,"y":212.4},{"x":43.15,"y":210.4},{"x":43.2,"y":207.4},{"x":43.25,"y":214.5},{"x":43.3,"y":207.4},{"x":43.35,"y":208.4},{"x":43.4,"y":211.4},{"x":43.45,"y":211.4},{"x":43.5,"y":205.3},{"x":43.55,"y":199.3},{"x":43.6,"y":204.3},{"x":43.65,"y":209.4},{"x":43.7,"y":210.4},{"x":43.75,"y":215.5},{"x":43.8,"y":212.4},{"x":43.85,"y":210.4},{"x":43.9,"y":215.5},{"x":43.95,"y":209.4},{"x":44,"y":208.4},{"x":44.05,"y":207.4},{"x":44.1,"y":210.4},{"x":44.15,"y":206.4},{"x":44.2,"y":206.4},{"x":44.25,"y":212.4},{"x":44.3,"y":202.3},{"x":44.35,"y":203.3},{"x":44.4,"y":208.4},{"x":44.45,"y":214.5},{"x":44.5,"y":214.5},{"x":44.55,"y":213.5},{"x":44.6,"y":209.4},{"x":44.65,"y":214.5},{"x":44.7,"y":204.3},{"x":44.75,"y":209.4},{"x":44.8,"y":211.4},{"x":44.85,"y":206.4},{"x":44.9,"y":210.4},{"x":44.95,"y":207.4},{"x":45,"y":209.4}]}
     }
+    get qtchartsExperimentMeasuredDataObj() {
+        return this.qtchartsMeasuredDataObj
+    }
     get qtchartsCalculatedDataObj() {
         return {
             "xy":[{"x":40,"y":287.8},{"x":40.05,"y":343.9},{"x":40.1,"y":422.9},{"x":40.15,"y":526.3},{"x":40.2,"y":651.3},{"x":40.25,"y":789.8},{"x":40.3,"y":928.2},{"x":40.35,"y":1049.4},{"x":40.4,"y":1136.1},{"x":40.45,"y":1174.8},{"x":40.5,"y":1159},{"x":40.55,"y":1091.5},{"x":40.6,"y":983},{"x":40.65,"y":849.7},{"x":40.7,"y":709.4},{"x":40.75,"y":577.3},{"x":40.8,"y":464.1},{"x":40.85,"y":378.4},{"x":40.9,"y":316.8},{"x":40.95,"y":279.1},{"x":41,"y":263.5},{"x":41.05,"y":266.2},{"x":41.1,"y":286},{"x":41.15,"y":317.4},{"x":41.2,"y":370.2},{"x":41.25,"y":433.5},{"x":41.3,"y":503},{"x":41.35,"y":572.4},{"x":41.4,"y":633.4},{"x":41.45,"y":678},{"x":41.5,"y":699.8},{"x":41.55,"y":695.6},{"x":41.6,"y":666.4},{"x":41.65,"y":616.8},{"x":41.7,"y":553.8},{"x":41.75,"y":485.4},{"x":41.8,"y":418.8},{"x":41.85,"y":359.6},{"x":41.9,"y":310.7},{"x":41.95,"y":273.1},{"x":42,"y":245.9},{"x":42.05,"y":227.4},{"x":42.1,"y":215.6},{"x":42.15,"y":205.8},{"x":42.2,"y":203.2},{"x":42.25,"y":201.8},{"x":42.3,"y":201.3},{"x":42.35,"y":200.9},{"x":42.4,"y":201.5},{"x":42.45,"y":202.3},{"x":42.5,"y":203.5},{"x":42.55,"y":204.9},{"x":42.6,"y":206.6},{"x":42.65,"y":208.2},{"x":42.7,"y":209.8},{"x":42.75,"y":210.9},{"x":42.8,"y":211.5},{"x":42.85,"y":211.4},{"x":42.9,"y":210.7},{"x":42.95,"y":209.5},{"x":43,"y":207.9},{"x":43.05,"y":206.2},{"x":43.1,"y":204.6},{"x":43.15,"y":203.2},{"x":43.2,"y":202.1},{"x":43.25,"y":201.3},{"x":43.3,"y":200.8},{"x":43.35,"y":200.4},{"x":43.4,"y":200.2},{"x":43.45,"y":200.1},{"x":43.5,"y":200},{"x":43.55,"y":200},{"x":43.6,"y":200},{"x":43.65,"y":200},{"x":43.7,"y":200},{"x":43.75,"y":200},{"x":43.8,"y":200},{"x":43.85,"y":200},{"x":43.9,"y":200},{"x":43.95,"y":200},{"x":44,"y":200},{"x":44.05,"y":200},{"x":44.1,"y":200},{"x":44.15,"y":200},{"x":44.2,"y":200},{"x":44.25,"y":200},{"x":44.3,"y":200},{"x":44.35,"y":200},{"x":44.4,"y":200},{"x":44.45,"y":200},{"x":44.5,"y":200},{"x":44.55,"y":200},{"x":44.6,"y":200},{"x":44.65,"y":200},{"x":44.7,"y":200},{"x":44.75,"y":200},{"x":44.8,"y":200},{"x":44.85,"y":200},{"x":44.9,"y":200},{"x":44.95,"y":200},{"x":45,"y":200}]}
@@ -98,10 +104,13 @@ class Plotting1d {
     verticalLine(size, color) {
         return
     }
+    setPixelCount(chart, pixelCount) {}
+    setVisibleRange(chart, minX, maxX) {}
+    resetVisibleRange(chart) {}
 }
 
 class BackgroundProxy {
-    get asXml() { return "<root><item><x>10</x><y>183</y></item><item><x>15</x><y>189.36</y></item><item><x>20</x><y>210.12</y></item></root>" }
+    get asModel() { return [] }
 
     addPoint() {}
     removePoint() {}
@@ -131,20 +140,25 @@ class PyQmlProxy {
     get projectExamplesAsXml() { return "<item><name>PbSO4</name><path>../Resources/Examples/PbSO4/project.json</path></item></root>" }
 
     get phasesAsObj() { return [{"@class":"Crystal","@id":"42320499081838829392419989539816155262","@module":"easyCore.Elements.HigherLevel.Crystal","@version":"0.0.1","atoms":{"@class":"Atoms","@id":"136201934986814971809019895761751767947","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","data":[{"@class":"Site","@id":"267703642476508841055744089511086426793","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"52622469657844922014787143086722223574","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"90246489117350657135401608142192911938","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"143607157348918315100058166190900799669","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"128191497324655421295973483650864398721","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"28853078210649279133189683032308272570","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0},"fract_y":{"@class":"Parameter","@id":"141777612294419145197208375818284633947","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0},"fract_z":{"@class":"Parameter","@id":"268696468266720809968992131516905233639","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0},"label":{"@class":"Descriptor","@id":"31538670440731411252753970542117390918","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"Co1"},"occupancy":{"@class":"Parameter","@id":"209431791340061920621645925559051201823","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"164694464702879996817573855279078517484","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"Co"}},{"@class":"Site","@id":"137513826582352662977067658264683764165","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"168261495335938808979945793830510080695","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"192974286058393662063776445512343784827","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"307889941819773472372663647917917309550","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"119805347002513656543733978040496663586","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"325149674024670596582878568549791477132","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.279},"fract_y":{"@class":"Parameter","@id":"312471434160030757573140672742069635580","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.25},"fract_z":{"@class":"Parameter","@id":"154827730751900448162081930473953829343","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.985},"label":{"@class":"Descriptor","@id":"250790175220339148369639941001366346246","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"Co2"},"occupancy":{"@class":"Parameter","@id":"111330147846836402921022646950427514988","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"336669302119699385696903794865640506051","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"Co"}},{"@class":"Site","@id":"287981627805717342745025381857129955525","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"312544274223601679794119733112283075958","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"96282519507653006208716049093310879513","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"159164221730905404632418758287563324810","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"339383699651201087154536544825814220830","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"39617895068920593924303310761174066889","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.094},"fract_y":{"@class":"Parameter","@id":"334427154121023803184507377276399409222","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.25},"fract_z":{"@class":"Parameter","@id":"242599593051302036810644450380932873342","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.429},"label":{"@class":"Descriptor","@id":"267034973090720337022399758261630743246","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"Si"},"occupancy":{"@class":"Parameter","@id":"173061202640485326858390670682331989371","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"51627627025976241001124646446736522469","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"Si"}},{"@class":"Site","@id":"61939474463762048668755203724410154980","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"259377329578428808554923090350735420165","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"211996494116178977094498097114184617983","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"326375416544104898297221189416222753175","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"141785543925496357257732195271021562388","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"47804291365977028119534222998582030405","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.091},"fract_y":{"@class":"Parameter","@id":"188267817749642772098150790733764399430","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.25},"fract_z":{"@class":"Parameter","@id":"43566907387178408956046108954110413034","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.771},"label":{"@class":"Descriptor","@id":"307031533217387980825487763024266123764","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"O1"},"occupancy":{"@class":"Parameter","@id":"111658462809621604932470288337216234939","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"94963670988425835763707209085316966245","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"O"}},{"@class":"Site","@id":"324440398993380591797824346020745526560","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"59677414317928905359970569791594473182","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"197780385862934449309418720578014649748","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"96665369590236085175333096210855802521","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"58039908065361642899688695815225329674","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"309651716966960700099038264595216086670","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.448},"fract_y":{"@class":"Parameter","@id":"69261988044628523994922443527071060004","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.25},"fract_z":{"@class":"Parameter","@id":"17607971256836676004631369645563224250","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.217},"label":{"@class":"Descriptor","@id":"30593589331056768679652418549226585781","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"O2"},"occupancy":{"@class":"Parameter","@id":"283697600452092905857322038014692330830","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"52036484276873593948331693971882161929","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"O"}},{"@class":"Site","@id":"40943484346442087554483289679314045009","@module":"easyCore.Elements.Basic.Site","@version":"0.0.1","adp":{"@class":"AtomicDisplacement","@id":"91018317217938621661719130697410737303","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","adp_class":{"@class":"Isotropic","@id":"302858806170020522423729292662904653734","@module":"easyCore.Elements.Basic.AtomicDisplacement","@version":"0.0.1","Uiso":{"@class":"Parameter","@id":"318621622168524324226370615166724966858","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The standard anisotropic atomic displacement components in angstroms squared which appear in the structure-factor term.","error":"","fixed":true,"max":null,"min":0,"name":"Uiso","units":"angstrom ** 2","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_U_iso_or_equiv.html","value":0}},"adp_type":{"@class":"Descriptor","@id":"272753236285208316945504934005184038458","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A standard code used to describe the type of atomic displacement parameters used for the site.","display_name":"adp_type","enabled":true,"name":"adp_type","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_adp_type.html","value":"Uiso"}},"fract_x":{"@class":"Parameter","@id":"52264386565591557838264018430819265671","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_x","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.164},"fract_y":{"@class":"Parameter","@id":"62768535347933825358074507378040230236","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_y","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.032},"fract_z":{"@class":"Parameter","@id":"209586051600825470523426322155718377362","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Atom-site coordinate as fractions of the unit cell length.","error":"","fixed":true,"max":null,"min":null,"name":"fract_z","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_fract_.html","value":0.28},"label":{"@class":"Descriptor","@id":"305543573000573712055958926141967956198","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A unique identifier for a particular site in the crystal","display_name":"label","enabled":true,"name":"label","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_label.html","value":"O3"},"occupancy":{"@class":"Parameter","@id":"334007121130607549323394911294786493645","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"The fraction of the atom type present at this site.","error":"","fixed":true,"max":null,"min":null,"name":"occupancy","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_occupancy.html","value":1},"specie":{"@class":"Descriptor","@id":"244533724899666014143859593816499248012","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"A code to identify the atom species occupying this site.","display_name":"specie","enabled":true,"name":"specie","units":"dimensionless","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Iatom_site_type_symbol.html","value":"O"}}],"name":"Atoms"},"cell":{"@class":"Cell","@id":"147075106300967923714269386923571038167","@module":"easyCore.Elements.Basic.Cell","@version":"0.0.1","angle_alpha":{"@class":"Parameter","@id":"163761455504885109201415084171339807254","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell angle of the selected structure in degrees.","error":"","fixed":true,"max":null,"min":0,"name":"angle_alpha","units":"degree","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_angle_.html","value":90},"angle_beta":{"@class":"Parameter","@id":"259569602656576887090120366881756621712","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell angle of the selected structure in degrees.","error":"","fixed":true,"max":null,"min":0,"name":"angle_beta","units":"degree","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_angle_.html","value":90},"angle_gamma":{"@class":"Parameter","@id":"92792204022917338811573472872301595514","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell angle of the selected structure in degrees.","error":"","fixed":true,"max":null,"min":0,"name":"angle_gamma","units":"degree","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_angle_.html","value":90},"length_a":{"@class":"Parameter","@id":"308592112977185350336835101214060570282","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell length of the selected structure in angstroms.","error":"","fixed":false,"max":null,"min":0,"name":"length_a","units":"angstrom","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_length_.html","value":10.28},"length_b":{"@class":"Parameter","@id":"109026685865189841549714398816263901583","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell length of the selected structure in angstroms.","error":"","fixed":false,"max":null,"min":0,"name":"length_b","units":"angstrom","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_length_.html","value":6.03},"length_c":{"@class":"Parameter","@id":"42610328425889901763403847801954301104","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"Unit-cell length of the selected structure in angstroms.","error":"","fixed":false,"max":null,"min":0,"name":"length_c","units":"angstrom","url":"https://www.iucr.org/__data/iucr/cifdic_html/1/cif_core.dic/Icell_length_.html","value":4.75}},"name":"Co2SiO4","spacegroup":{"@class":"SpaceGroup","@id":"307814036781427394045363000871867219549","@module":"easyCore.Elements.Basic.SpaceGroup","@version":"0.0.1","_space_group_HM_name":{"@class":"Descriptor","@id":"214213665652328171461375714326059514552","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"","display_name":"_space_group_HM_name","enabled":true,"name":"_space_group_HM_name","units":"dimensionless","url":"","value":"P n m a"}}}] }
-    get phasesAsXml() { return "<root><item><label>Co2SiO4</label><color>darkolivegreen</color><crystal_system>orthorhombic</crystal_system><space_group_name>P n m a</space_group_name><space_group_setting>abc</space_group_setting><cell_length_a>10.28</cell_length_a><cell_length_b>10.28</cell_length_b><cell_length_c>10.28</cell_length_c><cell_angle_alpha>90.0</cell_angle_alpha><cell_angle_beta>90.0</cell_angle_beta><cell_angle_gamma>90.0</cell_angle_gamma><atoms><item><label>Co1</label><type>Co</type><color>coral</color><x>0.0</x><y>0.0</y><z>0.0</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.004</adp_iso></item><item><label>Co2</label><type>Co</type><color>coral</color><x>0.279</x><y>0.279</y><z>0.279</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.007</adp_iso></item><item><label>Si</label><type>Si</type><color>steelblue</color><x>0.094</x><y>0.094</y><z>0.094</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.005</adp_iso></item><item><label>O1</label><type>O</type><color>darkolivegreen</color><x>0.091</x><y>0.091</y><z>0.091</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.008</adp_iso></item><item><label>O2</label><type>O</type><color>darkolivegreen</color><x>0.448</x><y>0.448</y><z>0.448</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.008</adp_iso></item><item><label>O3</label><type>O</type><color>darkolivegreen</color><x>0.164</x><y>0.164</y><z>0.164</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.011</adp_iso></item></atoms></item><item><label>CoO</label><color>steelblue</color><crystal_system>cubic</crystal_system><space_group_name>F m -3 m</space_group_name><space_group_setting>1</space_group_setting><cell_length_a>3.02</cell_length_a><cell_length_b>3.02</cell_length_b><cell_length_c>3.02</cell_length_c><cell_angle_alpha>90.0</cell_angle_alpha><cell_angle_beta>90.0</cell_angle_beta><cell_angle_gamma>90.0</cell_angle_gamma><atoms><item><label>Co</label><type>Co</type><color>coral</color><x>0.0</x><y>0.0</y><z>0.0</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.0</adp_iso></item><item><label>O</label><type>O</type><color>darkolivegreen</color><x>0.2471</x><y>0.4986</y><z>0.7497</z><occupancy>1.0</occupancy><adp_type>Uiso</adp_type><adp_iso>0.0</adp_iso></item></atoms></item></root>" }
+    get phasesModel() { return [] }
+    get currentPhaseModel() { return [] }
+    get currentPhaseAtomsModel() { return [] }
     get phasesAsCif() { return "" }
     get phasesAsExtendedCif() { return "data_PbSO4\n\n_cell_length_a   8.48\n_cell_length_b   5.398\n_cell_length_c   6.958\n_cell_angle_alpha   90.0\n_cell_angle_beta   90.0\n_cell_angle_gamma   90.0\n_space_group_name_H-M_alt   'P n m a'\n\nloop_\n _atom_site_label\n _atom_site_type_symbol\n _atom_site_occupancy\n _atom_site_fract_x\n _atom_site_fract_y\n _atom_site_fract_z\n _atom_site_adp_type\n _atom_site_U_iso_or_equiv\n  Pb  Pb  1.0  0.1882  0.25  0.167  Uiso  0.01\n  S  S  1.0  0.063  0.25  0.686  Uiso  0.01\n  O1  O  1.0  -0.095  0.25  0.6  Uiso  0.01\n  O2  O  1.0  0.181  0.25  0.543  Uiso  0.01\n  O3  O  1.0  0.085  0.026  0.806  Uiso  0.01\n\nloop_\n _symmetry_equiv_pos_as_xyz\n x, y, z\n -x+1/2, -y, z+1/2\n x+1/2, -y+1/2, -z+1/2\n -x, y+1/2, -z\n -x, -y, -z\n x-1/2, y, -z-1/2\n -x-1/2, y-1/2, z-1/2\n x, -y-1/2, z\n" }
 
     get simulationParametersAsObj() { return {"x_min":0.0,"x_max":180.0,"x_step":0.1} }
     get patternParametersAsObj() { return {"@class":"Pattern1D","@id":"235306787479125642831052951811720128629","@module":"easyDiffractionLib.Elements.Experiments.Pattern","@version":"0.0.1","backgrounds":{"@class":"BackgroundContainer","@id":"139473442961863835657737519744271292581","@module":"easyDiffractionLib.Elements.Backgrounds.Background","@version":"0.0.1","data":[{"@class":"PointBackground","@id":"16987436134835037543583378081580455245","@module":"easyDiffractionLib.Elements.Backgrounds.Point","@version":"0.0.1","data":[{"@class":"BackgroundPoint","@id":"48120881597964880327487710994758951847","@module":"easyDiffractionLib.Elements.Backgrounds.Point","@version":"0.0.1","name":"0,0_deg","x":{"@class":"Descriptor","@id":"288090348448534868221730803213038029022","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"","display_name":"x","enabled":true,"name":"x","units":"dimensionless","url":"","value":0},"y":{"@class":"Parameter","@id":"137037127745954677857293726260361766007","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"intensity","units":"dimensionless","value":200}},{"@class":"BackgroundPoint","@id":"19712983927671480265632707115800277823","@module":"easyDiffractionLib.Elements.Backgrounds.Point","@version":"0.0.1","name":"140,0_deg","x":{"@class":"Descriptor","@id":"190452147068224568495345721159542846071","@module":"easyCore.Objects.Base","@version":"0.0.1","description":"","display_name":"x","enabled":true,"name":"x","units":"dimensionless","url":"","value":140},"y":{"@class":"Parameter","@id":"9848774947907778112153717389371819117","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"intensity","units":"dimensionless","value":200}}],"linked_experiment":"NEED_TO_CHANGE"}]},"scale":{"@class":"Parameter","@id":"257586745724955043863419443187177591221","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"scale","units":"dimensionless","value":1},"zero_shift":{"@class":"Parameter","@id":"18356802038126633443019469022087609013","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"zero_shift","units":"degree","value":0}} }
     get instrumentParametersAsObj() { return {"@class":"Pars1D","@id":"231637247225317532808673822399324226265","@module":"easyDiffractionLib.Elements.Experiments.Experiment","@version":"0.0.1","resolution_u":{"@class":"Parameter","@id":"216416169571596710924454185657227957884","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"resolution_u","units":"dimensionless","value":0.14},"resolution_v":{"@class":"Parameter","@id":"229518756686753763681436602723598562742","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"resolution_v","units":"dimensionless","value":-0.42},"resolution_w":{"@class":"Parameter","@id":"145771429849507483099716492453028221196","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"resolution_w","units":"dimensionless","value":0.38},"resolution_x":{"@class":"Parameter","@id":"306405939773089505104389768906946166134","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"resolution_x","units":"dimensionless","value":0},"resolution_y":{"@class":"Parameter","@id":"269181530393529631791687470824092236788","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"resolution_y","units":"dimensionless","value":0},"wavelength":{"@class":"Parameter","@id":"254770323993335101529924844209104083188","@module":"easyCore.Objects.Base","@version":"0.0.1","enabled":true,"error":"","fixed":true,"max":null,"min":null,"name":"wavelength","units":"angstrom","value":1.912}} }
-    get instrumentParametersAsXml() { return '<root><item><key name="@module">easyDiffractionLib.Elements.Experiments.Instrument</key><key name="@class">Pars1D</key><key name="@version">0.0.1</key><u_resolution><key name="@module">easyCore.Objects.Base</key><key name="@class">Parameter</key><key name="@version">0.0.1</key><name>u_resolution</name><value>0.4</value><error>0.0</error><min>-inf</min><max>inf</max><fixed>True</fixed><units>dimensionless</units><key name="@id">312322313537709477997004899613590636884</key><enabled>True</enabled></u_resolution><v_resolution><key name="@module">easyCore.Objects.Base</key><key name="@class">Parameter</key><key name="@version">0.0.1</key><name>v_resolution</name><value>-0.5</value><error>0.0</error><min>-inf</min><max>inf</max><fixed>True</fixed><units>dimensionless</units><key name="@id">220595112252802717438017278456713837342</key><enabled>True</enabled></v_resolution><w_resolution><key name="@module">easyCore.Objects.Base</key><key name="@class">Parameter</key><key name="@version">0.0.1</key><name>w_resolution</name><value>0.9</value><error>0.0</error><min>-inf</min><max>inf</max><fixed>True</fixed><units>dimensionless</units><key name="@id">309956937743928332407241175311265873557</key><enabled>True</enabled></w_resolution><x_resolution><key name="@module">easyCore.Objects.Base</key><key name="@class">Parameter</key><key name="@version">0.0.1</key><name>x_resolution</name><value>0.0</value><error>0.0</error><min>-inf</min><max>inf</max><fixed>True</fixed><units>dimensionless</units><key name="@id">234578176552449284759584024822421612517</key><enabled>True</enabled></x_resolution><wavelength><key name="@module">easyCore.Objects.Base</key><key name="@class">Parameter</key><key name="@version">0.0.1</key><name>wavelength</name><value>1.54056</value><error>0.0</error><min>-inf</min><max>inf</max><fixed>True</fixed><units>angstrom</units><key name="@id">169780687797892758527734945250252699192</key><enabled>True</enabled></wavelength><interface></interface><key name="@id">227239201627625589021374889924472937495</key></item></root>' }
+    get instrumentParametersModel() { return [] }
 
     get experimentDataAsObj() { return [{"name": "D1A@ILL"}]}
-    get experimentDataAsXml() { return '<root><item type="dict"><name type="str">D1A@ILL</name></item></root>'}
+    get fitRegionsAsObj() { return {"fit_range": null, "excluded_regions": [], "weight_policy": "sqrt", "sigma_floor": 1.0} }
+    get weightPolicies() { return ['sqrt', 'floor', 'mask'] }
+    get weightPolicy() { return 'sqrt' }
+    get experimentDataModel() { return [] }
 
     get parametersAsObj() { return [{"error":"","fit":0,"id":"76125422371550751838932952523205268042","label":"Phases.PbSO4.lattice.length_a","number":1,"unit":"Å","value":8.48},{"error":"","fit":0,"id":"90454834307343824540949403622222880474","label":"Phases.PbSO4.lattice.length_b","number":2,"unit":"Å","value":5.398},{"error":"","fit":0,"id":"74362655779732760789420329798872964427","label":"Phases.PbSO4.lattice.length_c","number":3,"unit":"Å","value":6.958},{"error":"","fit":0,"id":"22048046294443526769144050778451069238","label":"Phases.PbSO4.atoms.Pb.occupancy","number":7,"unit":"","value":1},{"error":"","fit":0,"id":"302456405621173502066952664792028795104","label":"Phases.PbSO4.atoms.Pb.fract_x","number":8,"unit":"","value":0.1882},{"error":"","fit":0,"id":"330991203340213151017226400228696812054","label":"Phases.PbSO4.atoms.Pb.fract_y","number":9,"unit":"","value":0.25},{"error":"","fit":0,"id":"327281342816078551359690310631531109766","label":"Phases.PbSO4.atoms.Pb.fract_z","number":10,"unit":"","value":0.167},{"error":"","fit":0,"id":"175020970618545896340107154594843746056","label":"Phases.PbSO4.atoms.Pb.adp.Uiso.Uiso","number":11,"unit":"Å²","value":0.01},{"error":"","fit":0,"id":"75905111031158516367102784904754973498","label":"Phases.PbSO4.atoms.S.occupancy","number":12,"unit":"","value":1},{"error":"","fit":0,"id":"264487383941998696741148014352498401215","label":"Phases.PbSO4.atoms.S.fract_x","number":13,"unit":"","value":0.063},{"error":"","fit":0,"id":"81490918821424872052289524783555721463","label":"Phases.PbSO4.atoms.S.fract_y","number":14,"unit":"","value":0.25},{"error":"","fit":0,"id":"93657672090607471289702541973298167786","label":"Phases.PbSO4.atoms.S.fract_z","number":15,"unit":"","value":0.686},{"error":"","fit":0,"id":"328544279289427037535404774781218670372","label":"Phases.PbSO4.atoms.S.adp.Uiso.Uiso","number":16,"unit":"Å²","value":0.01},{"error":"","fit":0,"id":"77230137650127717145020391912777986173","label":"Phases.PbSO4.atoms.O1.occupancy","number":17,"unit":"","value":1},{"error":"","fit":0,"id":"86297985122926341277421520528729147373","label":"Phases.PbSO4.atoms.O1.fract_x","number":18,"unit":"","value":-0.095},{"error":"","fit":0,"id":"71897764798856053858628374805663346348","label":"Phases.PbSO4.atoms.O1.fract_y","number":19,"unit":"","value":0.25},{"error":"","fit":0,"id":"153503480934511583529674576977906966864","label":"Phases.PbSO4.atoms.O1.fract_z","number":20,"unit":"","value":0.6},{"error":"","fit":0,"id":"105883301669403584818251252456772918537","label":"Phases.PbSO4.atoms.O1.adp.Uiso.Uiso","number":21,"unit":"Å²","value":0.01},{"error":"","fit":0,"id":"81879417235741161301344628203762837454","label":"Phases.PbSO4.atoms.O2.occupancy","number":22,"unit":"","value":1},{"error":"","fit":0,"id":"20733192488382760121081742050748973192","label":"Phases.PbSO4.atoms.O2.fract_x","number":23,"unit":"","value":0.181},{"error":"","fit":0,"id":"266839609771373147997918927961660891954","label":"Phases.PbSO4.atoms.O2.fract_y","number":24,"unit":"","value":0.25},{"error":"","fit":0,"id":"136026766876835012842696967351576505712","label":"Phases.PbSO4.atoms.O2.fract_z","number":25,"unit":"","value":0.543},{"error":"","fit":0,"id":"82897099668680227377317380100881436306","label":"Phases.PbSO4.atoms.O2.adp.Uiso.Uiso","number":26,"unit":"Å²","value":0.01},{"error":"","fit":0,"id":"52530023128513215507266262487840347468","label":"Phases.PbSO4.atoms.O3.occupancy","number":27,"unit":"","value":1},{"error":"","fit":0,"id":"74312938057090450104769605875220909099","label":"Phases.PbSO4.atoms.O3.fract_x","number":28,"unit":"","value":0.085},{"error":"","fit":0,"id":"291584460619972836241577751733987630310","label":"Phases.PbSO4.atoms.O3.fract_y","number":29,"unit":"","value":0.026},{"error":"","fit":0,"id":"184177024747355046670360930948108748181","label":"Phases.PbSO4.atoms.O3.fract_z","number":30,"unit":"","value":0.806},{"error":"","fit":0,"id":"6331965894977405482409668240777466316","label":"Phases.PbSO4.atoms.O3.adp.Uiso.Uiso","number":31,"unit":"Å²","value":0.01},{"error":"","fit":0,"id":"317492978838357827842679407824875212658","label":"Instrument.wavelength","number":32,"unit":"Å","value":1.912},{"error":"","fit":0,"id":"156100446680199011739510994527479435124","label":"Instrument.resolution_u","number":33,"unit":"","value":0.14},{"error":"","fit":0,"id":"201269552242503067654825819258839357671","label":"Instrument.resolution_v","number":34,"unit":"","value":-0.42},{"error":"","fit":0,"id":"157141303929062304930649271479149784624","label":"Instrument.resolution_w","number":35,"unit":"","value":0.38},{"error":"","fit":0,"id":"7867774072403175019651862535650800906","label":"Instrument.resolution_x","number":36,"unit":"","value":0},{"error":"","fit":0,"id":"78469350370270266786097294103217831189","label":"Instrument.resolution_y","number":37,"unit":"","value":0},{"error":"","fit":0,"id":"339775777492351171466584335452985747636","label":"Instrument.zero_shift","number":38,"unit":"deg","value":0},{"error":"","fit":0,"id":"64139544655561094139940188836925273480","label":"Instrument.scale","number":39,"unit":"","value":1},{"error":"","fit":0,"id":"186286817442791463165010935914942053716","label":"Instrument.background.point_background.0,0_deg.intensity","number":40,"unit":"","value":200},{"error":"","fit":0,"id":"234267982023401942486718085477695204923","label":"Instrument.background.point_background.140,0_deg.intensity","number":41,"unit":"","value":200}] }
-    get parametersAsXml() { return "<root><item><id>158360137990540488038891173676122385073</id><number>1</number><label>Phases.Dichlorine.cell.length_a</label><value>8.56</value><unit>Å</unit><error>0.0</error><fit>0</fit></item><item><id>283216083413242490636533173050739405208</id><number>3</number><label>Phases.Dichlorine.cell.length_c</label><value>6.12</value><unit>Å</unit><error>0.0</error><fit>0</fit></item><item><id>337471415220984686916952831002040420740</id><number>7</number><label>Phases.Dichlorine.atoms.Cl1.occupancy</label><value>1.0</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>146409450034596321910624052910896844832</id><number>8</number><label>Phases.Dichlorine.atoms.Cl1.fract_x</label><value>0.125</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>47533500537766397962048891338832096294</id><number>9</number><label>Phases.Dichlorine.atoms.Cl1.fract_y</label><value>0.167</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>149777602679563407975140340330854068565</id><number>10</number><label>Phases.Dichlorine.atoms.Cl1.fract_z</label><value>0.107</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>6083892595458615760556868500726856296</id><number>11</number><label>Phases.Dichlorine.atoms.Cl1.adp.Uiso.Uiso</label><value>0.0</value><unit>Å²</unit><error>0.0</error><fit>0</fit></item><item><id>36404488086395798041587546603097174542</id><number>12</number><label>Instrument.u_resolution</label><value>0.4</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>273642904209567193195209812492926745675</id><number>13</number><label>Instrument.v_resolution</label><value>-0.5</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>285131512434517312505245772373508445823</id><number>14</number><label>Instrument.w_resolution</label><value>0.9</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>12863474859136840551926993865779295321</id><number>15</number><label>Instrument.x_resolution</label><value>0.0</value><unit></unit><error>0.0</error><fit>0</fit></item><item><id>308805485907805970173258212776667043199</id><number>16</number><label>Instrument.wavelength</label><value>1.54056</value><unit>Å</unit><error>0.0</error><fit>0</fit></item></root>" }
+    get parametersModel() { return [] }
 
     get currentPhaseIndex() { return -1 }
     get currentSpaceGroup() { return -1 }
@@ -157,8 +171,16 @@ class PyQmlProxy {
     get backgroundProxy() { return new BackgroundProxy() }
 
     get fitResults() { return {'redchi2': 1.31} }
+    get fitProgress() { return {'evaluations': 0, 'chi2': null, 'redchi2': null, 'elapsed': 0.0} }
+    get fitModes() { return ['thread', 'process'] }
+    get fitMode() { return 'thread' }
 
     get statusModelAsObj() { return {'minimization': 'lmfit'} }
+    get profilingEnabled() { return false }
+    get profilingStatsAsObj() { return [] }
+    get signalTracingEnabled() { return false }
+    get signalTraceActionsAsObj() { return [] }
+    get updateCountersAsObj() { return {"requested":0,"executed":0,"suppressed":0,"kinds":{}} }
     get statusModelAsXml() { return "<root><item><label>Calculator</label><value>calculator1</value></item><item><label>Minimizer</label><value>minimizer1</value></item></root>" }
 
     createProject() {}
@@ -86,6 +86,32 @@ EaComponents.SideBarColumn {
 
     }
 
+    EaElements.GroupBox {
+        title: qsTr("Fitting")
+        enabled: ExGlobals.Constants.proxy.experimentLoaded
+
+        EaElements.CheckBox {
+            topPadding: 0
+            enabled: ExGlobals.Constants.proxy.isFitFinished
+            text: qsTr("Run in a separate process")
+            checked: ExGlobals.Constants.proxy.fitMode === 'process'
+            onCheckedChanged: ExGlobals.Constants.proxy.fitMode = checked ? 'process' : 'thread'
+        }
+    }
+
+    EaElements.GroupBox {
+        title: qsTr("Plot settings")
+
+        // QtCharts series are decimated unless checked
+        EaElements.CheckBox {
+            topPadding: 0
+            enabled: ExGlobals.Constants.proxy.plotting1d.currentLib === 'qtcharts'
+            text: qsTr("Full resolution")
+            checked: ExGlobals.Constants.proxy.plotting1d.fullResolution
+            onCheckedChanged: ExGlobals.Constants.proxy.plotting1d.fullResolution = checked
+        }
+    }
+
     /*
     EaElements.GroupBox {
         title: qsTr("Plot settings")
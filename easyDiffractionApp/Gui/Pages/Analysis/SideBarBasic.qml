@@ -182,13 +182,15 @@ EaComponents.SideBarColumn {
         // Start fitting button
         EaElements.SideBarButton {
             wide: true
-            // temporarily disabled
-            // enabled: ExGlobals.Constants.proxy.experimentLoaded
-            enabled: ExGlobals.Constants.proxy.experimentLoaded && ExGlobals.Constants.proxy.isFitFinished
+            enabled: ExGlobals.Constants.proxy.experimentLoaded
             fontIcon: ExGlobals.Constants.proxy.isFitFinished ? "play-circle" : "stop-circle"
-            // temporarily modified
-            text: ExGlobals.Constants.proxy.isFitFinished ? qsTr("Start fitting") : qsTr("Stop fitting")
-            onClicked: ExGlobals.Constants.proxy.fit()
+            text: ExGlobals.Constants.proxy.isFitFinished ? qsTr("Start fitting") : stopFittingText(ExGlobals.Constants.proxy.fitProgress)
+            onClicked: {
+                if (ExGlobals.Constants.proxy.isFitFinished)
+                    ExGlobals.Constants.proxy.fit()
+                else
+                    ExGlobals.Constants.proxy.stopFit()
+            }
             Component.onCompleted: ExGlobals.Variables.startFittingButton = this
         }
 
@@ -203,6 +205,12 @@ EaComponents.SideBarColumn {
 
     // Logic
 
+    function stopFittingText(progress) {
+        if (progress.redchi2 === null || typeof progress.redchi2 === "undefined")
+            return qsTr("Stop fitting")
+        return qsTr("Stop fitting") + ` (${progress.evaluations}, \u03c7\u00b2 = ${progress.redchi2.toFixed(2)})`
+    }
+
     function formatFilterText(group_icon, icon, text) {
         if (icon === "")
             return `<font face="${EaStyle.Fonts.iconsFamily}">${group_icon}</font>&nbsp;&nbsp;${text}</font>`
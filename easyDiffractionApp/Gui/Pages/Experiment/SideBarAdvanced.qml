@@ -13,11 +13,24 @@ EaComponents.SideBarColumn {
     EaElements.GroupBox {
         title: qsTr("Plot settings")
 
-        EaElements.CheckBox {
-            topPadding: 0
-            text: qsTr("Show legend")
-            checked: ExGlobals.Variables.showLegend
-            onCheckedChanged: ExGlobals.Variables.showLegend = checked
+        Row {
+            spacing: EaStyle.Sizes.fontPixelSize
+
+            EaElements.CheckBox {
+                topPadding: 0
+                text: qsTr("Show legend")
+                checked: ExGlobals.Variables.showLegend
+                onCheckedChanged: ExGlobals.Variables.showLegend = checked
+            }
+
+            // QtCharts series are decimated unless checked
+            EaElements.CheckBox {
+                topPadding: 0
+                enabled: ExGlobals.Constants.proxy.plotting1d.currentLib === 'qtcharts'
+                text: qsTr("Full resolution")
+                checked: ExGlobals.Constants.proxy.plotting1d.fullResolution
+                onCheckedChanged: ExGlobals.Constants.proxy.plotting1d.fullResolution = checked
+            }
         }
     }
 
@@ -0,0 +1,179 @@
+import csv
+import glob
+import os
+import pathlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from PySide2.QtCore import QObject
+
+from easyCore import borg
+from easyCore.Utils.classTools import generatePath
+from easyDiffractionLib.interface import InterfaceFactory
+
+from easyDiffractionApp.Logic.State import StateLogic
+from easyDiffractionApp.Logic.Fitter import FitterLogic
+from easyDiffractionApp.Logic.FitWorker import FitResult, fitSample
+
+
+class BatchFitter(QObject):
+    """
+    Headless counterpart of LogicController: the model of a project is
+    loaded with StateLogic and fitted with FitterLogic against a series
+    of data files, without QML.
+
+    With `use_cache` False the data files are parsed every time and
+    nothing is written to the user cache of experimental data.
+    """
+
+    def __init__(self, parent=None, use_cache=True):
+        super().__init__(parent)
+        self._interface = InterfaceFactory()
+        self.state = StateLogic(self, interface=self._interface)
+        self.state._experiment_data_cache.enabled = use_cache
+        self.fitLogic = FitterLogic(self, self.state._sample, self._interface.fit_func)  # noqa: E501
+        self.state.currentMinimizerIndex.connect(self.fitLogic.setCurrentMinimizerIndex)  # noqa: E501
+        self.state.currentMinimizerMethodIndex.connect(self.fitLogic.currentMinimizerMethodIndex)  # noqa: E501
+
+    # Used by StateLogic when loading a project
+
+    def minimizerNames(self):
+        return self.fitLogic.fitter.available_engines
+
+    def minimizerMethodNames(self):
+        return self.fitLogic.minimizerMethodNames()
+
+    # Public
+
+    def loadProject(self, project_path):
+        self.state._loadProjectAs(project_path)
+        if not self.state._project_created:
+            raise FileNotFoundError(f'Failed to load project: {project_path}')
+        if not self.fitLogic.fitter.fit_object.get_fit_parameters():
+            raise ValueError(f'No free parameters in project: {project_path}')
+
+    def dataFiles(self, patterns):
+        files = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(os.path.expanduser(pattern)))
+            files.extend(path for path in matches if path not in files)
+        return files
+
+    def fitParameterLabels(self):
+        sample = self.fitLogic.fitter.fit_object
+        par_ids, par_paths = generatePath(sample, True)
+        labels = {}
+        for par_id, par_path in zip(par_ids, par_paths):
+            par_path = par_path.replace('Pars1D.', 'Instrument.')
+            par_path = par_path.replace('Pattern1D.', 'Instrument.')
+            labels[id(borg.map.get_item_by_key(par_id))] = par_path
+        return [labels.get(id(par), par.name) for par in sample.get_fit_parameters()]  # noqa: E501
+
+    def fitSequential(self, files):
+        """
+        Fit the files one after another in this process, each fit starting
+        from the result of the previous one. A failed fit is rolled back,
+        so the next one starts from the last successful result.
+        """
+        labels = self.fitParameterLabels()
+        results = []
+        for file_path in files:
+            self.fitLogic._takePreFitSnapshot()
+            try:
+                x, y, weights = self._loadData(file_path)
+                res = self.fitLogic.fitter.fit(x, y, weights=weights, method=self.fitLogic._current_minimizer_method_name)  # noqa: E501
+            except Exception as ex:
+                self.fitLogic._restorePreFitSnapshot()
+                results.append(self._failedRow(file_path, ex))
+                continue
+            pars = [(par.name, par.raw_value, par.error) for par, _, _ in self.fitLogic._pre_fit_snapshot]  # noqa: E501
+            self.fitLogic._pre_fit_snapshot = []
+            results.append(self._resultRow(file_path, res, labels, pars))
+            self._report(results[-1])
+        return results
+
+    def fitParallel(self, files, workers=None):
+        """
+        Fit the files independently, all from the project values, in a
+        pool of `workers` processes.
+        """
+        labels = self.fitParameterLabels()
+        sample = self.fitLogic.fitter.fit_object
+        names = [par.name for par in sample.get_fit_parameters()]
+        args = (sample.as_dict(skip=['interface']),
+                self._interface.current_interface_name,
+                self.fitLogic.fitter.current_engine.name,
+                self.fitLogic._current_minimizer_method_name)
+        results = []
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:  # noqa: E501
+            futures = []
+            for file_path in files:
+                try:
+                    x, y, weights = self._loadData(file_path)
+                except Exception as ex:
+                    futures.append(ex)
+                    continue
+                futures.append(executor.submit(fitSample, *args, x, y, weights))
+            for file_path, future in zip(files, futures):
+                try:
+                    if isinstance(future, Exception):
+                        raise future
+                    res = FitResult(future.result())
+                    if [name for name, _, _ in res.parameters] != names:
+                        raise ValueError('Fitted parameters do not match the project')  # noqa: E501
+                except Exception as ex:
+                    results.append(self._failedRow(file_path, ex))
+                    continue
+                results.append(self._resultRow(file_path, res, labels, res.parameters))  # noqa: E501
+                self._report(results[-1])
+        return results
+
+    def saveResults(self, results, output_path):
+        columns = ['dataset', 'file', 'success', 'redchi2', 'GOF', 'nvarys']
+        for label in self.fitParameterLabels():
+            columns.extend([label, f'{label} error'])
+        columns.append('message')
+        with open(output_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns, restval='')
+            writer.writeheader()
+            writer.writerows(results)
+
+    # Private
+
+    def _loadData(self, file_path):
+        """
+        Return x, y and weights of the points to fit
+        """
+        # The fit regions and weight policy of the project apply to all
+        settings = self.state._data.currentExperiment.fitSettingsAsDict()
+        data = self.state._loadExperimentData(os.path.abspath(file_path))
+        data.setFitSettingsFromDict(settings)
+        return data.fitArrays()
+
+    def _resultRow(self, file_path, res, labels, pars):
+        row = {
+            'dataset': pathlib.Path(file_path).stem,
+            'file':    file_path,
+            'success': bool(res.success),
+            'redchi2': float(res.reduced_chi),
+            'GOF':     float(res.goodness_of_fit),
+            'nvarys':  res.n_pars,
+            'message': ''
+        }
+        for label, (_, value, error) in zip(labels, pars):
+            row[label] = value
+            row[f'{label} error'] = float(error)
+        return row
+
+    def _failedRow(self, file_path, ex):
+        print(f"+ Fitting {pathlib.Path(file_path).name} failed: {ex}")
+        return {
+            'dataset': pathlib.Path(file_path).stem,
+            'file':    file_path,
+            'success': False,
+            'message': str(ex)
+        }
+
+    def _report(self, row):
+        print(f"+ Fitted {row['dataset']}: success {row['success']}, redchi2 {row['redchi2']:.4g}")  # noqa: E501
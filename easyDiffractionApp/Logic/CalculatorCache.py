@@ -0,0 +1,108 @@
+import hashlib
+from collections import OrderedDict
+
+from easyCore import np
+
+
+class CalculatorCache():
+    """
+    In-memory LRU cache of calculated patterns.
+
+    Every entry holds the calculated y values and the hkl lists of one
+    calculation, keyed on the calculator name, the values of all the
+    sample parameters and descriptors, the background points, the x grid
+    and the calculator settings passed by the caller, so that cosmetic
+    changes and undo/redo back to an already calculated state do not call
+    the calculator again. The least recently used entries are dropped
+    when the total size exceeds `max_size_bytes`.
+    """
+
+    def __init__(self, max_size_bytes=64 * 1024 * 1024):
+        self.max_size_bytes = max_size_bytes
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+
+    # Public
+
+    def key(self, calculator_name, sample, x, *extra):
+        """
+        Return the cache key of a calculation of `sample` on the grid `x`.
+        `extra` holds the calculator settings which are not parameters of
+        the sample, e.g. the index of the phase to output.
+        """
+        values = tuple(item.raw_value for item in sample._get_linkable_attributes())  # noqa: E501
+        backgrounds = tuple(CalculatorCache.backgroundKey(background) for background in sample.pattern.backgrounds)  # noqa: E501
+        return (calculator_name, values, backgrounds, CalculatorCache.gridKey(x)) + extra  # noqa: E501
+
+    def get(self, key):
+        """
+        Return the cached (y, hkl) of `key`, or None. The arrays are read
+        only.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, key, y, hkl):
+        if not self.enabled:
+            return
+        y = CalculatorCache.frozenCopy(y)
+        hkl = {name: CalculatorCache.frozenCopy(values) for name, values in hkl.items()}  # noqa: E501
+        size = y.nbytes + sum(values.nbytes for values in hkl.values())
+        if size > self.max_size_bytes:
+            return
+        if key in self._entries:
+            self._size_bytes -= self._entries.pop(key)[2]
+        self._entries[key] = (y, hkl, size)
+        self._size_bytes += size
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def stats(self):
+        return {
+            'entries': len(self._entries),
+            'size_bytes': self._size_bytes,
+            'max_size_bytes': self.max_size_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    @staticmethod
+    def backgroundKey(background):
+        # The background is passed to the calculator apart from the sample
+        # (see set_background), its points are not sample parameters
+        return type(background).__name__, tuple(background.x_sorted_points), tuple(background.y_sorted_points)  # noqa: E501
+
+    @staticmethod
+    def gridKey(x):
+        x = np.ascontiguousarray(x)
+        return x.size, x.dtype.str, hashlib.blake2b(x, digest_size=16).digest()  # noqa: E501
+
+    @staticmethod
+    def frozenCopy(values):
+        values = np.array(values)
+        values.flags.writeable = False
+        return values
+
+    # Private
+
+    def _evict(self):
+        """
+        Remove the least recently used entries until the total size of the
+        cache fits into `max_size_bytes`.
+        """
+        while self._size_bytes > self.max_size_bytes and self._entries:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
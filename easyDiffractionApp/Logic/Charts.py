@@ -1,6 +1,8 @@
 from easyDiffractionApp.Logic.Proxies.Plotting1d import Plotting1dProxy
+from easyDiffractionApp.Logic.SignalTracer import tracer
 
 
+@tracer.traceHandlers
 class ChartsLogic():
     def __init__(self, parent):
 
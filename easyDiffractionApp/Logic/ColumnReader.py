@@ -0,0 +1,212 @@
+import warnings
+
+from easyCore import np
+
+# Bytes separating columns: the ASCII whitespace bytes.split() sees, and
+# the other control characters, which no number contains anyway
+_MAX_SEPARATOR = ord(' ')
+
+# From numpy 1.23 np.loadtxt parses in C, reading the file itself, and is
+# the fastest reader. Before, it is pure Python and np.fromstring is
+_LOADTXT_IN_C = np.lib.NumpyVersion(np.__version__) >= '1.23.0'
+
+
+def readColumns(file_path, chunk_size=8 * 1024 * 1024):
+    """
+    Read a powder diffraction column file (.xye, .xys, .xy, .dat) into a
+    (3, n) float64 array of contiguous x, y and sy rows.
+
+    Text header lines before the first data line, blank lines and
+    comments (from # to the end of the line) are skipped, any mix of
+    spaces and tabs separates columns. As with np.loadtxt, every other
+    line must hold the same number of numbers (nan and inf included),
+    otherwise ValueError is raised with the line number.
+    For 2-column files the missing sigmas are derived as sqrt(y).
+
+    The data lines are parsed by np.loadtxt where it parses in C. Files
+    it rejects, and every file with older numpy, are tokenized in chunks
+    of `chunk_size` bytes, which also locates the errors.
+    """
+    values = _loadColumns(file_path) if _LOADTXT_IN_C else None
+    if values is None:
+        values = _readChunks(file_path, chunk_size)
+    num_columns = values.shape[1]
+    if num_columns < 2:
+        raise ValueError(f'At least 2 columns expected in {file_path}, found {num_columns}')  # noqa: E501
+
+    columns = values[:, :3].T
+    if num_columns == 2:
+        sy = np.sqrt(np.abs(columns[1]))
+        columns = np.vstack((columns, sy))
+    return np.ascontiguousarray(columns, dtype=np.float64)
+
+
+def _loadColumns(file_path):
+    """
+    Return the (n, k) data of the file as read by np.loadtxt past the
+    header lines, or None if there is no data or np.loadtxt fails.
+    """
+    header_lines = 0
+    with open(file_path, 'rb') as file:
+        for line in file:
+            if _isDataLine(line.split(b'#', 1)[0]):
+                break
+            header_lines += 1
+        else:
+            return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', UserWarning)
+            return np.loadtxt(file_path, dtype=np.float64, comments='#', skiprows=header_lines, ndmin=2, encoding='latin1')  # noqa: E501
+    except (ValueError, UserWarning):
+        return None
+
+
+def _readChunks(file_path, chunk_size):
+    """
+    Return the (n, k) data of the file, tokenized in chunks of
+    `chunk_size` bytes.
+    """
+    blocks = []
+    num_columns = None
+    line_number = 0
+    remainder = b''
+
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = remainder + chunk
+            last_newline = chunk.rfind(b'\n')
+            if last_newline == -1:
+                remainder = chunk
+                continue
+            remainder = chunk[last_newline + 1:]
+            chunk = chunk[:last_newline + 1]
+            num_columns, line_number = _readBlock(chunk, num_columns, line_number, blocks, file_path)  # noqa: E501
+
+    if remainder:
+        num_columns, line_number = _readBlock(remainder + b'\n', num_columns, line_number, blocks, file_path)  # noqa: E501
+
+    if not num_columns:
+        raise ValueError(f'No data found in {file_path}')
+
+    values = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    return values.reshape(-1, num_columns)
+
+
+def _readBlock(block, num_columns, line_number, blocks, file_path):
+    """
+    Parse the complete lines of `block`, the first of which is line
+    `line_number` + 1 of the file, into `blocks`. Return the number of
+    columns, None while only header lines were read, and the number of
+    lines read so far.
+    """
+    if b'#' in block:
+        block = _stripComments(block)
+    if num_columns is None:
+        block, line_number = _skipHeader(block, line_number)
+        if not block:
+            return None, line_number
+        num_columns = len(block.split(b'\n', 1)[0].split())
+    blocks.append(_parseBlock(block, num_columns, line_number, file_path))
+    return num_columns, line_number + block.count(b'\n')
+
+
+def _stripComments(block):
+    # Lines are kept, emptied, so that line numbers stay right
+    parts = []
+    start = 0
+    comment = block.find(b'#')
+    while comment != -1:
+        parts.append(block[start:comment])
+        start = block.find(b'\n', comment)
+        if start == -1:
+            start = len(block)
+            break
+        comment = block.find(b'#', start)
+    parts.append(block[start:])
+    return b''.join(parts)
+
+
+def _skipHeader(block, line_number):
+    """
+    Remove the lines before the first data line, i.e. the first line of
+    numbers only.
+    """
+    start = 0
+    while start < len(block):
+        end = block.find(b'\n', start) + 1 or len(block)
+        if _isDataLine(block[start:end]):
+            break
+        start = end
+        line_number += 1
+    return block[start:], line_number
+
+
+def _isDataLine(line):
+    tokens = line.split()
+    if not tokens:
+        return False
+    try:
+        np.array(tokens, dtype=np.float64)
+    except ValueError:
+        return False
+    return True
+
+
+def _checkColumns(block, num_columns, line_number, file_path):
+    """
+    Raise if a non blank line of `block` has not `num_columns` tokens,
+    else return the number of tokens.
+    """
+    chars = np.frombuffer(block, dtype=np.uint8)
+    is_space = chars <= _MAX_SEPARATOR
+    token_starts = ~is_space
+    token_starts[1:] &= is_space[:-1]
+    line_ends = np.flatnonzero(chars == ord('\n'))
+    # Tokens starting before each line end, by bisection of the sorted
+    # token positions rather than a running count over every byte
+    tokens_before = np.searchsorted(np.flatnonzero(token_starts), line_ends)
+    tokens_per_line = np.diff(tokens_before, prepend=0)
+    bad_lines = np.flatnonzero((tokens_per_line != 0) & (tokens_per_line != num_columns))  # noqa: E501
+    if bad_lines.size:
+        bad_line = bad_lines[0]
+        raise ValueError(f'{file_path}, line {line_number + bad_line + 1}: '
+                         f'{tokens_per_line[bad_line]} columns found, {num_columns} expected')  # noqa: E501
+    return int(tokens_per_line.sum())
+
+
+def _parseBlock(block, num_columns, line_number, file_path):
+    """
+    Parse the data and blank lines of `block` into a flat array of
+    `num_columns` values per data line.
+    """
+    num_values = _checkColumns(block, num_columns, line_number, file_path)
+    values = _fromString(block)
+    if values is not None and values.size == num_values:
+        return values
+    # Tokens the C parser rejects but float() takes, e.g. '1_000'
+    try:
+        return np.array(block.split(), dtype=np.float64)
+    except ValueError:
+        pass
+    # Locate the offending line for the error message
+    for index, line in enumerate(block.split(b'\n')):
+        if line.strip() and not _isDataLine(line):
+            raise ValueError(f'{file_path}, line {line_number + index + 1}: '
+                             f'cannot parse {line.strip().decode(errors="replace")!r} as numbers')  # noqa: E501
+    raise ValueError(f'{file_path}: cannot parse the data after line {line_number}')  # noqa: E501
+
+
+def _fromString(block):
+    # Any whitespace separates the values. Parsing stops at the first token
+    # that is not a number: older numpy warns, newer numpy raises, and
+    # either way fewer values than tokens are returned
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            return np.fromstring(block, dtype=np.float64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return None
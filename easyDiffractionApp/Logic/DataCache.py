@@ -0,0 +1,205 @@
+import os
+import json
+import time
+import hashlib
+import pathlib
+import tempfile
+
+from easyCore import np
+
+
+class ExperimentDataCache():
+    """
+    Binary cache of the parsed experimental data files.
+
+    Every cached file is stored as a single (columns, points) float64 .npy
+    array in the user cache directory, together with a small .json file
+    describing the source (size, mtime and content hash). Cache hits are
+    memory-mapped, so reopening the same experiment does not parse the
+    text file again.
+
+    Entries are written to a temporary file which then replaces the old
+    one, so that views memory-mapping the old entry keep valid data.
+    """
+
+    def __init__(self, cache_dir=None, max_size_bytes=256 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = ExperimentDataCache.defaultCacheDir()
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.enabled = True
+
+    @staticmethod
+    def defaultCacheDir():
+        return pathlib.Path.home().joinpath('.easyDiffraction', 'cache', 'experiments')
+
+    # Public
+
+    def load(self, file_path, loader):
+        """
+        Return the data columns of `file_path`, either from the cache or
+        by calling `loader(file_path)` and caching its result.
+        """
+        if not self.enabled:
+            return loader(file_path)
+
+        file_path = os.path.abspath(file_path)
+        columns = self._read(file_path)
+        if columns is not None:
+            return columns
+
+        columns = np.array(loader(file_path), dtype=np.float64)
+        try:
+            self._write(file_path, columns)
+        except OSError as exception:
+            print(f'Failed to cache {file_path}: {exception}')
+        return columns
+
+    def invalidate(self, file_path):
+        key = self._key(os.path.abspath(file_path))
+        for path in (self._dataPath(key), self._metaPath(key)):
+            ExperimentDataCache.removeFile(path)
+
+    def clear(self):
+        if not self.cache_dir.exists():
+            return
+        for path in self.cache_dir.iterdir():
+            if path.suffix in ('.npy', '.json', '.tmp'):
+                ExperimentDataCache.removeFile(path)
+
+    # Private: cache entries
+
+    def _key(self, file_path):
+        return hashlib.sha1(file_path.encode('utf-8')).hexdigest()
+
+    def _dataPath(self, key):
+        return self.cache_dir.joinpath(f'{key}.npy')
+
+    def _metaPath(self, key):
+        return self.cache_dir.joinpath(f'{key}.json')
+
+    def _read(self, file_path):
+        key = self._key(file_path)
+        data_path = self._dataPath(key)
+        meta_path = self._metaPath(key)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+
+        try:
+            with open(meta_path, 'r') as meta_file:
+                meta = json.load(meta_file)
+            stat = os.stat(file_path)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get('size') != stat.st_size:
+            return None
+        if meta.get('mtime') != stat.st_mtime_ns:
+            # Touched, but possibly not modified: compare contents
+            if meta.get('hash') != ExperimentDataCache.fileHash(file_path):
+                return None
+            meta['mtime'] = stat.st_mtime_ns
+
+        try:
+            columns = np.load(data_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+
+        meta['accessed'] = time.time()
+        self._writeMeta(meta_path, meta)
+        return columns
+
+    def _write(self, file_path, columns):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        stat = os.stat(file_path)
+        key = self._key(file_path)
+        columns = np.ascontiguousarray(columns, dtype='<f8')
+        self._replaceFile(self._dataPath(key), lambda file: np.save(file, columns))  # noqa: E501
+        meta = {
+            'source': file_path,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': ExperimentDataCache.fileHash(file_path),
+            'accessed': time.time()
+        }
+        self._writeMeta(self._metaPath(key), meta)
+        self._evict(keep=key)
+
+    def _writeMeta(self, meta_path, meta):
+        try:
+            self._replaceFile(meta_path, lambda file: file.write(json.dumps(meta).encode('utf-8')))  # noqa: E501
+        except OSError as exception:
+            print(f'Failed to update {meta_path}: {exception}')
+
+    def _replaceFile(self, path, write):
+        """
+        Write `path` with `write(file)` into a temporary file of the cache
+        directory, which then replaces `path`.
+        """
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as file:  # noqa: E501
+            temp_path = file.name
+            try:
+                write(file)
+            except BaseException:
+                file.close()
+                ExperimentDataCache.removeFile(temp_path)
+                raise
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            # e.g. on Windows, while the old entry is memory-mapped
+            ExperimentDataCache.removeFile(temp_path)
+            raise
+
+    def _evict(self, keep=None):
+        """
+        Remove the least recently used entries until the total size of the
+        cache fits into `max_size_bytes`.
+        """
+        entries = []
+        total_size = 0
+        for data_path in self.cache_dir.glob('*.npy'):
+            key = data_path.stem
+            meta_path = self._metaPath(key)
+            try:
+                with open(meta_path, 'r') as meta_file:
+                    accessed = json.load(meta_file).get('accessed', 0)
+            except (OSError, ValueError):
+                accessed = 0
+            size = data_path.stat().st_size
+            total_size += size
+            entries.append((accessed, size, key))
+
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            if key == keep:
+                continue
+            # An entry still memory-mapped cannot be removed on Windows
+            if ExperimentDataCache.removeFile(self._dataPath(key)):
+                ExperimentDataCache.removeFile(self._metaPath(key))
+                total_size -= size
+
+    # Static methods
+
+    @staticmethod
+    def removeFile(path):
+        """
+        Remove `path` if it exists. Return False if it could not be removed.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as exception:
+            print(f'Failed to remove {path}: {exception}')
+            return False
+        return True
+
+    @staticmethod
+    def fileHash(file_path, chunk_size=1024 * 1024):
+        digest = hashlib.sha1()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
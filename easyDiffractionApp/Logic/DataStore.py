@@ -23,11 +23,28 @@ class ProjectData(MSONable):
 
 
 class DataStore(Sequence, MSONable):
+    """
+    Ordered collection of data sets with id, name and type indexes.
+
+    Every data set gets an id when added, which stays valid until it is
+    removed. The lookups by id or name and the experiments/simulations
+    lists are kept up to date on every change, so reading them does not
+    scan the items.
+    """
 
     def __init__(self, *args, name='DataStore'):
         self.name = name
-        self.items = list(args)
+        self.items = []
         self.show_legend = False
+        self._ids = []
+        self._next_id = 0
+        self._items_by_id = {}
+        self._ids_by_name = {}
+        self._experiments = ()
+        self._simulations = ()
+        self._current_experiment_index = 0
+        for item in args:
+            self.append(item)
 
     def __getitem__(self, i: int) -> T:
         return self.items.__getitem__(i)
@@ -36,36 +53,152 @@ class DataStore(Sequence, MSONable):
         return len(self.items)
 
     def __setitem__(self, key, value):
+        self._unindex(self.items[key])
         self.items[key] = value
+        self._index(value, self._ids[key])
+        self._updateTypeIndexes()
+
+    def __delitem__(self, key):
+        item = self.items[key]
+        del self.items[key]
+        del self._ids[key]
+        self._unindex(item)
+        self._updateTypeIndexes()
+
+    def append(self, item) -> int:
+        """
+        Add a data set and return its id.
+        """
+        item_id = self._next_id
+        self._next_id += 1
+        self.items.append(item)
+        self._ids.append(item_id)
+        self._index(item, item_id)
+        self._updateTypeIndexes()
+        return item_id
+
+    def remove(self, item_id: int):
+        del self[self._ids.index(item_id)]
+
+    def byId(self, item_id: int):
+        return self._items_by_id[item_id]
 
-    def append(self, *args):
-        self.items.append(*args)
+    def idOf(self, item) -> int:
+        return item._store_id
+
+    def byName(self, name: str):
+        """
+        Return the first data set with the given name, or None.
+        """
+        ids = self._ids_by_name.get(name)
+        if not ids:
+            return None
+        return self._items_by_id[ids[0]]
 
     def as_dict(self, skip: list = []) -> dict:
         this_dict = super(DataStore, self).as_dict(self)
         this_dict['items'] = [
             item.as_dict() for item in self.items if hasattr(item, 'as_dict')
         ]
+        return this_dict
 
     @classmethod
     def from_dict(cls, d):
         items = d['items']
         del d['items']
-        obj = cls.from_dict(d)
+        obj = super(DataStore, cls).from_dict(d)
         decoder = MontyDecoder()
-        obj.items = [decoder.process_decoded(item) for item in items]
+        for item in items:
+            obj.append(decoder.process_decoded(item))
         return obj
 
     @property
     def experiments(self):
-        return [self[idx] for idx in range(len(self)) if self[idx].is_experiment]
+        return self._experiments
 
     @property
     def simulations(self):
-        return [self[idx] for idx in range(len(self)) if self[idx].is_simulation]
+        return self._simulations
+
+    @property
+    def currentExperimentIndex(self) -> int:
+        return self._current_experiment_index
+
+    @currentExperimentIndex.setter
+    def currentExperimentIndex(self, index: int):
+        if not 0 <= index < len(self._experiments):
+            raise IndexError(f'No experiment with index {index}')
+        self._current_experiment_index = index
+
+    @property
+    def currentExperiment(self):
+        if not self._experiments:
+            return None
+        return self._experiments[self._current_experiment_index]
+
+    # Called by the data sets on name and type changes
+
+    def _onItemRenamed(self, item, old_name):
+        self._removeName(old_name, item._store_id)
+        self._ids_by_name.setdefault(item.name, []).append(item._store_id)
+
+    def _onItemRetyped(self, item):
+        self._updateTypeIndexes()
+
+    # Private
+
+    def _index(self, item, item_id):
+        item._store = self
+        item._store_id = item_id
+        self._items_by_id[item_id] = item
+        self._ids_by_name.setdefault(item.name, []).append(item_id)
+
+    def _unindex(self, item):
+        item_id = item._store_id
+        self._removeName(item.name, item_id)
+        del self._items_by_id[item_id]
+        item._store = None
+        item._store_id = None
+
+    def _removeName(self, name, item_id):
+        ids = self._ids_by_name.get(name, [])
+        if item_id in ids:
+            ids.remove(item_id)
+        if not ids:
+            self._ids_by_name.pop(name, None)
+
+    def _updateTypeIndexes(self):
+        # Only on additions, removals and type changes, not on reads
+        self._experiments = tuple(item for item in self.items if item.is_experiment)
+        self._simulations = tuple(item for item in self.items if item.is_simulation)
+        if self._current_experiment_index >= len(self._experiments):
+            self._current_experiment_index = max(len(self._experiments) - 1, 0)
 
 
 class DataSet1D(MSONable):
+    """
+    1D data set stored in a single (n, k) buffer: column 0 is x, 1 is y
+    and 2, if any, the sigma e. The buffer is Fortran-ordered, so x, y and
+    e are contiguous column views of it rather than separate arrays.
+
+    A data set without sigmas has no e column; its e is a read-only view
+    of zeros which takes no memory. The buffer is float64 by default,
+    float32 halves its size.
+
+    The points to fit can be restricted to a fit range and/or exclude
+    some x regions (e.g. detector gaps); the resulting boolean mask is
+    built on the first request and kept until the x column or the regions
+    change.
+
+    Sigmas which are zero, negative or not finite, e.g. of a data set
+    without an e column, are replaced according to the weight policy:
+    'sqrt' uses sqrt(y), but at least 1, as for counting statistics;
+    'floor' uses the sigma floor; 'mask' leaves those points out of the
+    fit. The validated fit arrays are likewise kept until the data, the
+    regions or the policy change.
+    """
+
+    weight_policies = ('sqrt', 'floor', 'mask')
 
     def __init__(self, name: str = 'Series',
                  x: Union[np.ndarray, list] = None,
@@ -73,35 +206,220 @@ class DataSet1D(MSONable):
                  e: Union[np.ndarray, list] = None,
                  data_type: str = 'simulation',
                  x_label: str = 'x',
-                 y_label: str = 'y'):
+                 y_label: str = 'y',
+                 dtype=np.float64):
 
         if not isinstance(data_type, str):
             raise AttributeError
+        # Set by the DataStore the data set is added to
+        self._store = None
+        self._store_id = None
         self._datatype = None
         self.data_type = data_type
 
         if x is None:
             x = np.array([])
         if y is None:
-            y = np.array([])
-        if e is None:
-            e = np.zeros_like(x)
-
-        self.name = name
-        if not isinstance(x, np.ndarray):
-            x = np.array(x)
-        if not isinstance(y, np.ndarray):
-            y = np.array(y)
+            y = np.zeros_like(x)
 
-        self.x = x
-        self.y = y
-        self.e = e
+        self._name = name
+        self._fit_range = None
+        self._excluded_regions = ()
+        self._fit_mask = None
+        self._fit_mask_valid = False
+        self._weight_policy = 'sqrt'
+        self._sigma_floor = 1.0
+        self._bad_points = None
+        self._fit_points = None
+        self._fit_arrays = None
+        self._buffer = np.empty((0, 2), dtype=dtype, order='F')
+        self.setData(x, y, e)
 
         self.x_label = x_label
         self.y_label = y_label
 
         self._color = None
 
+    @property
+    def x(self) -> np.ndarray:
+        return self._buffer[:, 0]
+
+    @x.setter
+    def x(self, x):
+        self._setColumn(0, x)
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._buffer[:, 1]
+
+    @y.setter
+    def y(self, y):
+        self._setColumn(1, y)
+
+    @property
+    def e(self) -> np.ndarray:
+        if self._buffer.shape[1] < 3:
+            return np.broadcast_to(self._buffer.dtype.type(0), self._buffer.shape[:1])  # noqa: E501
+        return self._buffer[:, 2]
+
+    @e.setter
+    def e(self, e):
+        self._setColumn(2, e)
+
+    @property
+    def buffer(self) -> np.ndarray:
+        """
+        Read-only view of the (n, k) buffer.
+        """
+        return DataSet1D.readOnlyView(self._buffer)
+
+    @property
+    def dtype(self):
+        return self._buffer.dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        if self._buffer.dtype != dtype:
+            self._buffer = np.require(self._buffer, dtype=dtype, requirements=['F'])  # noqa: E501
+            self._invalidateFitArrays(x_changed=True)
+
+    @property
+    def nbytes(self) -> int:
+        return self._buffer.nbytes
+
+    def setData(self, x, y, e=None):
+        """
+        Replace all the columns at once, with a single allocation.
+        """
+        columns = [x, y] if e is None else [x, y, e]
+        self.setColumns(columns)
+
+    def setColumns(self, columns):
+        """
+        Replace all the columns by the rows of a (k, n) array, k = 2 or 3,
+        e.g. as returned by readColumns. A C-ordered array of the buffer
+        dtype, such as a memory-mapped .npy file, is used without a copy.
+        """
+        if isinstance(columns, np.ndarray) and columns.ndim == 2:
+            buffer = columns.T
+        else:
+            buffer = np.column_stack([np.asarray(column) for column in columns])
+        if buffer.ndim != 2 or buffer.shape[1] not in (2, 3):
+            raise ValueError(f'Expected 2 or 3 columns, got the shape {buffer.shape}')  # noqa: E501
+        # subok: a memory-mapped buffer stays a memmap (see saveProject)
+        self._buffer = np.require(buffer, dtype=self._buffer.dtype, requirements=['F'])  # noqa: E501
+        self._invalidateFitArrays(x_changed=True)
+
+    @property
+    def fit_range(self):
+        """
+        (min_x, max_x) of the points to fit, or None for the whole x range.
+        """
+        return self._fit_range
+
+    @fit_range.setter
+    def fit_range(self, fit_range):
+        self._fit_range = None if fit_range is None else DataSet1D.xRegion(*fit_range)  # noqa: E501
+        self._invalidateFitArrays(x_changed=True)
+
+    @property
+    def excluded_regions(self) -> tuple:
+        """
+        (min_x, max_x) regions of the points left out of the fit.
+        """
+        return self._excluded_regions
+
+    @excluded_regions.setter
+    def excluded_regions(self, regions):
+        self._excluded_regions = tuple(DataSet1D.xRegion(*region) for region in regions)  # noqa: E501
+        self._invalidateFitArrays(x_changed=True)
+
+    def fitMask(self):
+        """
+        Boolean mask of the points to fit, or None if all the points are.
+        """
+        if not self._fit_mask_valid:
+            self._fit_mask = self._buildFitMask()
+            self._fit_mask_valid = True
+        return self._fit_mask
+
+    @property
+    def weight_policy(self) -> str:
+        return self._weight_policy
+
+    @weight_policy.setter
+    def weight_policy(self, policy: str):
+        if policy not in DataSet1D.weight_policies:
+            raise ValueError(f'Unknown weight policy: {policy}')
+        self._weight_policy = policy
+        self._invalidateFitArrays()
+
+    @property
+    def sigma_floor(self) -> float:
+        """
+        Sigma of the points with an invalid sigma, with the 'floor' policy.
+        """
+        return self._sigma_floor
+
+    @sigma_floor.setter
+    def sigma_floor(self, sigma_floor: float):
+        sigma_floor = float(sigma_floor)
+        if not np.isfinite(sigma_floor) or sigma_floor <= 0:
+            raise ValueError(f'Invalid sigma floor: {sigma_floor}')
+        self._sigma_floor = sigma_floor
+        self._invalidateFitArrays()
+
+    def badPoints(self):
+        """
+        Boolean mask of the points with an invalid sigma or intensity, or
+        None if there are none.
+        """
+        self.fitArrays()
+        return self._bad_points
+
+    def fitPoints(self):
+        """
+        Boolean mask of the points returned by fitArrays(), or None if all
+        the points are.
+        """
+        self.fitArrays()
+        return self._fit_points
+
+    def fitArrays(self):
+        """
+        Contiguous, read-only float64 x, y and weights (1 / sigma) of the
+        points to fit: those in the fit regions with a finite intensity
+        and, with the 'mask' weight policy, a valid sigma.
+        """
+        if self._fit_arrays is None:
+            self._fit_arrays = self._buildFitArrays()
+        return self._fit_arrays
+
+    def fitSettingsAsDict(self) -> dict:
+        return {
+            'fit_range': None if self._fit_range is None else list(self._fit_range),  # noqa: E501
+            'excluded_regions': [list(region) for region in self._excluded_regions],  # noqa: E501
+            'weight_policy': self._weight_policy,
+            'sigma_floor': self._sigma_floor
+        }
+
+    def setFitSettingsFromDict(self, d: dict):
+        self.fit_range = d.get('fit_range', None)
+        self.excluded_regions = d.get('excluded_regions', [])
+        self.weight_policy = d.get('weight_policy', 'sqrt')
+        self.sigma_floor = d.get('sigma_floor', 1.0)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        old_name = self._name
+        self._name = name
+        if self._store is not None and name != old_name:
+            self._store._onItemRenamed(self, old_name)
+
     @property
     def data_type(self) -> str:
         if self._datatype == 'e':
@@ -117,6 +435,8 @@ class DataSet1D(MSONable):
             self._datatype = 's'
         elif data_switch == 'e':
             self._datatype = 'e'
+        if self._store is not None:
+            self._store._onItemRetyped(self)
 
     @property
     def is_experiment(self) -> bool:
@@ -128,3 +448,92 @@ class DataSet1D(MSONable):
 
     def __repr__(self) -> str:
         return "1D DataStore of '{:s}' Vs '{:s}' with {} data points".format(self.x_label, self.y_label, len(self.x))
+
+    # Private
+
+    def _setColumn(self, index, values):
+        values = np.asarray(values).reshape(-1)
+        size = self._buffer.shape[0]
+        if values.size != size:
+            raise ValueError(f'{values.size} values given for a data set of {size} points, '  # noqa: E501
+                             f'use setData() to change the number of points')  # noqa: E501
+        if index >= self._buffer.shape[1]:
+            # New e column
+            buffer = np.empty((size, index + 1), dtype=self._buffer.dtype, order='F')  # noqa: E501
+            buffer[:, :self._buffer.shape[1]] = self._buffer
+            self._buffer = buffer
+        elif not self._buffer.flags.writeable:
+            # Copy on write of memory-mapped data
+            self._buffer = np.array(self._buffer, order='F')
+        self._buffer[:, index] = values
+        self._invalidateFitArrays(x_changed=index == 0)
+
+    def _invalidateFitArrays(self, x_changed=False):
+        self._fit_arrays = None
+        self._bad_points = None
+        self._fit_points = None
+        if x_changed:
+            self._fit_mask_valid = False
+
+    def _buildFitMask(self):
+        if self._fit_range is None and not self._excluded_regions:
+            return None
+        x = self.x
+        if self._fit_range is None:
+            mask = np.ones(x.shape, dtype=bool)
+        else:
+            mask = (x >= self._fit_range[0]) & (x <= self._fit_range[1])
+        for min_x, max_x in self._excluded_regions:
+            mask &= (x < min_x) | (x > max_x)
+        if mask.all():
+            return None
+        mask.flags.writeable = False
+        return mask
+
+    def _buildFitArrays(self):
+        x = np.asarray(self.x, dtype=np.float64)
+        y = np.asarray(self.y, dtype=np.float64)
+        e = np.asarray(self.e, dtype=np.float64)
+
+        invalid_y = ~np.isfinite(y)
+        invalid_e = ~(np.isfinite(e) & (e > 0))
+        bad_points = invalid_y | invalid_e
+        self._bad_points = DataSet1D.readOnlyView(bad_points) if bad_points.any() else None  # noqa: E501
+
+        keep = ~invalid_y
+        if self._weight_policy == 'mask':
+            keep &= ~invalid_e
+            sigma = e
+        elif not invalid_e.any():
+            sigma = e
+        elif self._weight_policy == 'sqrt':
+            # fmax: 1 for the NaN intensities too, these are left out anyway
+            sigma = np.where(invalid_e, np.sqrt(np.fmax(y, 1.0)), e)
+        else:
+            sigma = np.where(invalid_e, self._sigma_floor, e)
+        fit_mask = self.fitMask()
+        if fit_mask is not None:
+            keep &= fit_mask
+
+        if keep.all():
+            self._fit_points = None
+            arrays = (x, y, 1.0 / sigma)
+        else:
+            self._fit_points = DataSet1D.readOnlyView(keep)
+            arrays = (x[keep], y[keep], 1.0 / sigma[keep])
+        return tuple(DataSet1D.readOnlyView(np.ascontiguousarray(array)) for array in arrays)  # noqa: E501
+
+    # Static methods
+
+    @staticmethod
+    def xRegion(min_x, max_x):
+        min_x, max_x = float(min_x), float(max_x)
+        if min_x > max_x:
+            min_x, max_x = max_x, min_x
+        return min_x, max_x
+
+    @staticmethod
+    def readOnlyView(array):
+        view = np.asarray(array).view()
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,76 @@
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property
+
+
+class DictListModel(QAbstractListModel):
+    """
+    A list model exposing a list of dicts to QML, one role per dict key.
+    Views bind to it directly (`model.<key>` in delegates), so there is
+    no need to serialize the dicts to XML and parse it back in QML.
+    """
+
+    countChanged = Signal()
+
+    def __init__(self, role_names, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._role_names = list(role_names)
+        self._roles = {Qt.UserRole + 1 + idx: name for idx, name in enumerate(self._role_names)}  # noqa: E501
+
+    # QAbstractListModel interface
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        name = self._roles.get(role)
+        if name is None:
+            return None
+        return self._items[index.row()].get(name)
+
+    def roleNames(self):
+        return {role: name.encode() for role, name in self._roles.items()}
+
+    # Public: QML frontend
+
+    @Property(int, notify=countChanged)
+    def count(self):
+        return len(self._items)
+
+    @Slot(int, result='QVariant')
+    def get(self, row):
+        if not 0 <= row < len(self._items):
+            return None
+        return self._items[row]
+
+    # Public: Python backend
+
+    def items(self):
+        return self._items
+
+    def setItems(self, items):
+        """
+        Replace the model content. Rows are updated in place when the
+        number of items is unchanged, otherwise the model is reset.
+        """
+        items = list(items)
+        if len(items) != len(self._items):
+            self.beginResetModel()
+            self._items = items
+            self.endResetModel()
+            self.countChanged.emit()
+            return
+        for row, item in enumerate(items):
+            if item != self._items[row]:
+                self.setRow(row, item)
+
+    def setRow(self, row, item):
+        self._items[row] = item
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, list(self._roles.keys()))
+
+    def clear(self):
+        self.setItems([])
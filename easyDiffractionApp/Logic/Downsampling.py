@@ -0,0 +1,129 @@
+from easyCore import np
+
+
+class MinMaxPyramid():
+    """
+    Multi-resolution min/max decimation of a 1d series y(x), x sorted.
+
+    Level k keeps, for every bin of 2**k consecutive points, the indices of
+    its minimum and maximum, so that peak maxima survive at any zoom level.
+    All the levels are built at once (O(n) in total) on the first request
+    after setData(), so that series replaced on every fit step but not
+    drawn cost nothing; a change of the visible range then only selects a
+    level and slices it. The level buffers are reused by the next series
+    of the same size.
+    """
+
+    def __init__(self, xarray=None, yarray=None):
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._built = False
+        # Per level k >= 1: (min indices, max indices, sorted interleaved
+        # indices), level 0 being all the points
+        self._levels = []
+        self._levels_key = None
+        self._points = np.empty(0, dtype=np.intp)
+        self._y_left = np.empty(0)
+        self._y_right = np.empty(0)
+        self._choose_right = np.empty(0, dtype=bool)
+        self._left_nan = np.empty(0, dtype=bool)
+        if xarray is not None:
+            self.setData(xarray, yarray)
+
+    @property
+    def size(self):
+        return self._x.size
+
+    def setData(self, xarray, yarray):
+        self._x = np.asarray(xarray)
+        self._y = np.asarray(yarray)
+        self._built = False
+
+    def indices(self, min_x=None, max_x=None, pixels=2000):
+        """
+        Return the sorted indices of the points to draw in the range
+        [min_x, max_x] for a plot `pixels` wide: at most about two points
+        per pixel, the minimum and maximum of the y values behind it.
+        """
+        first = 0 if min_x is None else int(np.searchsorted(self._x, min_x, side='left'))  # noqa: E501
+        last = self.size if max_x is None else int(np.searchsorted(self._x, max_x, side='right'))  # noqa: E501
+        # One extra point on each side, so the lines reach the plot edges
+        first = max(first - 1, 0)
+        last = min(last + 1, self.size)
+        count = last - first
+        if count <= 0:
+            return np.empty(0, dtype=np.intp)
+        if pixels <= 0 or count <= 2 * pixels:
+            return np.arange(first, last)
+
+        if not self._built:
+            self._build()
+        level = int(np.ceil(np.log2(count / pixels)))
+        level = min(level, len(self._levels))
+        first_bin = first >> level
+        last_bin = (last - 1) >> level
+        return self._levels[level - 1][2][2 * first_bin:2 * (last_bin + 1)]
+
+    # Private
+
+    def _build(self):
+        if self._levels_key != (self.size, self._y.dtype):
+            self._allocate(self.size)
+        # Level 1 from the raw data, pairs of neighbouring points
+        previous_min = previous_max = self._points
+        for idx_min, idx_max, indices in self._levels:
+            self._mergeBins(previous_min, previous_max, idx_min, idx_max)
+            np.minimum(idx_min, idx_max, out=indices[0::2])
+            np.maximum(idx_min, idx_max, out=indices[1::2])
+            previous_min, previous_max = idx_min, idx_max
+        self._built = True
+
+    def _allocate(self, size):
+        # 32-bit indices are enough for any realistic pattern
+        index_type = np.int32 if size < 2 ** 31 else np.intp
+        self._levels = []
+        num_bins = size
+        while num_bins > 1:
+            num_bins = (num_bins + 1) // 2
+            self._levels.append((np.empty(num_bins, dtype=index_type),
+                                 np.empty(num_bins, dtype=index_type),
+                                 np.empty(2 * num_bins, dtype=index_type)))
+        self._points = np.arange(size, dtype=index_type)
+        num_pairs = size // 2
+        self._y_left = np.empty(num_pairs, dtype=self._y.dtype)
+        self._y_right = np.empty(num_pairs, dtype=self._y.dtype)
+        self._choose_right = np.empty(num_pairs, dtype=bool)
+        self._left_nan = np.empty(num_pairs, dtype=bool)
+        self._levels_key = (size, self._y.dtype)
+
+    def _mergeBins(self, idx_min, idx_max, out_min, out_max):
+        """
+        Merge the bins of the previous level in pairs into `out_min` and
+        `out_max`. With an odd number of bins, the last one is kept as is.
+        NaN values (points not drawn) lose against any other value.
+        """
+        num_pairs = idx_min.size // 2
+        y_left = self._y_left[:num_pairs]
+        y_right = self._y_right[:num_pairs]
+        merged_min = out_min[:num_pairs]
+        merged_max = out_max[:num_pairs]
+        choose_right = self._choose_right[:num_pairs]
+        left_nan = self._left_nan[:num_pairs]
+
+        np.take(self._y, idx_min[0:2 * num_pairs:2], out=y_left)
+        np.take(self._y, idx_min[1::2][:num_pairs], out=y_right)
+        np.copyto(merged_min, idx_min[0:2 * num_pairs:2])
+        np.less(y_right, y_left, out=choose_right)
+        choose_right |= np.isnan(y_left, out=left_nan)
+        np.copyto(merged_min, idx_min[1::2][:num_pairs], where=choose_right)  # noqa: E501
+
+        np.take(self._y, idx_max[0:2 * num_pairs:2], out=y_left)
+        np.take(self._y, idx_max[1::2][:num_pairs], out=y_right)
+        np.copyto(merged_max, idx_max[0:2 * num_pairs:2])
+        np.greater(y_right, y_left, out=choose_right)
+        choose_right |= np.isnan(y_left, out=left_nan)
+        np.copyto(merged_max, idx_max[1::2][:num_pairs], where=choose_right)  # noqa: E501
+
+        if out_min.size > num_pairs:
+            out_min[-1] = idx_min[-1]
+            out_max[-1] = idx_max[-1]
@@ -0,0 +1,111 @@
+import time
+import threading
+
+import numpy as np
+
+
+class FitCancelled(Exception):
+    """
+    Raised from the fit function when a stop has been requested, to leave
+    the minimizer at its next function evaluation.
+    """
+
+
+class FitProgressMonitor():
+    """
+    Wraps the fit function to report the fit progress from the worker
+    thread.
+
+    Every evaluation is counted, but a progress snapshot (evaluation
+    count, chi2, reduced chi2 and a copy of the calculated pattern) is
+    handed to `publish` at most once per `interval` seconds. `publish` is
+    meant to emit a queued signal, so the worker never touches Qt objects.
+    Between snapshots the overhead is a counter and a clock read.
+
+    It also carries the stop token of the fit: after `requestStop()` the
+    next evaluation raises FitCancelled.
+    """
+
+    def __init__(self, fit_func, publish=None, interval=0.1, stop_event=None):
+        self._fit_func = fit_func
+        self.publish = publish
+        self.interval = interval
+        self._lock = threading.Lock()
+        # A multiprocessing.Event can be given to stop a fit in another process
+        self._stop_event = threading.Event() if stop_event is None else stop_event
+        self._active = False
+        self._reset()
+
+    def __call__(self, x, *args, **kwargs):
+        if self._active and self._stop_event.is_set():
+            raise FitCancelled('Fitting stopped')
+        y_calc = self._fit_func(x, *args, **kwargs)
+        if not self._active:
+            return y_calc
+        self._evaluations += 1
+        now = time.monotonic()
+        if now - self._last_publish >= self.interval:
+            self._last_publish = now
+            self._publish(x, y_calc)
+        return y_calc
+
+    # Public
+
+    def start(self, x, y, weights=None, num_pars=0):
+        with self._lock:
+            self._reset()
+            self._y = np.asarray(y, dtype=np.float64)
+            self._weights = None if weights is None else np.asarray(weights, dtype=np.float64)  # noqa: E501
+            self._num_pars = num_pars
+            self._started = time.monotonic()
+            self._active = True
+
+    def stop(self):
+        with self._lock:
+            self._active = False
+
+    def requestStop(self):
+        self._stop_event.set()
+
+    def resetStop(self):
+        self._stop_event.clear()
+
+    def stopRequested(self):
+        return self._stop_event.is_set()
+
+    def latest(self):
+        with self._lock:
+            return self._latest
+
+    # Private
+
+    def _reset(self):
+        self._evaluations = 0
+        self._last_publish = 0.0
+        self._started = 0.0
+        self._latest = None
+        self._y = None
+        self._weights = None
+        self._num_pars = 0
+
+    def _publish(self, x, y_calc):
+        y_calc = np.array(y_calc, dtype=np.float64)
+        if y_calc.shape != self._y.shape:
+            return
+        residuals = self._y - y_calc
+        if self._weights is not None:
+            residuals *= self._weights
+        chi2 = float(np.dot(residuals, residuals))
+        dof = max(residuals.size - self._num_pars, 1)
+        progress = {
+            'evaluations': self._evaluations,
+            'chi2': chi2,
+            'redchi2': chi2 / dof,
+            'elapsed': time.monotonic() - self._started,
+            'x': np.array(x, dtype=np.float64),
+            'y': y_calc
+        }
+        with self._lock:
+            self._latest = progress
+        if self.publish is not None:
+            self.publish(progress)
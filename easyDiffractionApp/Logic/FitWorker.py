@@ -0,0 +1,147 @@
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from easyDiffractionApp.Logic.FitProgress import FitCancelled, FitProgressMonitor
+
+# Set in the worker process by _initWorker
+_stop_event = None
+_progress_queue = None
+
+
+def _initWorker(stop_event, progress_queue):
+    global _stop_event, _progress_queue
+    _stop_event = stop_event
+    _progress_queue = progress_queue
+
+
+def _publishProgress(progress):
+    try:
+        _progress_queue.put_nowait(progress)
+    except Exception:  # a full queue only drops a snapshot
+        pass
+
+
+def fitSample(sample_dict, interface_name, engine_name, method, x, y, weights):  # noqa: E501
+    """
+    Fit a sample description in the worker process.
+
+    The sample is rebuilt from its `as_dict(skip=['interface'])` form with
+    a calculator of its own; only plain data goes back: the fit summary
+    and (name, value, error) of the free parameters, in the order of
+    `get_fit_parameters()`.
+    """
+    from easyCore import borg
+    from easyCore.Fitting.Fitting import Fitter as CoreFitter
+    from easyDiffractionLib.sample import Sample
+    from easyDiffractionLib.interface import InterfaceFactory
+
+    # Nothing to undo in the worker
+    borg.stack.enabled = False
+
+    interface = InterfaceFactory()
+    if interface.current_interface_name != interface_name:
+        interface.switch(interface_name)
+    sample = Sample.from_dict(sample_dict)
+    sample.interface = interface
+
+    # Without the initializer (e.g. batch fitting) there is no progress
+    publish = _publishProgress if _progress_queue is not None else None
+    monitor = FitProgressMonitor(interface.fit_func, publish=publish, interval=0.1, stop_event=_stop_event)  # noqa: E501
+    fitter = CoreFitter(sample, monitor)
+    if fitter.current_engine.name != engine_name:
+        fitter.switch_engine(engine_name)
+
+    pars = fitter.fit_object.get_fit_parameters()
+    monitor.start(x, y, weights, len(pars))
+    try:
+        res = fitter.fit(x, y, weights=weights, method=method)
+    except Exception:  # minimizers may wrap FitCancelled into their own errors
+        if monitor.stopRequested():
+            raise FitCancelled('Fitting stopped') from None
+        raise
+    finally:
+        monitor.stop()
+
+    return {
+        'success': bool(res.success),
+        'n_pars': res.n_pars,
+        'goodness_of_fit': float(res.goodness_of_fit),
+        'reduced_chi': float(res.reduced_chi),
+        'parameters': [(par.name, float(par.raw_value), float(par.error)) for par in pars]  # noqa: E501
+    }
+
+
+class FitResult():
+    """
+    Fit summary returned by the worker, with the attributes of the
+    easyCore fit results used by FitterLogic.
+    """
+
+    def __init__(self, descr):
+        self.success = descr['success']
+        self.n_pars = descr['n_pars']
+        self.goodness_of_fit = descr['goodness_of_fit']
+        self.reduced_chi = descr['reduced_chi']
+        self.parameters = descr['parameters']
+
+
+class FitProcessPool():
+    """
+    A single worker process for the fits, started on the first fit and
+    reused by the next ones, so the calculator is imported only once.
+
+    The 'spawn' start method is used on all platforms: forking a process
+    which runs Qt threads is not safe.
+    """
+
+    def __init__(self):
+        self._context = multiprocessing.get_context('spawn')
+        self._executor = None
+        self._stop_event = None
+        self._progress_queue = None
+
+    @property
+    def progressQueue(self):
+        return self._progress_queue
+
+    def submit(self, sample_dict, interface_name, engine_name, method, x, y, weights):  # noqa: E501
+        if self._executor is None:
+            self._start()
+        self._stop_event.clear()
+        self._drainProgress()
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        weights = np.ascontiguousarray(weights, dtype=np.float64)
+        return self._executor.submit(fitSample, sample_dict, interface_name, engine_name, method, x, y, weights)  # noqa: E501
+
+    def requestStop(self):
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def shutdown(self):
+        if self._executor is None:
+            return
+        self.requestStop()
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    # Private
+
+    def _start(self):
+        self._stop_event = self._context.Event()
+        self._progress_queue = self._context.Queue(maxsize=100)
+        self._executor = ProcessPoolExecutor(max_workers=1,
+                                             mp_context=self._context,
+                                             initializer=_initWorker,
+                                             initargs=(self._stop_event, self._progress_queue))  # noqa: E501
+
+    def _drainProgress(self):
+        # Snapshots left over from a stopped fit
+        try:
+            while True:
+                self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
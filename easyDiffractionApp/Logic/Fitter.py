@@ -1,11 +1,18 @@
-from PySide2.QtCore import Signal, QObject, QThread
+from PySide2.QtCore import Qt, Signal, QObject, QThread, QCoreApplication
 
+from queue import Empty
 from threading import Thread
+from concurrent.futures.process import BrokenProcessPool
 
 from easyCore.Fitting.Fitting import Fitter as CoreFitter
-from easyCore import borg
+from easyCore import np, borg
 
+from easyDiffractionApp.Logic.FitProgress import FitCancelled, FitProgressMonitor
+from easyDiffractionApp.Logic.FitWorker import FitProcessPool, FitResult
+from easyDiffractionApp.Logic.SignalTracer import tracer
 
+
+@tracer.traceHandlers
 class FitterLogic(QObject):
     """
     Logic related to the fitter setup
@@ -14,10 +21,21 @@ class FitterLogic(QObject):
     fitStarted = Signal()
     currentMinimizerChanged = Signal()
     finished = Signal(dict)
+    failed = Signal(str)
+    fitProgress = Signal(object)
+    fitProgressChanged = Signal()
+    fitModeChanged = Signal()
+
+    # 'thread': the fit runs in a thread of the GUI process (default)
+    # 'process': the fit runs in a worker process, free of the GIL of the GUI
+    fit_modes = ['thread', 'process']
 
     def __init__(self, parent=None, sample=None, fit_func=""):
         super().__init__(parent)
-        self.fitter = CoreFitter(sample, fit_func)
+        # The worker thread reports progress through the queued fitProgress
+        # signal only, at most 10 times per second
+        self._progress_monitor = FitProgressMonitor(fit_func, publish=self.fitProgress.emit, interval=0.1)  # noqa: E501
+        self.fitter = CoreFitter(sample, self._progress_monitor)
 
         self.parent = parent
 
@@ -25,28 +43,70 @@ class FitterLogic(QObject):
         # self._fitter_thread = None
         self._fit_finished = True
         self._fit_results = self._defaultFitResults()
+        self._fit_progress = self._defaultFitProgress()
+        self._fit_progress_pattern = None
+        # Full x grid of the fitted data set and mask of the fitted points
+        self._fit_grid = None
+        self._fit_points = None
+        self._pre_fit_snapshot = []
+        self._pre_fit_stack_enabled = True
+        self._fit_mode = 'thread'
+        self._fit_process_pool = FitProcessPool()
+        self._fit_process_args = None
 
         self._current_minimizer_method_index = 0
         self._current_minimizer_method_name = self.fitter.available_methods()[0]  # noqa: E501
 
-        self.fit_thread = Thread(target=self.fit_threading)
+        self.fit_thread = self._newFitThread()
         self.finished.connect(self._setFitResults)
+        self.failed.connect(self._setFitResultsFailed)
+        self.fitProgress.connect(self._setFitProgress, Qt.QueuedConnection)
 
-    def fit_threading(self):
-        data = self.data
-        method = self.minimizer_name
-
-        self._fit_finished = False
-        self.fitStarted.emit()
-        exp_data = data.experiments[0]
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._fit_process_pool.shutdown)
 
-        x = exp_data.x
-        y = exp_data.y
-        weights = 1 / exp_data.e
+    def fit_threading(self):
+        try:
+            res = self.fitter.fit(self.x, self.y, weights=self.weights, method=self.minimizer_name)  # noqa: E501
+        except Exception as ex:  # minimizers may wrap FitCancelled into their own errors
+            self._progress_monitor.stop()
+            reason = 'cancelled' if self._progress_monitor.stopRequested() else str(ex)  # noqa: E501
+            self.failed.emit(reason)
+            return
+        self._progress_monitor.stop()
+        self.finished.emit(res)
 
-        res = self.fitter.fit(x, y, weights=weights, method=method)
+    def fit_processing(self):
+        future = self._fit_process_pool.submit(*self._fit_process_args)
+        self._fit_process_args = None
+        # Forward the progress snapshots of the worker process while waiting
+        progress_queue = self._fit_process_pool.progressQueue
+        while not future.done():
+            try:
+                self.fitProgress.emit(progress_queue.get(timeout=0.1))
+            except Empty:
+                pass
+        try:
+            res = FitResult(future.result())
+        except FitCancelled:
+            self.failed.emit('cancelled')
+            return
+        except BrokenProcessPool as ex:
+            # The worker process died, a new one is started by the next fit
+            self._fit_process_pool.shutdown()
+            self.failed.emit(str(ex))
+            return
+        except Exception as ex:
+            reason = 'cancelled' if self._progress_monitor.stopRequested() else str(ex)  # noqa: E501
+            self.failed.emit(reason)
+            return
         self.finished.emit(res)
 
+    def _newFitThread(self):
+        target = self.fit_processing if self._fit_mode == 'process' else self.fit_threading  # noqa: E501
+        return Thread(target=target)
+
     def _defaultFitResults(self):
         return {
             "success": None,
@@ -55,75 +115,174 @@ class FitterLogic(QObject):
             "redchi2": None
         }
 
+    def _defaultFitProgress(self):
+        return {
+            "evaluations": 0,
+            "chi2":        None,
+            "redchi2":     None,
+            "elapsed":     0.0
+        }
+
+    def _setFitProgress(self, progress):
+        # Late snapshots, queued before the fit finished
+        if self._fit_finished:
+            return
+        self._fit_progress = {key: progress[key] for key in ("evaluations", "chi2", "redchi2", "elapsed")}  # noqa: E501
+        self._fit_progress_pattern = self._fullGridPattern(progress['x'], progress['y'])  # noqa: E501
+        self.fitProgressChanged.emit()
+
+    def _fullGridPattern(self, x, y):
+        """
+        Scatter a pattern calculated on the fitted points only back onto
+        the full x grid of the data set, NaN (not drawn) elsewhere.
+        """
+        if self._fit_points is None or y.shape != self.x.shape:
+            return x, y
+        full_y = np.full(self._fit_grid.shape, np.nan)
+        full_y[self._fit_points] = y
+        return self._fit_grid, full_y
+
     def _setFitResults(self, res):
         if self.fit_thread.is_alive():
             self.fit_thread.join()
+        if isinstance(res, FitResult):
+            try:
+                self._applyProcessFitResults(res)
+            except ValueError as ex:
+                self._setFitResultsFailed(str(ex))
+                return
         self._fit_results = {
             "success": res.success,
             "nvarys":  res.n_pars,
             "GOF":     float(res.goodness_of_fit),
             "redchi2": float(res.reduced_chi)
         }
+        self._pre_fit_snapshot = []
+        self._fit_finished = True
+        self.fitFinished.emit()
+        # must reinstantiate the thread object
+        self.fit_thread = self._newFitThread()
+
+    def _setFitResultsFailed(self, reason):
+        if self.fit_thread.is_alive():
+            self.fit_thread.join()
+        print(f"+ Fitting {reason}" if reason == 'cancelled' else f"+ Fitting failed: {reason}")  # noqa: E501
+        self._restorePreFitSnapshot()
+        self._fit_results = self._defaultFitResults()
+        self._fit_results['success'] = reason if reason == 'cancelled' else 'failed'
         self._fit_finished = True
         self.fitFinished.emit()
         # must reinstantiate the thread object
-        self.fit_thread = Thread(target=self.fit_threading)
+        self.fit_thread = self._newFitThread()
+
+    def stopFit(self):
+        """
+        Ask the running fit to stop. The worker leaves the minimizer at
+        its next function evaluation and the parameters are restored.
+        """
+        if self._fit_finished or not self.fit_thread.is_alive():
+            return
+        self._progress_monitor.requestStop()
+        self._fit_process_pool.requestStop()
+
+    def fitMode(self):
+        return self._fit_mode
 
-    def fit(self, data):
+    def setFitMode(self, mode: str):
+        if mode not in self.fit_modes:
+            raise ValueError(f'Unknown fit mode: {mode}')
+        if mode == self._fit_mode or self.fit_thread.is_alive():
+            return
+        self._fit_mode = mode
+        self.fit_thread = self._newFitThread()
+        if mode == 'thread':
+            self._fit_process_pool.shutdown()
+        self.fitModeChanged.emit()
+
+    def _takePreFitSnapshot(self):
+        self._pre_fit_stack_enabled = borg.stack.enabled
+        self._pre_fit_snapshot = [(par, par.raw_value, par.error)
+                                  for par in self.fitter.fit_object.get_fit_parameters()]  # noqa: E501
+
+    def _restorePreFitSnapshot(self):
+        """
+        Put the parameters back to their values before the fit. The
+        changes, if any, are recorded as a single undo/redo step.
+        """
+        # The minimizer disables the stack while fitting
+        borg.stack.enabled = self._pre_fit_stack_enabled
+        changed = [(par, value, error) for par, value, error in self._pre_fit_snapshot
+                   if par.raw_value != value]
+        if changed:
+            stack_enabled = borg.stack.enabled
+            if stack_enabled:
+                borg.stack.beginMacro('Fitting cancelled')
+            try:
+                for par, value, error in changed:
+                    par.value = value
+                    par.error = error
+            finally:
+                if stack_enabled:
+                    borg.stack.endMacro()
+        self._pre_fit_snapshot = []
+
+    def _applyProcessFitResults(self, res):
+        """
+        Set the values fitted in the worker process. The free parameters
+        are matched by their order, as a single undo/redo step.
+        """
+        pars = [par for par, _, _ in self._pre_fit_snapshot]
+        names = [name for name, _, _ in res.parameters]
+        if names != [par.name for par in pars]:
+            raise ValueError('Fitted parameters do not match the sample')
+        stack_enabled = borg.stack.enabled
+        if stack_enabled:
+            borg.stack.beginMacro('Fitting routine')
+        try:
+            for par, (_, value, error) in zip(pars, res.parameters):
+                par.value = value
+                par.error = error
+        finally:
+            if stack_enabled:
+                borg.stack.endMacro()
+
+    def fit(self, data, experiment_id=None):
+        """
+        Fit the sample to the experiment `experiment_id` of the DataStore
+        `data`, by default to its current experiment.
+        """
+        if self.fit_thread.is_alive():
+            return
         self.data = data
         self.minimizer_name = self._current_minimizer_method_name
-        if not self.fit_thread.is_alive():
-            self.is_fitting_now = True
-            self.fit_thread.start()
-
-    ########### QTHREADS #################
-    # def fit_qthreads(self, data, minimizer_name):
-    #     # if running, stop the thread
-    #     if not self._fit_finished:
-    #         self.onStopFit()
-    #         borg.stack.endMacro()  # need this to close the undo stack properly
-    #         return
-
-    #     self._fit_finished = False
-    #     self.fitStarted.emit()
-    #     exp_data = data.experiments[0]
-
-    #     x = exp_data.x
-    #     y = exp_data.y
-    #     weights = 1 / exp_data.e
-    #     method = minimizer_name
-
-    #     args = (x, y)
-    #     kwargs = {"weights": weights, "method": method}
-    #     self._fitter_thread = Fitter(self.parent, self.fitter, 'fit', *args, **kwargs)  # noqa: E501
-    #     self._fitter_thread.finished.connect(self._setFitResults)
-    #     self._fitter_thread.setTerminationEnabled(True)
-    #     self._fitter_thread.failed.connect(self._setFitResultsFailed)
-    #     self._fitter_thread.start()
-    # def _setFitResultsFailed(self, res):
-    #     self.finishFitting()
-
-    # def finishFitting(self):
-    #     self._fit_finished = True
-    #     self.fitFinished.emit()
-
-    # def onStopFit(self):
-    #     """
-    #     Slot for thread cancelling and reloading parameters
-    #     """
-    #     self._fitter_thread.terminate()
-    #     self._fitter_thread.wait()
-    #     self._fitter_thread = None
-
-    #     self._fit_results['success'] = 'cancelled'
-    #     self._fit_results['nvarys'] = None
-    #     self._fit_results['GOF'] = None
-    #     self._fit_results['redchi2'] = None
-    #     self._setFitResultsFailed("Fitting stopped")
-    # def setFitFinished(self, fit_finished: bool):
-    #     if self._fit_finished == fit_finished:
-    #         return
-    #     self._fit_finished = fit_finished
+
+        exp_data = data.currentExperiment if experiment_id is None else data.byId(experiment_id)  # noqa: E501
+        # Only the points in the fit range and out of the excluded regions
+        # are passed on, so the calculator is evaluated on them only. The
+        # arrays are validated and cached by the data set.
+        self.x, self.y, self.weights = exp_data.fitArrays()
+        self._fit_grid = exp_data.x
+        self._fit_points = exp_data.fitPoints()
+
+        self._fit_finished = False
+        self._fit_progress = self._defaultFitProgress()
+        self._fit_progress_pattern = None
+        self.fitProgressChanged.emit()
+        self.fitStarted.emit()
+
+        self._takePreFitSnapshot()
+        self._progress_monitor.resetStop()
+        if self._fit_mode == 'process':
+            sample = self.fitter.fit_object
+            self._fit_process_args = (sample.as_dict(skip=['interface']),
+                                      sample.interface.current_interface_name,
+                                      self.fitter.current_engine.name,
+                                      self.minimizer_name,
+                                      self.x, self.y, self.weights)
+        else:
+            self._progress_monitor.start(self.x, self.y, self.weights, len(self._pre_fit_snapshot))  # noqa: E501
+        self.is_fitting_now = True
+        self.fit_thread.start()
 
     def currentMinimizerIndex(self):
         current_name = self.fitter.current_engine.name
@@ -9,8 +9,11 @@ from easyDiffractionApp.Logic.State import StateLogic
 from easyDiffractionApp.Logic.Fitter import FitterLogic as FitterLogic
 from easyDiffractionApp.Logic.Stack import StackLogic
 from easyDiffractionApp.Logic.Charts import ChartsLogic
+from easyDiffractionApp.Logic.UpdateScheduler import UpdateScheduler
+from easyDiffractionApp.Logic.SignalTracer import tracer
 
 
+@tracer.traceHandlers
 class LogicController(QObject):
     parametersChanged = Signal()
     phaseAdded = Signal()
@@ -23,6 +26,7 @@ class LogicController(QObject):
 
         self.initialize()
         self.mapSignals()
+        self.watchSignals()
 
     def initialize(self):
         # initialize various logic components
@@ -49,26 +53,43 @@ class LogicController(QObject):
         # communication between logic and proxy notifiers
         self.fitLogic.fitFinished.connect(self.onFitFinished)
         self.fitLogic.fitStarted.connect(self.onFitStarted)
+        self.fitLogic.fitProgressChanged.connect(self.onFitProgressChanged)
+
+        # parameters table structure (rows, labels) changes
+        self.phaseAdded.connect(self.state.invalidateParametersIndex)
+        self.proxy.structureParametersChanged.connect(self.state.invalidateParametersIndex)
+
+        # CIF blocks of the phases, before the refreshes connected below
+        self.parametersChanged.connect(self.state.invalidatePhasesCif)
+        self.phaseAdded.connect(self.state.invalidatePhasesCif)
+        self.proxy.structureParametersChanged.connect(self.state.invalidatePhasesCif)
 
         # background logic
         self._background_proxy = BackgroundProxy(self)
-        self._background_proxy.asObjChanged.connect(self.proxy._onParametersChanged)
+
+        # refreshes triggered by parameter changes, in dependency order:
+        # models of the sample first, then tables, calculated data and views
+        self.updateScheduler = UpdateScheduler(self)
+        self.updateScheduler.register('structure', self.proxy._onStructureParametersChanged)  # noqa: E501
+        self.updateScheduler.register('pattern', self.proxy._onPatternParametersChanged)  # noqa: E501
+        self.updateScheduler.register('instrument', self.proxy._onInstrumentParametersChanged)  # noqa: E501
+        self.updateScheduler.register('background', self._background_proxy.onAsObjChanged)  # noqa: E501
+        self.updateScheduler.register('parameters', self.proxy._onParametersChanged)
+        self.updateScheduler.register('calculated', self.state._updateCalculatedData)
+        self.updateScheduler.register('structureView', self.chartsLogic._onStructureViewChanged)  # noqa: E501
+        self.updateScheduler.register('undoRedo', self.proxy.undoRedoChanged.emit)
+
+        self._background_proxy.asObjChanged.connect(self.state.invalidateParametersIndex)
         self._background_proxy.asObjChanged.connect(self.state._sample.set_background)
-        self._background_proxy.asObjChanged.connect(self.state._updateCalculatedData)
-        self._background_proxy.asXmlChanged.connect(self.updateChartBackground)
+        self._background_proxy.asObjChanged.connect(self.onBackgroundChanged)
+        self._background_proxy.asModelChanged.connect(self.updateChartBackground)
 
         # parameters slots
-        self.parametersChanged.connect(self.proxy._onParametersChanged)
-        self.parametersChanged.connect(self.state._updateCalculatedData)
-        self.parametersChanged.connect(self.chartsLogic._onStructureViewChanged)
-        self.parametersChanged.connect(self.proxy._onStructureParametersChanged)
-        self.parametersChanged.connect(self.proxy._onPatternParametersChanged)
-        self.parametersChanged.connect(self.proxy._onInstrumentParametersChanged)
-        self.parametersChanged.connect(self._background_proxy.onAsObjChanged)
-        self.parametersChanged.connect(self.proxy.undoRedoChanged)
-
-        # Screen recorder
-        self._screen_recorder = self.recorder()
+        self.parametersChanged.connect(self.onParametersChanged)
+
+        # Screen recorder, created on first use as it imports mss and cv2
+        self._screen_recorder = None
+        self._screen_recorder_created = False
 
     def mapSignals(self):
         """
@@ -77,7 +98,7 @@ class LogicController(QObject):
         """
         self.state.projectCreatedChanged.connect(self.proxy.projectCreatedChanged)
         self.state.undoRedoChanged.connect(self.proxy.undoRedoChanged)
-        self.state.parametersChanged.connect(self.proxy._onParametersChanged)
+        self.state.parametersChanged.connect(self.onParametersTableChanged)
         self.state.experimentLoadedChanged.connect(self.proxy.experimentLoadedChanged)
         self.state.experimentSkippedChanged.connect(self.proxy.experimentSkippedChanged)
         self.state.phasesEnabled.connect(self.proxy.phasesEnabled)
@@ -92,6 +113,18 @@ class LogicController(QObject):
         self.state.currentMinimizerMethodIndex.connect(self.currentMinimizerMethodIndex)
 
         self.fitLogic.currentMinimizerChanged.connect(self.proxy.currentMinimizerChanged)
+        self.fitLogic.fitModeChanged.connect(self.proxy.fitModeChanged)
+
+    def watchSignals(self):
+        """
+        Signals recorded by the signal tracer, when enabled
+        """
+        tracer.watch(self.proxy, 'PyQmlProxy')
+        tracer.watch(self, 'LogicController')
+        tracer.watch(self.state, 'StateLogic')
+        tracer.watch(self.fitLogic, 'FitterLogic')
+        tracer.watch(self._background_proxy, 'BackgroundProxy')
+        tracer.watch(self.chartsLogic._plotting_1d_proxy, 'Plotting1dProxy')
 
     def initializeBorg(self):
         self.stackLogic.initializeBorg()
@@ -100,6 +133,13 @@ class LogicController(QObject):
 #  MULTI-STATE UTILITY METHODS
 ###############################################################################
 
+    @property
+    def screenRecorder(self):
+        if not self._screen_recorder_created:
+            self._screen_recorder = self.recorder()
+            self._screen_recorder_created = True
+        return self._screen_recorder
+
     def recorder(self):
         rec = None
         try:
@@ -124,9 +164,26 @@ class LogicController(QObject):
                                 self._background_proxy.asObj.x_sorted_points,
                                 self._background_proxy.asObj.y_sorted_points)
 
+    def onParametersChanged(self):
+        self.updateScheduler.schedule('structure', 'pattern', 'instrument', 'background',  # noqa: E501
+                                      'parameters', 'calculated', 'structureView', 'undoRedo')  # noqa: E501
+
+    def onParametersTableChanged(self):
+        self.updateScheduler.schedule('parameters')
+
+    def onBackgroundChanged(self):
+        self.updateScheduler.schedule('parameters', 'calculated')
+
     def onFitStarted(self):
         self.proxy.fitFinishedNotify.emit()
 
+    def onFitProgressChanged(self):
+        self.proxy.fitProgressChanged.emit()
+        if self.fitLogic._fit_progress_pattern is None:
+            return
+        x, y = self.fitLogic._fit_progress_pattern
+        self.chartsLogic._plotting_1d_proxy.setCalculatedData(x, y)
+
     def onFitFinished(self):
         self.proxy.fitResultsChanged.emit()
         self.proxy.fitFinishedNotify.emit()
@@ -151,7 +208,7 @@ class LogicController(QObject):
 
         self.proxy.experimentDataChanged.emit()
         self.proxy.projectInfoAsJson['experiments'] = \
-            self.state._data.experiments[0].name
+            self.state._data.currentExperiment.name
         self.proxy.projectInfoChanged.emit()
 
     def _onPhaseAdded(self):
@@ -0,0 +1,105 @@
+from easyCore import np
+
+
+def updatePhasesInPlace(phases, new_phases):
+    """
+    Copy the content of `new_phases`, e.g. just parsed from an edited
+    CIF, into the existing `phases`, changing only what differs, so that
+    parameter objects, their ids and fit bindings survive the edit.
+
+    Atoms may be removed and new atoms appended. Return None, without
+    touching `phases`, if the edit cannot be applied in place (different
+    number of phases, reordered atoms, changed ADP type, ...): the caller
+    should then replace the phases altogether. Otherwise return True if
+    the set of parameters has changed (atoms added or removed, phase
+    renamed) and False if only values have.
+    """
+    if len(phases) != len(new_phases):
+        return None
+
+    plans = []
+    for phase, new_phase in zip(phases, new_phases):
+        plan = _atomsPlan(phase, new_phase)
+        if plan is None:
+            return None
+        plans.append(plan)
+
+    structure_changed = False
+    for phase, new_phase, (removed, added) in zip(phases, new_phases, plans):
+        if phase.name != new_phase.name:
+            phase.name = new_phase.name
+            structure_changed = True
+        # The space group first: switching it constrains the cell
+        new_space_group = new_phase.spacegroup.space_group_HM_name.raw_value
+        if phase.spacegroup.space_group_HM_name.raw_value != new_space_group:
+            phase.spacegroup.space_group_HM_name = new_space_group
+        _updateParameters(phase.cell, new_phase.cell)
+        for label in removed:
+            del phase.atoms[label]
+        for atom in phase.atoms:
+            new_atom = new_phase.atoms[atom.label.raw_value]
+            _updateValue(atom.specie, new_atom.specie)
+            _updateParameters(atom, new_atom)
+        for label in added:
+            phase.add_atom(new_phase.atoms[label])
+        structure_changed = structure_changed or bool(removed or added)
+    return structure_changed
+
+
+def _atomsPlan(phase, new_phase):
+    """
+    Return the labels of the atoms to remove and to append, or None if
+    the atoms of `new_phase` are not the kept atoms, in their order,
+    followed by the new ones, or if a kept atom has other parameters
+    (e.g. another ADP type) and so cannot be updated in place.
+    """
+    labels = list(phase.atoms.atom_labels)
+    new_labels = list(new_phase.atoms.atom_labels)
+    if len(set(labels)) != len(labels) or len(set(new_labels)) != len(new_labels):
+        return None
+
+    new_label_set = set(new_labels)
+    kept = [label for label in labels if label in new_label_set]
+    if new_labels[:len(kept)] != kept:
+        return None
+    for label in kept:
+        if not _sameParameterNames(phase.atoms[label], new_phase.atoms[label]):
+            return None
+    if not _sameParameterNames(phase.cell, new_phase.cell):
+        return None
+
+    removed = [label for label in labels if label not in new_label_set]
+    added = new_labels[len(kept):]
+    return removed, added
+
+
+def _sameParameterNames(obj, new_obj):
+    names = [par.name for par in obj.get_parameters()]
+    new_names = [par.name for par in new_obj.get_parameters()]
+    return names == new_names
+
+
+def _updateParameters(obj, new_obj):
+    """
+    Copy the value, error, fixed flag and bounds of the parameters.
+    """
+    for par, new_par in zip(obj.get_parameters(), new_obj.get_parameters()):
+        bounds_changed = par.min != new_par.min or par.max != new_par.max
+        if bounds_changed:
+            # Open the bounds, so that the new value is never out of the
+            # old bounds, nor the old value out of the new ones
+            par.min = -np.inf
+            par.max = np.inf
+        _updateValue(par, new_par)
+        if bounds_changed:
+            par.min = new_par.min
+            par.max = new_par.max
+        if par.error != new_par.error:
+            par.error = new_par.error
+        if par.fixed != new_par.fixed:
+            par.fixed = new_par.fixed
+
+
+def _updateValue(obj, new_obj):
+    if obj.raw_value != new_obj.raw_value:
+        obj.value = new_obj.raw_value
@@ -0,0 +1,158 @@
+import csv
+import json
+import functools
+from collections import deque
+from time import perf_counter
+
+
+class Profiler():
+    """
+    Timings of named hot paths, e.g. the refreshes run on parameter
+    changes.
+
+    For every name the call count and total time are kept, together with
+    the durations of the last `capacity` calls in a ring buffer, from
+    which the mean and the 95th percentile are computed. When disabled,
+    timed() and profiled() cost a flag check only.
+    """
+
+    def __init__(self, capacity=1000, enabled=False):
+        self.capacity = capacity
+        self.enabled = enabled
+        # Print every timing, as the former ad-hoc timeit prints did
+        self.verbose = False
+        # Incremented on every change of the timings, for polling views
+        self.version = 0
+        self._records = {}
+
+    # Public
+
+    def timed(self, name: str):
+        """
+        Context manager timing the enclosed block under `name`.
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def profiled(self, name: str = None):
+        """
+        Decorator timing every call of the function, under `name` or, by
+        default, the qualified name of the function.
+        """
+        def decorator(func):
+            record_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start_time = perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(record_name, perf_counter() - start_time)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, duration: float):
+        record = self._records.get(name)
+        if record is None:
+            record = self._records[name] = _Record(self.capacity)
+        record.add(duration)
+        self.version += 1
+        if self.verbose:
+            print("+ {0}: {1:.3f} s".format(name, duration))
+
+    def stats(self):
+        """
+        Return the timings per name, most time consuming first. Durations
+        are in seconds; mean and p95 are over the calls in the buffer.
+        """
+        stats = [record.stats(name) for name, record in self._records.items()]
+        stats.sort(key=lambda item: item['total'], reverse=True)
+        return stats
+
+    def reset(self):
+        self._records.clear()
+        self.version += 1
+
+    def dumpJson(self, file_path):
+        with open(file_path, 'w') as file:
+            json.dump(self.stats(), file, indent=4)
+
+    def dumpCsv(self, file_path):
+        with open(file_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=_Record.fields)
+            writer.writeheader()
+            writer.writerows(self.stats())
+
+    def dump(self, file_path):
+        """
+        Save the timings as CSV or, for any other extension, as JSON.
+        """
+        if str(file_path).lower().endswith('.csv'):
+            self.dumpCsv(file_path)
+        else:
+            self.dumpJson(file_path)
+
+
+class _Record():
+    fields = ['name', 'count', 'total', 'mean', 'p95', 'max', 'last']
+
+    __slots__ = ('count', 'total', 'durations')
+
+    def __init__(self, capacity):
+        self.count = 0
+        self.total = 0.0
+        self.durations = deque(maxlen=capacity)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.durations.append(duration)
+
+    def stats(self, name):
+        durations = sorted(self.durations)
+        p95_index = max(int(round(0.95 * len(durations))) - 1, 0)
+        return {
+            'name': name,
+            'count': self.count,
+            'total': self.total,
+            'mean': sum(durations) / len(durations),
+            'p95': durations[p95_index],
+            'max': durations[-1],
+            'last': self.durations[-1]
+        }
+
+
+class _Timer():
+    __slots__ = ('_profiler', '_name', '_start_time')
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start_time = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.record(self._name, perf_counter() - self._start_time)
+        return False
+
+
+class _NullTimer():
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+# Process-wide profiler of the application
+profiler = Profiler()
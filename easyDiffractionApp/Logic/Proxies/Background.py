@@ -1,25 +1,27 @@
 __author__ = 'github.com/AndrewSazonov'
 __version__ = '0.0.1'
 
-import timeit
-from dicttoxml import dicttoxml
-
 from PySide2.QtCore import QObject, Property, Signal, Slot
 
 from easyCore import np
 from easyDiffractionLib.Elements.Backgrounds.Point import PointBackground, BackgroundPoint
 
+from easyDiffractionApp.Logic.DisplayModels.DictListModel import DictListModel
+from easyDiffractionApp.Logic.Profiling import profiler
+from easyDiffractionApp.Logic.SignalTracer import tracer
+
 
+@tracer.traceHandlers
 class BackgroundProxy(QObject):
 
     asObjChanged = Signal('QVariant')
-    asXmlChanged = Signal()
+    asModelChanged = Signal()
     dummySignal = Signal()
 
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
-        self._background_as_xml = ""
+        self._background_as_model = DictListModel(['name', 'x', 'y'], self)
         self.asObjChanged.connect(self.onAsObjChanged)
         self._bg_types = {
             'point': {
@@ -38,10 +40,9 @@ class BackgroundProxy(QObject):
         #print("+ backgroundAsObj")
         return self._background_as_obj
 
-    @Property(str, notify=asXmlChanged)
-    def asXml(self):
-        #print("+ backgroundAsXml")
-        return self._background_as_xml
+    @Property('QVariant', notify=dummySignal)
+    def asModel(self):
+        return self._background_as_model
 
     @Slot()
     def setDefaultPoints(self):
@@ -102,17 +103,15 @@ class BackgroundProxy(QObject):
 
     def onAsObjChanged(self):
         print(f"***** onAsObjChanged")
-        self._setAsXml()
+        self._setAsModel()
 
-    def _setAsXml(self):
-        start_time = timeit.default_timer()
+    def _setAsModel(self):
         if self._background_as_obj is None:
-            self._background_as_xml = dicttoxml({}, attr_type=False).decode()
+            self._background_as_model.clear()
         else:
-            background = np.array([item.as_dict() for item in self._background_as_obj])
-            point_index = np.array([item.x.raw_value for item in self._background_as_obj]).argsort()
-            self._background_as_xml = dicttoxml(background[point_index], attr_type=False).decode()
-
-            print("+ _setAsXml: {0:.3f} s".format(timeit.default_timer() - start_time))
+            with profiler.timed('BackgroundProxy._setAsModel'):
+                background = [item.as_dict() for item in self._background_as_obj]
+                point_index = np.array([item.x.raw_value for item in self._background_as_obj]).argsort()
+                self._background_as_model.setItems([background[index] for index in point_index])
 
-        self.asXmlChanged.emit()
+        self.asModelChanged.emit()
@@ -1,13 +1,20 @@
 __author__ = 'github.com/andrewsazonov'
 __version__ = '0.0.1'
 
+from collections import OrderedDict
+
 import numpy as np
 
-from PySide2.QtCore import QObject, Qt, QPointF, Signal, Slot, Property
-from PySide2.QtGui import QImage, QBrush
+from PySide2.QtCore import QObject, QPointF, Signal, Slot, Property
+from PySide2.QtGui import QImage, QBrush, QColor
 from PySide2.QtQml import QJSValue
 from PySide2.QtCharts import QtCharts
 
+from easyDiffractionApp.Logic.Downsampling import MinMaxPyramid
+from easyDiffractionApp.Logic.Profiling import profiler
+from easyDiffractionApp.Logic.SignalTracer import tracer
+
+@tracer.traceHandlers
 class Plotting1dProxy(QObject):
     """
     A proxy class to interact between the QML plot and Python datasets.
@@ -18,6 +25,9 @@ class Plotting1dProxy(QObject):
     # Lib
     currentLibChanged = Signal()
 
+    # Level of detail
+    fullResolutionChanged = Signal()
+
     # Ranges
     experimentPlotRangesObjChanged = Signal()
     analysisPlotRangesObjChanged = Signal()
@@ -30,6 +40,7 @@ class Plotting1dProxy(QObject):
     bokehBackgroundDataObjChanged = Signal()
 
     qtchartsMeasuredDataObjChanged = Signal()
+    qtchartsExperimentMeasuredDataObjChanged = Signal()
     qtchartsCalculatedDataObjChanged = Signal()
     qtchartsDifferenceDataObjChanged = Signal()
     qtchartsBraggDataObjChanged = Signal()
@@ -43,6 +54,24 @@ class Plotting1dProxy(QObject):
         self._current_lib = 'bokeh'
         self.currentLibChanged.connect(self.onCurrentLibChanged)
 
+        # Level of detail: min/max decimation of the QtCharts series to about
+        # 2 points per pixel. The bokeh data sources are kept at full
+        # resolution, as bokeh zooms on the JS side. The pixel count and the
+        # visible x range are kept per chart, as the experiment and the
+        # analysis charts are sized and zoomed independently
+        self._charts = ['analysis', 'experiment']
+        self._full_resolution = False
+        self._pixel_counts = {chart: 2000 for chart in self._charts}
+        self._visible_ranges = {chart: None for chart in self._charts}
+        self._measured_pyramid = MinMaxPyramid()
+        self._calculated_pyramid = MinMaxPyramid()
+        self._difference_pyramid = MinMaxPyramid()
+        self.fullResolutionChanged.connect(self.onFullResolutionChanged)
+
+        # Texture brushes, e.g. of the Bragg ticks, least recently used last
+        self._brushes = OrderedDict()
+        self._max_brushes = 64
+
         # Ranges
         self._measured_min_x = 999999
         self._measured_max_x = -999999
@@ -64,15 +93,19 @@ class Plotting1dProxy(QObject):
         self._measured_xarray = np.empty(0)
         self._measured_yarray = np.empty(0)
         self._measured_syarray = np.empty(0)
-        self._measured_yarray_upper = np.empty(0)
-        self._measured_yarray_lower = np.empty(0)
 
         self._calculated_xarray = np.empty(0)
         self._calculated_yarray = np.empty(0)
 
         self._difference_yarray = np.empty(0)
-        self._difference_yarray_upper = np.empty(0)
-        self._difference_yarray_lower = np.empty(0)
+
+        # Derived series: reused output buffers, recomputed only when the
+        # version of their inputs changes
+        self._measured_version = 0
+        self._calculated_version = 0
+        self._difference_key = None
+        self._difference_buffer = np.empty(0)
+        self._scratch_buffer = np.empty(0)
 
         self._bragg_xarray = np.empty(0)
         self._bragg_yarray = np.empty(0)
@@ -95,6 +128,7 @@ class Plotting1dProxy(QObject):
         self._bokeh_background_data_obj = {}
 
         self._qtcharts_measured_data_obj = {}
+        self._qtcharts_experiment_measured_data_obj = {}
         self._qtcharts_calculated_data_obj = {}
         self._qtcharts_difference_data_obj = {}
         self._qtcharts_bragg_data_obj = {}
@@ -123,15 +157,19 @@ class Plotting1dProxy(QObject):
         self._measured_xarray = np.empty(0)
         self._measured_yarray = np.empty(0)
         self._measured_syarray = np.empty(0)
-        self._measured_yarray_upper = np.empty(0)
-        self._measured_yarray_lower = np.empty(0)
 
         self._calculated_xarray = np.empty(0)
         self._calculated_yarray = np.empty(0)
 
         self._difference_yarray = np.empty(0)
-        self._difference_yarray_upper = np.empty(0)
-        self._difference_yarray_lower = np.empty(0)
+
+        # Derived series: reused output buffers, recomputed only when the
+        # version of their inputs changes
+        self._measured_version = 0
+        self._calculated_version = 0
+        self._difference_key = None
+        self._difference_buffer = np.empty(0)
+        self._scratch_buffer = np.empty(0)
 
         self._bragg_xarray = np.empty(0)
         self._bragg_yarray = np.empty(0)
@@ -142,6 +180,12 @@ class Plotting1dProxy(QObject):
         self._background_xarray = np.empty(0)
         self._background_yarray = np.empty(0)
 
+        # Level of detail
+        self._visible_ranges = {chart: None for chart in self._charts}
+        self._measured_pyramid.setData(self._measured_xarray, self._measured_yarray)
+        self._calculated_pyramid.setData(self._calculated_xarray, self._calculated_yarray)
+        self._difference_pyramid.setData(self._measured_xarray, self._difference_yarray)
+
     def clearFrontendState(self):
 
         # Ranges for GUI
@@ -156,6 +200,7 @@ class Plotting1dProxy(QObject):
         self._bokeh_background_data_obj = {}
 
         self._qtcharts_measured_data_obj = {}
+        self._qtcharts_experiment_measured_data_obj = {}
         self._qtcharts_calculated_data_obj = {}
         self._qtcharts_difference_data_obj = {}
         self._qtcharts_bragg_data_obj = {}
@@ -173,6 +218,7 @@ class Plotting1dProxy(QObject):
         self.bokehBackgroundDataObjChanged.emit()
 
         self.qtchartsMeasuredDataObjChanged.emit()
+        self.qtchartsExperimentMeasuredDataObjChanged.emit()
         self.qtchartsCalculatedDataObjChanged.emit()
         self.qtchartsDifferenceDataObjChanged.emit()
         self.qtchartsBraggDataObjChanged.emit()
@@ -196,6 +242,39 @@ class Plotting1dProxy(QObject):
         self._current_lib = lib
         self.currentLibChanged.emit()
 
+    # Level of detail for GUI
+    @Property(bool, notify=fullResolutionChanged)
+    def fullResolution(self):
+        return self._full_resolution
+
+    @fullResolution.setter
+    def fullResolution(self, full_resolution):
+        if self._full_resolution == full_resolution:
+            return
+        self._full_resolution = full_resolution
+        self.fullResolutionChanged.emit()
+
+    @Slot(str, int)
+    def setPixelCount(self, chart, pixel_count):
+        if chart not in self._pixel_counts or self._pixel_counts[chart] == pixel_count:  # noqa: E501
+            return
+        self._pixel_counts[chart] = pixel_count
+        self.onLevelOfDetailChanged(chart)
+
+    @Slot(str, float, float)
+    def setVisibleRange(self, chart, min_x, max_x):
+        if chart not in self._visible_ranges or self._visible_ranges[chart] == (min_x, max_x):  # noqa: E501
+            return
+        self._visible_ranges[chart] = (min_x, max_x)
+        self.onLevelOfDetailChanged(chart)
+
+    @Slot(str)
+    def resetVisibleRange(self, chart):
+        if self._visible_ranges.get(chart) is None:
+            return
+        self._visible_ranges[chart] = None
+        self.onLevelOfDetailChanged(chart)
+
     # Ranges for GUI
     @Property('QVariant', notify=experimentPlotRangesObjChanged)
     def experimentPlotRangesObj(self):
@@ -230,6 +309,10 @@ class Plotting1dProxy(QObject):
     def qtchartsMeasuredDataObj(self):
         return self._qtcharts_measured_data_obj
 
+    @Property('QVariant', notify=qtchartsExperimentMeasuredDataObjChanged)
+    def qtchartsExperimentMeasuredDataObj(self):
+        return self._qtcharts_experiment_measured_data_obj
+
     @Property('QVariant', notify=qtchartsCalculatedDataObjChanged)
     def qtchartsCalculatedDataObj(self):
         return self._qtcharts_calculated_data_obj
@@ -260,23 +343,20 @@ class Plotting1dProxy(QObject):
 
     @Slot(int, str, result='QBrush')
     def verticalLine(self, size, color):
-        width = size
-        height = size
-        textureImage = QImage(width, height, QImage.Format_ARGB32)
-        # Transparent background
-        for row in range(height):
-            for column in range(width):
-                textureImage.setPixelColor(column, row, Qt.transparent)
-        # Vertical line
-        for row in range(height):
-            column = int(width/2)
-            textureImage.setPixelColor(column, row, color)
-        brush = QBrush()
-        brush.setTextureImage(textureImage)
+        key = ('verticalLine', size, color)
+        brush = self._brushes.get(key)
+        if brush is not None:
+            self._brushes.move_to_end(key)
+            return brush
+        brush = Plotting1dProxy.verticalLineBrush(size, color)
+        self._brushes[key] = brush
+        if len(self._brushes) > self._max_brushes:
+            self._brushes.popitem(last=False)
         return brush
 
     # Public: Python backend
 
+    @profiler.profiled()
     def setMeasuredData(self, xarray, yarray, syarray=None):
         self._setMeasuredDataArrays(xarray, yarray, syarray)
         self._setMeasuredDataRanges()
@@ -286,6 +366,7 @@ class Plotting1dProxy(QObject):
         if self.currentLib == 'qtcharts':
             self._setQtChartsMeasuredDataObj()
 
+    @profiler.profiled()
     def setCalculatedData(self, xarray, yarray):
         self._setCalculatedDataArrays(xarray, yarray)
         self._setCalculatedDataRanges()
@@ -293,13 +374,18 @@ class Plotting1dProxy(QObject):
         self._setBokehCalculatedDataObj()
         if self.currentLib == 'qtcharts':
             self._setQtChartsCalculatedDataObj()
-        if self._measured_xarray.size:
-            self._setDifferenceDataArrays()
-            self._setDifferenceDataRanges()
-            self._setBokehDifferenceDataObj()
-            if self.currentLib == 'qtcharts':
-                self._setQtChartsDifferenceDataObj()
+        if not self._measured_xarray.size:
+            return
+        if not self._sameGrids():
+            self._clearDifferenceData()
+            return
+        self._setDifferenceDataArrays()
+        self._setDifferenceDataRanges()
+        self._setBokehDifferenceDataObj()
+        if self.currentLib == 'qtcharts':
+            self._setQtChartsDifferenceDataObj()
 
+    @profiler.profiled()
     def setBraggData(self, xarray, harray, karray, larray):
         self._setBraggDataArrays(xarray, harray, karray, larray)
         self._setBokehBraggDataObj()
@@ -322,26 +408,71 @@ class Plotting1dProxy(QObject):
                 self._setQtChartsMeasuredDataObj()
                 self._setQtChartsDifferenceDataObj()
 
+    def onFullResolutionChanged(self):
+        for chart in self._charts:
+            self.onLevelOfDetailChanged(chart)
+
+    def onLevelOfDetailChanged(self, chart):
+        if self.currentLib != 'qtcharts':
+            return
+        if chart == 'experiment':
+            if self._measured_xarray.size:
+                self._setQtChartsExperimentMeasuredDataObj()
+            return
+        self._setQtChartsCalculatedDataObj()
+        if self._measured_xarray.size:
+            self._setQtChartsAnalysisMeasuredDataObj()
+            self._setQtChartsDifferenceDataObj()
+
     # Private: data array setters
 
+    # The data arrays are kept as read-only views of the arrays given, e.g.
+    # the columns of a DataSet1D, not as copies. The upper and lower error
+    # band series go through the scratch buffer for bokeh and are computed
+    # for the visible points only for QtCharts.
+
     def _setMeasuredDataArrays(self, xarray, yarray, syarray=None):
-        self._measured_xarray = xarray
-        self._measured_yarray = yarray
+        self._measured_xarray = Plotting1dProxy.readOnlyView(xarray)
+        self._measured_yarray = Plotting1dProxy.readOnlyView(yarray)
         if syarray is not None:
-            self._measured_syarray = syarray
+            self._measured_syarray = Plotting1dProxy.readOnlyView(syarray)
         else:
-            self._measured_syarray = np.ones_like(yarray)
-        self._measured_yarray_upper = np.add(self._measured_yarray, self._measured_syarray)
-        self._measured_yarray_lower = np.subtract(self._measured_yarray, self._measured_syarray)
+            self._measured_syarray = np.broadcast_to(1.0, self._measured_yarray.shape)  # noqa: E501
+        self._measured_pyramid.setData(self._measured_xarray, self._measured_yarray)
+        self._measured_version += 1
+        self._scratch_buffer = Plotting1dProxy.reusedBuffer(self._scratch_buffer, self._measured_yarray.shape)  # noqa: E501
 
     def _setCalculatedDataArrays(self, xarray, yarray):
-        self._calculated_xarray = xarray
-        self._calculated_yarray = yarray
+        self._calculated_xarray = Plotting1dProxy.readOnlyView(xarray)
+        self._calculated_yarray = Plotting1dProxy.readOnlyView(yarray)
+        self._calculated_pyramid.setData(self._calculated_xarray, self._calculated_yarray)
+        self._calculated_version += 1
+
+    def _sameGrids(self):
+        # The difference needs the calculated pattern on the measured grid
+        return (self._calculated_xarray.shape == self._measured_xarray.shape and
+                np.array_equal(self._calculated_xarray, self._measured_xarray))
+
+    def _clearDifferenceData(self):
+        self._difference_key = None
+        self._difference_yarray = np.empty(0)
+        self._difference_pyramid.setData(self._difference_yarray, self._difference_yarray)
+        self._difference_min_y = 0
+        self._difference_max_y = 1
+        self._difference_median_y = 0.5
+        self._bokeh_difference_data_obj = {}
+        self.bokehDifferenceDataObjChanged.emit()
+        self._qtcharts_difference_data_obj = {}
+        self.qtchartsDifferenceDataObjChanged.emit()
 
     def _setDifferenceDataArrays(self):
-        self._difference_yarray = np.subtract(self._measured_yarray, self._calculated_yarray)
-        self._difference_yarray_upper = np.add(self._difference_yarray, self._measured_syarray)
-        self._difference_yarray_lower = np.subtract(self._difference_yarray, self._measured_syarray)
+        key = (self._measured_version, self._calculated_version)
+        if key == self._difference_key:
+            return
+        self._difference_key = key
+        self._difference_buffer = Plotting1dProxy.reusedBuffer(self._difference_buffer, self._measured_yarray.shape)  # noqa: E501
+        self._difference_yarray = np.subtract(self._measured_yarray, self._calculated_yarray, out=self._difference_buffer)  # noqa: E501
+        self._difference_pyramid.setData(self._measured_xarray, self._difference_yarray)
 
     def _setBraggDataArrays(self, xarray, harray, karray, larray):
         self._bragg_xarray = xarray
@@ -355,12 +486,14 @@ class Plotting1dProxy(QObject):
         self._background_yarray = yarray
 
     def _setBokehMeasuredDataObj(self):
+        yarray = self._measured_yarray
+        syarray = self._measured_syarray
         self._bokeh_measured_data_obj = {
             'x': Plotting1dProxy.aroundX(self._measured_xarray),
-            'y': Plotting1dProxy.aroundY(self._measured_yarray),
-            'sy': Plotting1dProxy.aroundY(self._measured_syarray),
-            'y_upper': Plotting1dProxy.aroundY(self._measured_yarray_upper),
-            'y_lower': Plotting1dProxy.aroundY(self._measured_yarray_lower)
+            'y': Plotting1dProxy.aroundY(yarray),
+            'sy': Plotting1dProxy.aroundY(syarray),
+            'y_upper': Plotting1dProxy.aroundY(np.add(yarray, syarray, out=self._scratch_buffer)),  # noqa: E501
+            'y_lower': Plotting1dProxy.aroundY(np.subtract(yarray, syarray, out=self._scratch_buffer))  # noqa: E501
         }
         self.bokehMeasuredDataObjChanged.emit()
 
@@ -372,11 +505,13 @@ class Plotting1dProxy(QObject):
         self.bokehCalculatedDataObjChanged.emit()
 
     def _setBokehDifferenceDataObj(self):
+        yarray = self._difference_yarray
+        syarray = self._measured_syarray
         self._bokeh_difference_data_obj = {
-            'x': Plotting1dProxy.aroundY(self._measured_xarray),
-            'y': Plotting1dProxy.aroundY(self._difference_yarray),
-            'y_upper': Plotting1dProxy.aroundY(self._difference_yarray_upper),
-            'y_lower': Plotting1dProxy.aroundY(self._difference_yarray_lower)
+            'x': Plotting1dProxy.aroundX(self._measured_xarray),
+            'y': Plotting1dProxy.aroundY(yarray),
+            'y_upper': Plotting1dProxy.aroundY(np.add(yarray, syarray, out=self._scratch_buffer)),  # noqa: E501
+            'y_lower': Plotting1dProxy.aroundY(np.subtract(yarray, syarray, out=self._scratch_buffer))  # noqa: E501
         }
         self.bokehDifferenceDataObjChanged.emit()
 
@@ -398,24 +533,48 @@ class Plotting1dProxy(QObject):
         self.bokehBackgroundDataObjChanged.emit()
 
     def _setQtChartsMeasuredDataObj(self):
-        self._qtcharts_measured_data_obj = {
-            'xy': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._measured_yarray),
-            'xy_upper': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._measured_yarray_upper),
-            'xy_lower': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._measured_yarray_lower)
-        }
+        self._setQtChartsAnalysisMeasuredDataObj()
+        self._setQtChartsExperimentMeasuredDataObj()
+
+    def _setQtChartsAnalysisMeasuredDataObj(self):
+        self._qtcharts_measured_data_obj = self._qtChartsMeasuredDataObj('analysis')
         self.qtchartsMeasuredDataObjChanged.emit()
 
+    def _setQtChartsExperimentMeasuredDataObj(self):
+        self._qtcharts_experiment_measured_data_obj = self._qtChartsMeasuredDataObj('experiment')  # noqa: E501
+        self.qtchartsExperimentMeasuredDataObjChanged.emit()
+
+    def _qtChartsMeasuredDataObj(self, chart):
+        idx = self._visibleIndices(self._measured_pyramid, chart)
+        xarray = self._measured_xarray[idx]
+        yarray = self._measured_yarray[idx]
+        syarray = self._measured_syarray[idx]
+        return {
+            'xy': Plotting1dProxy.arraysToPoints(xarray, yarray),
+            'xy_upper': Plotting1dProxy.arraysToPoints(xarray, yarray + syarray),
+            'xy_lower': Plotting1dProxy.arraysToPoints(xarray, yarray - syarray)
+        }
+
     def _setQtChartsCalculatedDataObj(self):
+        idx = self._visibleIndices(self._calculated_pyramid, 'analysis')
         self._qtcharts_calculated_data_obj = {
-            'xy': Plotting1dProxy.arraysToPoints(self._calculated_xarray, self._calculated_yarray)
+            'xy': Plotting1dProxy.arraysToPoints(self._calculated_xarray[idx], self._calculated_yarray[idx])
         }
         self.qtchartsCalculatedDataObjChanged.emit()
 
     def _setQtChartsDifferenceDataObj(self):
+        if self._difference_yarray.shape != self._measured_xarray.shape:
+            self._qtcharts_difference_data_obj = {}
+            self.qtchartsDifferenceDataObjChanged.emit()
+            return
+        idx = self._visibleIndices(self._difference_pyramid, 'analysis')
+        xarray = self._measured_xarray[idx]
+        yarray = self._difference_yarray[idx]
+        syarray = self._measured_syarray[idx]
         self._qtcharts_difference_data_obj = {
-            'xy': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._difference_yarray),
-            'xy_upper': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._difference_yarray_upper),
-            'xy_lower': Plotting1dProxy.arraysToPoints(self._measured_xarray, self._difference_yarray_lower)
+            'xy': Plotting1dProxy.arraysToPoints(xarray, yarray),
+            'xy_upper': Plotting1dProxy.arraysToPoints(xarray, yarray + syarray),
+            'xy_lower': Plotting1dProxy.arraysToPoints(xarray, yarray - syarray)
         }
         self.qtchartsDifferenceDataObjChanged.emit()
 
@@ -434,13 +593,35 @@ class Plotting1dProxy(QObject):
         }
         self.qtchartsBackgroundDataObjChanged.emit()
 
+    # Private: level of detail
+
+    def _visibleRange(self, chart):
+        # The x axis range set by the chart, else the whole plot range
+        if self._visible_ranges[chart] is not None:
+            return self._visible_ranges[chart]
+        if chart == 'experiment':
+            ranges = self._experiment_plot_ranges_obj
+        else:
+            ranges = self._analysis_plot_ranges_obj
+        return ranges.get('min_x'), ranges.get('max_x')
+
+    def _visibleIndices(self, pyramid, chart):
+        # Full resolution: a slice keeps the arrays as views
+        if self._full_resolution:
+            return slice(None)
+        min_x, max_x = self._visibleRange(chart)
+        return pyramid.indices(min_x, max_x, self._pixel_counts[chart])
+
     # Private: range setters
 
     def _setMeasuredDataRanges(self):
         self._measured_min_x = Plotting1dProxy.arrayMin(self._measured_xarray)
         self._measured_max_x = Plotting1dProxy.arrayMax(self._measured_xarray)
-        self._measured_min_y = Plotting1dProxy.arrayMin(self._measured_yarray_lower)
-        self._measured_max_y = Plotting1dProxy.arrayMax(self._measured_yarray_upper)
+        # The error band limits go through the scratch buffer
+        band = np.subtract(self._measured_yarray, self._measured_syarray, out=self._scratch_buffer)  # noqa: E501
+        self._measured_min_y = Plotting1dProxy.arrayMin(band)
+        band = np.add(self._measured_yarray, self._measured_syarray, out=self._scratch_buffer)  # noqa: E501
+        self._measured_max_y = Plotting1dProxy.arrayMax(band)
 
     def _setCalculatedDataRanges(self):
         self._calculated_min_x = Plotting1dProxy.arrayMin(self._calculated_xarray)
@@ -449,9 +630,13 @@ class Plotting1dProxy(QObject):
         self._calculated_max_y = Plotting1dProxy.arrayMax(self._calculated_yarray)
 
     def _setDifferenceDataRanges(self):
-        self._difference_min_y = Plotting1dProxy.arrayMin(self._difference_yarray_lower)
-        self._difference_max_y = Plotting1dProxy.arrayMax(self._difference_yarray_upper)
-        self._difference_median_y = Plotting1dProxy.arrayMedian(self._difference_yarray)
+        band = np.subtract(self._difference_yarray, self._measured_syarray, out=self._scratch_buffer)  # noqa: E501
+        self._difference_min_y = Plotting1dProxy.arrayMin(band)
+        band = np.add(self._difference_yarray, self._measured_syarray, out=self._scratch_buffer)  # noqa: E501
+        self._difference_max_y = Plotting1dProxy.arrayMax(band)
+        # The median partially sorts its input: a copy in the scratch buffer
+        np.copyto(self._scratch_buffer, self._difference_yarray)
+        self._difference_median_y = Plotting1dProxy.arrayMedian(self._scratch_buffer, overwrite_input=True)  # noqa: E501
 
     def _yAxisMin(self, min_y, max_y):
         return min_y - self._y_axis_range_extension * max_y
@@ -510,21 +695,49 @@ class Plotting1dProxy(QObject):
 
     @staticmethod
     def arrayMin(array):
-        if array.size:
-            return np.amin(array).item()
-        return 0
+        # fmin skips NaN, e.g. the points left out of a fit
+        value = np.fmin.reduce(array, axis=None) if array.size else np.nan
+        return value.item() if np.isfinite(value) else 0
 
     @staticmethod
     def arrayMax(array):
-        if array.size:
-            return np.amax(array).item()
-        return 1
+        value = np.fmax.reduce(array, axis=None) if array.size else np.nan
+        return value.item() if np.isfinite(value) else 1
+
+    @staticmethod
+    def arrayMedian(array, overwrite_input=False):
+        if not array.size or np.isnan(array).all():
+            return 0.5
+        return np.nanmedian(array, overwrite_input=overwrite_input).item()
 
     @staticmethod
-    def arrayMedian(array):
-        if array.size:
-            return np.median(array).item()
-        return 0.5
+    def readOnlyView(array):
+        view = np.asarray(array).view()
+        view.flags.writeable = False
+        return view
+
+    @staticmethod
+    def verticalLineBrush(size, color):
+        """
+        Texture brush of a size x size transparent square with a vertical
+        line of the given color in the middle, built from an ARGB32 pixel
+        buffer in one go.
+        """
+        brush = QBrush()
+        if size <= 0:
+            return brush
+        pixels = np.zeros((size, size), dtype=np.uint32)  # transparent
+        pixels[:, size // 2] = QColor(color).rgba()
+        # copy() detaches the image from the numpy buffer
+        image = QImage(pixels.tobytes(), size, size, 4 * size, QImage.Format_ARGB32).copy()  # noqa: E501
+        brush.setTextureImage(image)
+        return brush
+
+    @staticmethod
+    def reusedBuffer(buffer, shape, dtype=np.float64):
+        if buffer.shape == shape and buffer.dtype == dtype:
+            return buffer
+        return np.empty(shape, dtype=dtype)
 
     @staticmethod
     def arrayToString(array):
@@ -551,6 +764,11 @@ class Plotting1dProxy(QObject):
 
     @staticmethod
     def arraysToPoints(xarray, yarray):
+        # QtCharts does not draw gaps: points without a value are left out
+        finite = np.isfinite(yarray)
+        if not finite.all():
+            xarray, yarray = xarray[finite], yarray[finite]
         xarray = Plotting1dProxy.aroundX(xarray)
         yarray = Plotting1dProxy.aroundY(yarray)
         return [QPointF(x, y) for x, y in zip(xarray, yarray)]
+
@@ -1,15 +1,20 @@
 # noqa: E501
 import os
-import timeit
 
 from typing import Union
 
-from PySide2.QtCore import QObject, Slot, Signal, Property
+from PySide2.QtCore import QObject, QTimer, Slot, Signal, Property
 
 from easyCore.Utils.UndoRedo import property_stack_deco
+from easyApp.Logic.Utils.Utils import generalizePath
 from easyDiffractionApp.Logic.LogicController import LogicController
+from easyDiffractionApp.Logic.DataStore import DataSet1D
+from easyDiffractionApp.Logic.Profiling import profiler
+from easyDiffractionApp.Logic.SignalTracer import tracer
+from easyDiffractionApp.Logic.DisplayModels.DictListModel import DictListModel
 
 
+@tracer.traceHandlers
 class PyQmlProxy(QObject):
     # SIGNALS
 
@@ -20,14 +25,12 @@ class PyQmlProxy(QObject):
 
     # Fitables
     parametersAsObjChanged = Signal()
-    parametersAsXmlChanged = Signal()
 
     # Structure
     structureParametersChanged = Signal()
     structureViewChanged = Signal()
 
     phasesAsObjChanged = Signal()
-    phasesAsXmlChanged = Signal()
     phasesAsCifChanged = Signal()
     currentPhaseChanged = Signal()
     phasesEnabled = Signal()
@@ -36,20 +39,21 @@ class PyQmlProxy(QObject):
     patternParametersAsObjChanged = Signal()
 
     instrumentParametersAsObjChanged = Signal()
-    instrumentParametersAsXmlChanged = Signal()
 
     experimentDataChanged = Signal()
-    experimentDataAsXmlChanged = Signal()
 
     experimentLoadedChanged = Signal()
     experimentSkippedChanged = Signal()
 
+    fitRegionsChanged = Signal()
+
     # Analysis
     simulationParametersChanged = Signal()
 
     fitResultsChanged = Signal()
+    fitProgressChanged = Signal()
     fitFinishedNotify = Signal()
-    stopFit = Signal()
+    fitModeChanged = Signal()
 
     currentMinimizerChanged = Signal()
     currentMinimizerMethodChanged = Signal()
@@ -60,6 +64,11 @@ class PyQmlProxy(QObject):
 
     htmlExportingFinished = Signal(bool, str)
 
+    # Profiling
+    profilingChanged = Signal()
+    profilingStatsChanged = Signal()
+    signalTracingChanged = Signal()
+
     # Status info
     statusInfoChanged = Signal()
 
@@ -77,6 +86,14 @@ class PyQmlProxy(QObject):
         # Initialize logics
         self.stateChanged.connect(self._onStateChanged)
 
+        # List models for the QML table views
+        self._parameters_model = DictListModel(['id', 'number', 'label', 'value', 'unit', 'error', 'fit'], self)  # noqa: E501
+        self._phases_model = DictListModel(['name', 'spacegroup', 'cell', 'atoms'], self)  # noqa: E501
+        self._current_phase_model = DictListModel(['name', 'spacegroup', 'cell', 'atoms'], self)  # noqa: E501
+        self._current_phase_atoms_model = DictListModel(['label', 'specie', 'fract_x', 'fract_y', 'fract_z', 'occupancy', 'adp'], self)  # noqa: E501
+        self._instrument_parameters_model = DictListModel(['wavelength', 'resolution_u', 'resolution_v', 'resolution_w', 'resolution_x', 'resolution_y'], self)  # noqa: E501
+        self._experiment_data_model = DictListModel(['name'], self)
+
         # initialize the logic controller
         self.lc = LogicController(self)
 
@@ -115,8 +132,14 @@ class PyQmlProxy(QObject):
         self.currentMinimizerMethodChanged.connect(self.statusInfoChanged)
         #self.currentMinimizerMethodChanged.connect(self.undoRedoChanged)
 
-        # Multithreading
-        # self.stopFit.connect(self.lc.fitLogic.onStopFit)
+        # Profiling: the timings change on every timed call, the stats
+        # are notified at most once per interval while profiling
+        self._profiling_stats_version = profiler.version
+        self._profiling_timer = QTimer(self)
+        self._profiling_timer.setInterval(1000)
+        self._profiling_timer.timeout.connect(self._notifyProfilingStats)
+        self.profilingChanged.connect(self._updateProfilingTimer)
+        self._updateProfilingTimer()
 
         # start the undo/redo stack
         self.lc.initializeBorg()
@@ -230,9 +253,17 @@ class PyQmlProxy(QObject):
     def phasesAsObj(self):
         return self.lc.state._phases_as_obj
 
-    @Property(str, notify=phasesAsXmlChanged)
-    def phasesAsXml(self):
-        return self.lc.state._phases_as_xml
+    @Property('QVariant', notify=dummySignal)
+    def phasesModel(self):
+        return self._phases_model
+
+    @Property('QVariant', notify=dummySignal)
+    def currentPhaseModel(self):
+        return self._current_phase_model
+
+    @Property('QVariant', notify=dummySignal)
+    def currentPhaseAtomsModel(self):
+        return self._current_phase_atoms_model
 
     @Property(str, notify=phasesAsCifChanged)
     def phasesAsCif(self):
@@ -249,27 +280,35 @@ class PyQmlProxy(QObject):
         return self.lc.state.phasesAsExtendedCif()
 
     def _setPhasesAsObj(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setPhasesAsObj()
-        print("+ _setPhasesAsObj: {0:.3f} s".format(timeit.default_timer() - start_time))
+        with profiler.timed('PyQmlProxy._setPhasesAsObj'):
+            self.lc.state._setPhasesAsObj()
         self.phasesAsObjChanged.emit()
 
-    def _setPhasesAsXml(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setPhasesAsXml()
-        print("+ _setPhasesAsXml: {0:.3f} s".format(timeit.default_timer() - start_time))
-        self.phasesAsXmlChanged.emit()
+    def _setPhasesModels(self):
+        with profiler.timed('PyQmlProxy._setPhasesModels'):
+            self._phases_model.setItems(self.lc.state._phases_as_obj)
+            self._setCurrentPhaseModels()
+
+    def _setCurrentPhaseModels(self):
+        phases = self.lc.state._phases_as_obj
+        index = self.lc.state._current_phase_index
+        if not 0 <= index < len(phases):
+            self._current_phase_model.clear()
+            self._current_phase_atoms_model.clear()
+            return
+        phase = phases[index]
+        self._current_phase_model.setItems([phase])
+        self._current_phase_atoms_model.setItems(phase['atoms']['data'])
 
     def _setPhasesAsCif(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setPhasesAsCif()
-        print("+ _setPhasesAsCif: {0:.3f} s".format(timeit.default_timer() - start_time))
+        with profiler.timed('PyQmlProxy._setPhasesAsCif'):
+            self.lc.state._setPhasesAsCif()
         self.phasesAsCifChanged.emit()
 
     def _onStructureParametersChanged(self):
         print("***** _onStructureParametersChanged")
         self._setPhasesAsObj()  # 0.025 s
-        self._setPhasesAsXml()  # 0.065 s
+        self._setPhasesModels()
         self._setPhasesAsCif()  # 0.010 s
         self.stateChanged.emit(True)
 
@@ -380,6 +419,7 @@ class PyQmlProxy(QObject):
 
     def _onCurrentPhaseChanged(self):
         print("***** _onCurrentPhaseChanged")
+        self._setCurrentPhaseModels()
         self.structureViewChanged.emit()
 
     @Slot(str)
@@ -404,18 +444,18 @@ class PyQmlProxy(QObject):
     ####################################################################################################################
     ####################################################################################################################
 
-    @Property(str, notify=experimentDataAsXmlChanged)
-    def experimentDataAsXml(self):
-        return self.lc.state._experiment_data_as_xml
+    @Property('QVariant', notify=dummySignal)
+    def experimentDataModel(self):
+        return self._experiment_data_model
 
-    def _setExperimentDataAsXml(self):
-        print("+ _setExperimentDataAsXml")
-        self.lc.state._setExperimentDataAsXml()
-        self.experimentDataAsXmlChanged.emit()
+    def _setExperimentDataModel(self):
+        with profiler.timed('PyQmlProxy._setExperimentDataModel'):
+            experiments = self.lc.state.experimentDataAsObj() if self.lc.state.experiments else []  # noqa: E501
+            self._experiment_data_model.setItems(experiments)
 
     def _onExperimentDataChanged(self):
         print("***** _onExperimentDataChanged")
-        self._setExperimentDataAsXml()
+        self._setExperimentDataModel()
         self.stateChanged.emit(True)
 
     ####################################################################################################################
@@ -472,6 +512,7 @@ class PyQmlProxy(QObject):
 
     def _onExperimentLoadedChanged(self):
         print("***** _onExperimentLoadedChanged")
+        self.fitRegionsChanged.emit()
         if self.experimentLoaded:
             self._onParametersChanged()
             self._onInstrumentParametersChanged()
@@ -485,6 +526,53 @@ class PyQmlProxy(QObject):
             self._onPatternParametersChanged()
             self.lc.state._updateCalculatedData()
 
+    ####################################################################################################################
+    # Experiment fit range and excluded regions
+    ####################################################################################################################
+
+    @Property('QVariant', notify=fitRegionsChanged)
+    def fitRegionsAsObj(self):
+        return self.lc.state.fitRegionsAsObj()
+
+    @Slot(float, float)
+    def setFitRange(self, min_x: float, max_x: float):
+        self.lc.state.setFitRange(min_x, max_x)
+        self._onFitRegionsChanged()
+
+    @Slot()
+    def resetFitRange(self):
+        self.lc.state.resetFitRange()
+        self._onFitRegionsChanged()
+
+    @Slot(float, float)
+    def addExcludedRegion(self, min_x: float, max_x: float):
+        self.lc.state.addExcludedRegion(min_x, max_x)
+        self._onFitRegionsChanged()
+
+    @Slot(int)
+    def removeExcludedRegion(self, index: int):
+        self.lc.state.removeExcludedRegion(index)
+        self._onFitRegionsChanged()
+
+    @Property('QVariant', notify=dummySignal)
+    def weightPolicies(self):
+        return list(DataSet1D.weight_policies)
+
+    @Property(str, notify=fitRegionsChanged)
+    def weightPolicy(self):
+        return self.lc.state.weightPolicy()
+
+    @weightPolicy.setter
+    def weightPolicy(self, policy: str):
+        if self.lc.state.weightPolicy() == policy:
+            return
+        self.lc.state.setWeightPolicy(policy)
+        self._onFitRegionsChanged()
+
+    def _onFitRegionsChanged(self):
+        self.fitRegionsChanged.emit()
+        self.stateChanged.emit(True)
+
     ####################################################################################################################
     # Simulation parameters
     ####################################################################################################################
@@ -511,9 +599,8 @@ class PyQmlProxy(QObject):
         return self.lc.state._pattern_parameters_as_obj
 
     def _setPatternParametersAsObj(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setPatternParametersAsObj()
-        print("+ _setPatternParametersAsObj: {0:.3f} s".format(timeit.default_timer() - start_time))
+        with profiler.timed('PyQmlProxy._setPatternParametersAsObj'):
+            self.lc.state._setPatternParametersAsObj()
         self.patternParametersAsObjChanged.emit()
 
     def _onPatternParametersChanged(self):
@@ -528,26 +615,23 @@ class PyQmlProxy(QObject):
     def instrumentParametersAsObj(self):
         return self.lc.state._instrument_parameters_as_obj
 
-    @Property(str, notify=instrumentParametersAsXmlChanged)
-    def instrumentParametersAsXml(self):
-        return self.lc.state._instrument_parameters_as_xml
+    @Property('QVariant', notify=dummySignal)
+    def instrumentParametersModel(self):
+        return self._instrument_parameters_model
 
     def _setInstrumentParametersAsObj(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setInstrumentParametersAsObj()
-        print("+ _setInstrumentParametersAsObj: {0:.3f} s".format(timeit.default_timer() - start_time))
+        with profiler.timed('PyQmlProxy._setInstrumentParametersAsObj'):
+            self.lc.state._setInstrumentParametersAsObj()
         self.instrumentParametersAsObjChanged.emit()
 
-    def _setInstrumentParametersAsXml(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setInstrumentParametersAsXml()
-        print("+ _setInstrumentParametersAsXml: {0:.3f} s".format(timeit.default_timer() - start_time))
-        self.instrumentParametersAsXmlChanged.emit()
+    def _setInstrumentParametersModel(self):
+        with profiler.timed('PyQmlProxy._setInstrumentParametersModel'):
+            self._instrument_parameters_model.setItems([self.lc.state._instrument_parameters_as_obj])  # noqa: E501
 
     def _onInstrumentParametersChanged(self):
         print("***** _onInstrumentParametersChanged")
         self._setInstrumentParametersAsObj()
-        self._setInstrumentParametersAsXml()
+        self._setInstrumentParametersModel()
 
     ####################################################################################################################
     # Background
@@ -572,26 +656,31 @@ class PyQmlProxy(QObject):
     def parametersAsObj(self):
         return self.lc.state._parameters_as_obj
 
-    @Property(str, notify=parametersAsXmlChanged)
-    def parametersAsXml(self):
-        return self.lc.state._parameters_as_xml
+    @Property('QVariant', notify=dummySignal)
+    def parametersModel(self):
+        return self._parameters_model
 
     def _setParametersAsObj(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setParametersAsObj()
-        print("+ _setParametersAsObj: {0:.3f} s".format(timeit.default_timer() - start_time))
-        self.parametersAsObjChanged.emit()
-
-    def _setParametersAsXml(self):
-        start_time = timeit.default_timer()
-        self.lc.state._setParametersAsXml()
-        print("+ _setParametersAsXml: {0:.3f} s".format(timeit.default_timer() - start_time))
-        self.parametersAsXmlChanged.emit()
+        with profiler.timed('PyQmlProxy._setParametersAsObj'):
+            changed_rows = self.lc.state._setParametersAsObj()
+        if changed_rows is None or changed_rows:
+            self.parametersAsObjChanged.emit()
+        return changed_rows
+
+    def _setParametersModel(self, changed_rows=None):
+        with profiler.timed('PyQmlProxy._setParametersModel'):
+            items = self.lc.state._parameters_as_obj
+            if changed_rows is None:
+                self._parameters_model.setItems(items)
+            else:
+                for row in changed_rows:
+                    self._parameters_model.setRow(row, items[row])
 
     def _onParametersChanged(self):
         print("***** _onParametersChanged")
-        self._setParametersAsObj()
-        self._setParametersAsXml()
+        changed_rows = self._setParametersAsObj()
+        if changed_rows is None or changed_rows:
+            self._setParametersModel(changed_rows)
         self.stateChanged.emit(True)
 
     # Filtering
@@ -678,14 +767,34 @@ class PyQmlProxy(QObject):
         # since QThreads don't seem to properly work under macos
         self.lc.fitLogic.fit(self.lc.state._data)
 
+    @Slot()
+    def stopFit(self):
+        self.lc.fitLogic.stopFit()
+
     @Property('QVariant', notify=fitResultsChanged)
     def fitResults(self):
         return self.lc.fitLogic._fit_results
 
+    @Property('QVariant', notify=fitProgressChanged)
+    def fitProgress(self):
+        return self.lc.fitLogic._fit_progress
+
     @Property(bool, notify=fitFinishedNotify)
     def isFitFinished(self):
         return self.lc.fitLogic._fit_finished
 
+    @Property('QVariant', notify=dummySignal)
+    def fitModes(self):
+        return self.lc.fitLogic.fit_modes
+
+    @Property(str, notify=fitModeChanged)
+    def fitMode(self):
+        return self.lc.fitLogic.fitMode()
+
+    @fitMode.setter
+    def fitMode(self, mode: str):
+        self.lc.fitLogic.setFitMode(mode)
+
     ####################################################################################################################
     ####################################################################################################################
     # Report
@@ -725,6 +834,80 @@ class PyQmlProxy(QObject):
     def _onStatusInfoChanged(self):
         pass
 
+    # Refreshes triggered by parameter changes: requested, executed and
+    # suppressed (coalesced within one event-loop tick) counters
+    @Property('QVariant', notify=dummySignal)
+    def updateCountersAsObj(self):
+        return self.lc.updateScheduler.counters()
+
+    @Slot()
+    def resetUpdateCounters(self):
+        self.lc.updateScheduler.resetCounters()
+
+    # Timings of the hot paths: count, total, mean, p95, max and last
+    # duration in seconds per name, most time consuming first
+    @Property(bool, notify=profilingChanged)
+    def profilingEnabled(self):
+        return profiler.enabled
+
+    @profilingEnabled.setter
+    def profilingEnabled(self, enabled: bool):
+        if profiler.enabled == enabled:
+            return
+        profiler.enabled = enabled
+        self.profilingChanged.emit()
+
+    @Property('QVariant', notify=profilingStatsChanged)
+    def profilingStatsAsObj(self):
+        return profiler.stats()
+
+    @Slot()
+    def resetProfiling(self):
+        profiler.reset()
+        self._notifyProfilingStats()
+
+    def _updateProfilingTimer(self):
+        if profiler.enabled:
+            self._profiling_timer.start()
+        else:
+            self._profiling_timer.stop()
+            self._notifyProfilingStats()
+
+    def _notifyProfilingStats(self):
+        if self._profiling_stats_version == profiler.version:
+            return
+        self._profiling_stats_version = profiler.version
+        self.profilingStatsChanged.emit()
+
+    @Slot(str)
+    def saveProfilingStats(self, file_url):
+        profiler.dump(generalizePath(file_url))
+
+    # Signal flow: handlers run and signals emitted per user action
+    @Property(bool, notify=signalTracingChanged)
+    def signalTracingEnabled(self):
+        return tracer.enabled
+
+    @signalTracingEnabled.setter
+    def signalTracingEnabled(self, enabled: bool):
+        if tracer.enabled == enabled:
+            return
+        tracer.setEnabled(enabled)
+        self.signalTracingChanged.emit()
+
+    @Property('QVariant', notify=signalTracingChanged)
+    def signalTraceActionsAsObj(self):
+        return tracer.actions()
+
+    @Slot()
+    def resetSignalTrace(self):
+        tracer.reset()
+        self.signalTracingChanged.emit()
+
+    @Slot(str)
+    def saveSignalTrace(self, file_url):
+        tracer.dump(generalizePath(file_url))
+
     ####################################################################################################################
     ####################################################################################################################
     # Project examples
@@ -743,7 +926,7 @@ class PyQmlProxy(QObject):
 
     @Property('QVariant', notify=dummySignal)
     def screenRecorder(self):
-        return self.lc._screen_recorder
+        return self.lc.screenRecorder
 
     ####################################################################################################################
     ####################################################################################################################
@@ -811,10 +994,12 @@ class PyQmlProxy(QObject):
 
     @Slot()
     def undo(self):
+        self.lc.state.invalidateParametersIndex()
         self.lc.stackLogic.undo()
 
     @Slot()
     def redo(self):
+        self.lc.state.invalidateParametersIndex()
         self.lc.stackLogic.redo()
 
     @Property(str, notify=undoRedoChanged)
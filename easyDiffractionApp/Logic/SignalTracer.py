@@ -0,0 +1,276 @@
+import re
+import json
+import inspect
+import functools
+import itertools
+import threading
+from collections import deque, Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+from PySide2.QtCore import Signal
+
+
+class SignalTracer():
+    """
+    Opt-in tracer of the signal flow of the GUI thread.
+
+    Handler invocations (methods wrapped by traced() or traceHandlers())
+    and the emits of the signals of the watched objects are recorded with
+    their start time, duration and causal parent, i.e. the handler
+    running when they happened, in a ring buffer. Everything caused by
+    one user action, including the refreshes the UpdateScheduler runs on
+    a later tick, is grouped under that action. When disabled, a traced
+    handler costs a flag check only.
+    """
+
+    # Handler methods wrapped by traceHandlers()
+    handler_pattern = re.compile(r'^_?on[A-Z]')
+
+    def __init__(self, capacity=100000):
+        self.enabled = False
+        self._events = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._stack = []
+        self._resumed_action = None
+        self._action_names = {}
+        self._thread_id = None
+        self._watched = []
+        self._recorders = []
+
+    # Public: instrumentation
+
+    def traced(self, name: str = None):
+        """
+        Decorator recording every call of the function, under `name` or, by
+        default, its qualified name. As for a Qt slot, the arguments beyond
+        those the function takes are dropped.
+        """
+        def decorator(func):
+            event_name = name or func.__qualname__
+            code = func.__code__
+            max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount  # noqa: E501
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if max_args is not None:
+                    args = args[:max_args]
+                if not self.enabled or threading.get_ident() != self._thread_id:  # noqa: E501
+                    return func(*args, **kwargs)
+                event = self._begin(event_name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._end(event)
+            return wrapper
+        return decorator
+
+    def traceHandlers(self, cls):
+        """
+        Class decorator applying traced() to the signal handlers of the
+        class, i.e. the methods named on... or _on...
+        """
+        for attr_name, value in list(vars(cls).items()):
+            if inspect.isfunction(value) and SignalTracer.handler_pattern.match(attr_name):  # noqa: E501
+                setattr(cls, attr_name, self.traced()(value))
+        return cls
+
+    def watch(self, obj, label: str = None):
+        """
+        Record the emits of all the signals of the QObject `obj`.
+        """
+        label = label or type(obj).__name__
+        self._watched.append((obj, label))
+        if self.enabled:
+            self._connect(obj, label)
+
+    def currentAction(self):
+        """
+        Id of the user action being processed, or None.
+        """
+        if not self.enabled:
+            return None
+        if self._stack:
+            return self._stack[-1].action
+        return self._resumed_action
+
+    @contextmanager
+    def resumed(self, action):
+        """
+        Group what runs in the block, e.g. deferred refreshes, under the
+        user action `action`.
+        """
+        previous = self._resumed_action
+        self._resumed_action = action
+        try:
+            yield
+        finally:
+            self._resumed_action = previous
+
+    def setEnabled(self, enabled: bool):
+        if self.enabled == enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self._thread_id = threading.get_ident()
+            for obj, label in self._watched:
+                self._connect(obj, label)
+        else:
+            self._disconnectAll()
+            self._stack.clear()
+            self._resumed_action = None
+
+    def reset(self):
+        self._events.clear()
+        self._action_names.clear()
+
+    # Public: results
+
+    def actions(self):
+        """
+        Summary per user action: handler calls and signal emits counted by
+        name, with the handlers run more than once listed as repeated.
+        """
+        actions = {}
+        for event in sorted(self._events, key=lambda item: item.start):
+            action = actions.get(event.action)
+            if action is None:
+                action = actions[event.action] = {
+                    'id': event.action,
+                    'name': self._action_names.get(event.action, ''),
+                    'start': event.start,
+                    'end': event.start,
+                    'calls': Counter(),
+                    'emits': Counter()
+                }
+            action['end'] = max(action['end'], event.start + event.duration)
+            if event.kind == 'call':
+                action['calls'][event.name] += 1
+            else:
+                action['emits'][event.name] += 1
+
+        summary = []
+        for action in actions.values():
+            summary.append({
+                'id': action['id'],
+                'name': action['name'],
+                'duration': action['end'] - action['start'],
+                'calls': dict(action['calls']),
+                'emits': dict(action['emits']),
+                'repeated': {name: count for name, count in action['calls'].items() if count > 1}  # noqa: E501
+            })
+        return summary
+
+    def events(self):
+        return [event.asDict() for event in sorted(self._events, key=lambda item: item.start)]  # noqa: E501
+
+    def folded(self):
+        """
+        Handler call stacks in the folded format of flame graph tools
+        (flamegraph.pl, speedscope, ...): one 'action;caller;callee self
+        time in microseconds' line per distinct stack.
+        """
+        calls = {event.id: event for event in self._events if event.kind == 'call'}  # noqa: E501
+        children_time = Counter()
+        for event in calls.values():
+            if event.parent in calls:
+                children_time[event.parent] += event.duration
+
+        stacks = Counter()
+        for event in calls.values():
+            frames = []
+            item = event
+            while item is not None:
+                frames.append(item.name)
+                item = calls.get(item.parent)
+            frames.append(f"action: {self._action_names.get(event.action, '')}")
+            self_time = max(event.duration - children_time[event.id], 0.0)
+            stacks[';'.join(reversed(frames))] += self_time
+        return [f'{stack} {int(round(time * 1e6))}' for stack, time in stacks.items()]  # noqa: E501
+
+    def dumpJson(self, file_path):
+        with open(file_path, 'w') as file:
+            json.dump({'actions': self.actions(), 'events': self.events()}, file, indent=4)  # noqa: E501
+
+    def dumpFolded(self, file_path):
+        with open(file_path, 'w') as file:
+            file.writelines(f'{line}\n' for line in self.folded())
+
+    def dump(self, file_path):
+        """
+        Save the trace as folded stacks for .folded and .txt files, or as
+        JSON (actions summary and all events) otherwise.
+        """
+        if str(file_path).lower().endswith(('.folded', '.txt')):
+            self.dumpFolded(file_path)
+        else:
+            self.dumpJson(file_path)
+
+    # Private
+
+    def _newEvent(self, kind, name):
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            action = parent.action
+        elif self._resumed_action is not None:
+            action = self._resumed_action
+        else:
+            action = next(self._ids)
+            self._action_names[action] = name
+        return _Event(next(self._ids), kind, name,
+                      parent.id if parent is not None else None,
+                      action, perf_counter())
+
+    def _begin(self, name):
+        event = self._newEvent('call', name)
+        self._stack.append(event)
+        return event
+
+    def _end(self, event):
+        event.duration = perf_counter() - event.start
+        if self._stack and self._stack[-1] is event:
+            self._stack.pop()
+        self._events.append(event)
+
+    def _recordEmit(self, name, *args):
+        if threading.get_ident() != self._thread_id:
+            return
+        self._events.append(self._newEvent('emit', name))
+
+    def _connect(self, obj, label):
+        names = set()
+        for cls in type(obj).__mro__:
+            names.update(name for name, value in vars(cls).items() if isinstance(value, Signal))  # noqa: E501
+        for name in sorted(names):
+            signal = getattr(obj, name)
+            recorder = functools.partial(self._recordEmit, f'{label}.{name}')
+            signal.connect(recorder)
+            self._recorders.append((signal, recorder))
+
+    def _disconnectAll(self):
+        for signal, recorder in self._recorders:
+            try:
+                signal.disconnect(recorder)
+            except (RuntimeError, TypeError):
+                pass
+        self._recorders.clear()
+
+
+class _Event():
+    __slots__ = ('id', 'kind', 'name', 'parent', 'action', 'start', 'duration')
+
+    def __init__(self, event_id, kind, name, parent, action, start):
+        self.id = event_id
+        self.kind = kind
+        self.name = name
+        self.parent = parent
+        self.action = action
+        self.start = start
+        self.duration = 0.0
+
+    def asDict(self):
+        return {name: getattr(self, name) for name in _Event.__slots__}
+
+
+# Process-wide tracer of the application
+tracer = SignalTracer()
@@ -0,0 +1,94 @@
+from easyCore.Symmetry.tools import SpacegroupInfo
+
+
+class SpaceGroupTable():
+    """
+    Process-wide lookup table of crystal systems -> space group numbers ->
+    Hermann-Mauguin symbols -> settings, with the HTML formatted lists
+    shown by the structure editor.
+
+    The symmetry tables never change at runtime, so the entries of a
+    crystal system or a space group are built from SpacegroupInfo on
+    first use, and every lookup afterwards is a dict access. Systems not
+    listed by get_all_systems() (trigonal) or unknown (the empty system
+    of a sample without phases) give what SpacegroupInfo gives for them.
+    The returned lists are shared: callers must not modify them.
+    """
+
+    _instance = None
+
+    def __init__(self):
+        self._systems = [system.capitalize() for system in SpacegroupInfo.get_all_systems()]  # noqa: E501
+        # system -> (numbers, index of each number, formatted numbers)
+        self._space_groups = {}
+        self._symbols = {}
+        # number -> (settings, index of each setting, formatted settings)
+        self._settings = {}
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # Public
+
+    def crystalSystems(self):
+        return self._systems
+
+    def spaceGroupNumbers(self, system: str):
+        return self._systemEntry(system)[0]
+
+    def spaceGroupIndex(self, system: str, number: int):
+        return self._systemEntry(system)[1].get(number, 0)
+
+    def formattedSpaceGroups(self, system: str):
+        return self._systemEntry(system)[2]
+
+    def symbol(self, number: int):
+        symbol = self._symbols.get(number)
+        if symbol is None:
+            symbol = SpacegroupInfo.get_symbol_from_int_number(number)
+            self._symbols[number] = symbol
+        return symbol
+
+    def settings(self, number: int):
+        return self._settingsEntry(number)[0]
+
+    def settingIndex(self, number: int, name: str):
+        return self._settingsEntry(number)[1][name]
+
+    def formattedSettings(self, number: int):
+        return self._settingsEntry(number)[2]
+
+    # Private
+
+    def _systemEntry(self, system: str):
+        system = system.lower()
+        entry = self._space_groups.get(system)
+        if entry is None:
+            numbers = list(SpacegroupInfo.get_ints_from_system(system))
+            indices = {}
+            for index, number in enumerate(numbers):
+                # First occurrence, as list.index() would return
+                indices.setdefault(number, index)
+            formatted = [SpaceGroupTable.formatDisplay(number, self.symbol(number)) for number in numbers]  # noqa: E501
+            entry = (numbers, indices, formatted)
+            self._space_groups[system] = entry
+        return entry
+
+    def _settingsEntry(self, number: int):
+        entry = self._settings.get(number)
+        if entry is None:
+            settings = list(SpacegroupInfo.get_compatible_HM_from_int(number))
+            indices = {}
+            for index, name in enumerate(settings):
+                indices.setdefault(name, index)
+            formatted = [SpaceGroupTable.formatDisplay(index + 1, name) for index, name in enumerate(settings)]  # noqa: E501
+            entry = (settings, indices, formatted)
+            self._settings[number] = entry
+        return entry
+
+    @staticmethod
+    def formatDisplay(number, name):
+        return f"<font color='#999'>{number}</font> {name}"
@@ -0,0 +1,134 @@
+import sys
+import json
+from importlib.abc import MetaPathFinder
+from importlib.machinery import SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader  # noqa: E501
+from time import perf_counter
+
+
+class StartupProfiler():
+    """
+    Timings of the application startup: the time spent importing every
+    module, nested as reported by python -X importtime (which frozen
+    builds cannot be run with), and the time from the start to named
+    milestones, e.g. the first frame of the main window.
+
+    Only the stdlib is imported here, so that install() can be called
+    before PySide2 and easyScience are imported.
+    """
+
+    # Loaders which are created per module and so can be wrapped safely
+    timed_loaders = (SourceFileLoader, SourcelessFileLoader, ExtensionFileLoader)  # noqa: E501
+
+    def __init__(self):
+        self._start_time = perf_counter()
+        self._finder = _TimingFinder(self)
+        self._imports = []
+        self._stack = []
+        self._milestones = []
+
+    # Public
+
+    def install(self):
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def mark(self, name: str):
+        """
+        Record the milestone `name`, reached now.
+        """
+        self._milestones.append((name, perf_counter() - self._start_time))
+
+    def imports(self):
+        """
+        Imported modules in the order their import finished, as python -X
+        importtime lists them. Times are in seconds.
+        """
+        return [{'name': name, 'depth': depth, 'self': self_time, 'cumulative': cumulative}  # noqa: E501
+                for name, depth, self_time, cumulative in self._imports]
+
+    def milestones(self):
+        return [{'name': name, 'time': time} for name, time in self._milestones]  # noqa: E501
+
+    def report(self, slowest: int = 20):
+        """
+        Return the import time tree, in the format of python -X importtime,
+        followed by the `slowest` top level imports and the milestones.
+        """
+        lines = ['import time: self [us] | cumulative | imported package']
+        for name, depth, self_time, cumulative in self._imports:
+            lines.append(f"import time: {int(self_time * 1e6):>9} | {int(cumulative * 1e6):>10} | {'  ' * depth}{name}")  # noqa: E501
+
+        top_level = sorted((item for item in self._imports if item[1] == 0),
+                           key=lambda item: item[3], reverse=True)
+        lines.append('')
+        lines.append(f'slowest top level imports (of {len(self._imports)} modules)')  # noqa: E501
+        for name, _, _, cumulative in top_level[:slowest]:
+            lines.append(f'{cumulative * 1000:10.1f} ms  {name}')
+
+        lines.append('')
+        lines.append('milestones, since start')
+        for name, time in self._milestones:
+            lines.append(f'{time * 1000:10.1f} ms  {name}')
+        return '\n'.join(lines)
+
+    def dump(self, file_path):
+        """
+        Save the report as JSON for .json files, or as text otherwise.
+        """
+        with open(file_path, 'w') as file:
+            if str(file_path).lower().endswith('.json'):
+                json.dump({'imports': self.imports(), 'milestones': self.milestones()}, file, indent=4)  # noqa: E501
+            else:
+                file.write(self.report() + '\n')
+
+    # Private
+
+    def _timedExecModule(self, name, exec_module):
+        def timed(module):
+            self._stack.append(0.0)
+            start_time = perf_counter()
+            try:
+                return exec_module(module)
+            finally:
+                cumulative = perf_counter() - start_time
+                children_time = self._stack.pop()
+                if self._stack:
+                    self._stack[-1] += cumulative
+                self._imports.append((name, len(self._stack), cumulative - children_time, cumulative))  # noqa: E501
+        return timed
+
+
+class _TimingFinder(MetaPathFinder):
+    """
+    Finder timing the execution of the modules found by the finders
+    after it in sys.meta_path.
+    """
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._finding = False
+
+    def find_spec(self, fullname, path, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            spec = self._findSpec(fullname, path, target)
+        finally:
+            self._finding = False
+        if spec is not None and isinstance(spec.loader, StartupProfiler.timed_loaders):  # noqa: E501
+            spec.loader.exec_module = self._profiler._timedExecModule(fullname, spec.loader.exec_module)  # noqa: E501
+        return spec
+
+    def _findSpec(self, fullname, path, target):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                return spec
+        return None
@@ -1,5 +1,6 @@
 # noqa: E501
 import os
+import re
 import datetime
 import pathlib
 from typing import Union
@@ -10,17 +11,24 @@ import json
 from PySide2.QtCore import Signal, QObject
 
 from easyCore import np, borg
-from easyCore.Symmetry.tools import SpacegroupInfo
 from easyCore.Utils.classTools import generatePath
 
 from easyDiffractionLib.sample import Sample
 from easyApp.Logic.Utils.Utils import generalizePath
 from easyDiffractionApp.Logic.DataStore import DataSet1D, DataStore
+from easyDiffractionApp.Logic.DataCache import ExperimentDataCache
+from easyDiffractionApp.Logic.CalculatorCache import CalculatorCache
+from easyDiffractionApp.Logic.Profiling import profiler
+from easyDiffractionApp.Logic.SignalTracer import tracer
+from easyDiffractionApp.Logic.ColumnReader import readColumns
+from easyDiffractionApp.Logic.PhaseUpdate import updatePhasesInPlace
+from easyDiffractionApp.Logic.SpaceGroups import SpaceGroupTable
 from easyDiffractionLib import Phases, Phase, Lattice, Site, SpaceGroup
 from easyDiffractionLib.Elements.Experiments.Experiment import Pars1D
 from easyDiffractionLib.Elements.Experiments.Pattern import Pattern1D
 
 
+@tracer.traceHandlers
 class StateLogic(QObject):
     """
     """
@@ -51,11 +59,11 @@ class StateLogic(QObject):
         self._project_created = False
 
         self._experiment_parameters = None
-        self._experiment_data_as_xml = ""
         self.experiment_data = None
         self._experiment_data = None
         self._experiment_loaded = False
         self._experiment_skipped = False
+        self._experiment_data_cache = ExperimentDataCache()
         self.experiments = self._defaultExperiments()
 
         self._parameters = None
@@ -67,19 +75,25 @@ class StateLogic(QObject):
 
         self.phases = None
         self._phases_as_obj = []
-        self._phases_as_xml = ""
         self._phases_as_cif = ""
+        self._phase_cif_blocks = {}
+        self._outdated_phase_ids = None
+        self._editing_parameter = False
+        self._symm_ops_cif_loops = {}
         self._sample = self._defaultSample()
         self._current_phase_index = 0
         # Experiment
         self._pattern_parameters_as_obj = self._defaultPatternParameters()
         self._instrument_parameters_as_obj = self._defaultInstrumentParameters()  # noqa: E501
-        self._instrument_parameters_as_xml = ""
         # Parameters
         self._parameters_as_obj = []
-        self._parameters_as_xml = []
+        self._parameters_objs = []
+        self._parameters_index = {}
+        self._parameters_index_valid = False
         self._parameters_filter_criteria = ""
 
+        self._simulation_data_id = None
+        self._calculator_cache = CalculatorCache()
         self._data = self._defaultData()
         self._simulation_parameters_as_obj = self._defaultSimulationParameters()  # noqa: E501
         self._currentProjectPath = os.path.expanduser("~")
@@ -107,7 +121,7 @@ class StateLogic(QObject):
                 data_type='experiment'
             )
         )
-        data.append(
+        self._simulation_data_id = data.append(
             DataSet1D(
                 name='{:s} engine'.format(self._interface_name),
                 x=x_data, y=np.zeros_like(x_data),
@@ -147,10 +161,15 @@ class StateLogic(QObject):
     def _loadExperimentData(self, file_url):
         print("+ _loadExperimentData")
         file_path = generalizePath(file_url)
-        data = self._data.experiments[0]
-        data.x, data.y, data.e = np.loadtxt(file_path, unpack=True)
+        data = self._data.currentExperiment
+        data.setColumns(self._experiment_data_cache.load(file_path, self._parseExperimentData))  # noqa: E501
+        data.fit_range = None
+        data.excluded_regions = ()
         return data
 
+    def _parseExperimentData(self, file_path):
+        return readColumns(file_path)
+
     def _experimentDataParameters(self, data):
         x_min = data.x[0]
         x_max = data.x[-1]
@@ -185,12 +204,10 @@ class StateLogic(QObject):
         self._experiment_skipped = skipped
         self.experimentSkippedChanged.emit()
 
-    def _setExperimentDataAsXml(self):
-        self._experiment_data_as_xml = dicttoxml(self.experiments, attr_type=True).decode()  # noqa: E501
-
     def addExperimentDataFromXye(self, file_url):
         self._experiment_data = self._loadExperimentData(file_url)
-        self._data.experiments[0].name = pathlib.Path(file_url).stem
+        self._experiment_data.name = pathlib.Path(file_url).stem
+        self.invalidateParametersIndex()
         self.experiments = [{'name': experiment.name} for experiment in self._data.experiments]
         self.experimentLoaded(True)
         self.experimentSkipped(False)
@@ -200,6 +217,37 @@ class StateLogic(QObject):
         self.experimentLoaded(False)
         self.experimentSkipped(False)
 
+    ####################################################################################################################
+    # Experiment: fit range and excluded regions
+    ####################################################################################################################
+
+    def fitRegionsAsObj(self):
+        return self._data.currentExperiment.fitSettingsAsDict()
+
+    def setFitRange(self, min_x: float, max_x: float):
+        self._data.currentExperiment.fit_range = (min_x, max_x)
+
+    def resetFitRange(self):
+        self._data.currentExperiment.fit_range = None
+
+    def addExcludedRegion(self, min_x: float, max_x: float):
+        data = self._data.currentExperiment
+        data.excluded_regions = data.excluded_regions + ((min_x, max_x),)
+
+    def weightPolicy(self):
+        return self._data.currentExperiment.weight_policy
+
+    def setWeightPolicy(self, policy: str):
+        self._data.currentExperiment.weight_policy = policy
+
+    def removeExcludedRegion(self, index: int):
+        data = self._data.currentExperiment
+        regions = list(data.excluded_regions)
+        if not 0 <= index < len(regions):
+            return
+        del regions[index]
+        data.excluded_regions = regions
+
     ####################################################################################################################
     ####################################################################################################################
     # project
@@ -300,6 +348,7 @@ class StateLogic(QObject):
 
         self._sample = Sample.from_dict(descr['sample'])
         self._sample.interface = self._interface
+        self.invalidateParametersIndex()
 
         # send signal to tell the proxy we changed phases
         self.phasesEnabled.emit()
@@ -310,10 +359,11 @@ class StateLogic(QObject):
         if 'experiments' in descr:
             self.experimentLoaded(True)
             self.experimentSkipped(False)
-            self._data.experiments[0].x = np.array(descr['experiments'][0])
-            self._data.experiments[0].y = np.array(descr['experiments'][1])
-            self._data.experiments[0].e = np.array(descr['experiments'][2])
-            self._experiment_data = self._data.experiments[0]
+            project_dir = os.path.dirname(path)
+            self._experiment_data = self._data.currentExperiment
+            self._experiment_data.setColumns(self._loadExperimentArrays(descr['experiments'], project_dir))  # noqa: E501
+            experiment = descr['experiments'][0]
+            self._experiment_data.setFitSettingsFromDict(experiment if isinstance(experiment, dict) else {})  # noqa: E501
             self.experiments = [{'name': descr['project_info']['experiments']}]
             self.setCurrentExperimentDatasetName(descr['project_info']['experiments'])
 
@@ -358,10 +408,8 @@ class StateLogic(QObject):
             'sample': self._sample.as_dict(skip=['interface'])
         }
         if self._data.experiments:
-            experiments_x = self._data.experiments[0].x
-            experiments_y = self._data.experiments[0].y
-            experiments_e = self._data.experiments[0].e
-            descr['experiments'] = [experiments_x, experiments_y, experiments_e]
+            descr['experiments'] = self._saveExperimentArrays(self._data.currentExperiment, projectPath)  # noqa: E501
+            self._removeStaleExperimentArrays(project_save_filepath, descr['experiments'], projectPath)  # noqa: E501
 
         descr['experiment_skipped'] = self._experiment_skipped
         descr['project_info'] = self._project_info
@@ -376,6 +424,66 @@ class StateLogic(QObject):
         path = generalizePath(project_save_filepath)
         createFile(path, content_json)
 
+    def _saveExperimentArrays(self, data, project_dir):
+        """
+        Store the experiment x, y and e arrays as a raw little-endian
+        (3, n) .npy file in the project experiments directory and
+        return the description to be written to project.json, with the
+        fit range and excluded regions
+        """
+        experiments_dir = os.path.join(project_dir, 'experiments')
+        os.makedirs(experiments_dir, exist_ok=True)
+        relative_path = '/'.join(['experiments', experimentArraysFileName(data.name)])  # noqa: E501
+        file_path = experimentArraysPath(project_dir, relative_path)
+        description = {'name': data.name, 'data': relative_path}
+        description.update(data.fitSettingsAsDict())
+        # Arrays memory-mapped from the very same file are read-only and
+        # therefore unchanged: rewriting would truncate the mapped file.
+        mapped_path = getattr(data.x, 'filename', None)
+        if mapped_path is not None and os.path.exists(file_path) and os.path.samefile(mapped_path, file_path):  # noqa: E501
+            return [description]
+        arrays = np.vstack((data.x, data.y, data.e)).astype('<f8')
+        np.save(file_path, arrays)
+        return [description]
+
+    def _loadExperimentArrays(self, experiments, project_dir):
+        """
+        Return the experiment x, y and e arrays from the project.json
+        description as a (3, n) array. The .npy payloads are
+        memory-mapped; legacy projects with the arrays stored as JSON
+        lists are still supported.
+        """
+        if not isinstance(experiments[0], dict):
+            return np.array([experiments[idx] for idx in range(3)], dtype=np.float64)  # noqa: E501
+        file_path = experimentArraysPath(project_dir, experiments[0]['data'])
+        return np.load(file_path, mmap_mode='r')
+
+    def _removeStaleExperimentArrays(self, project_file_path, experiments, project_dir):  # noqa: E501
+        """
+        Remove the .npy files of the project.json about to be overwritten
+        that the new description no longer refers to, e.g. after the
+        experiment was renamed.
+        """
+        if not os.path.isfile(project_file_path):
+            return
+        try:
+            with open(project_file_path, 'r') as json_file:
+                old_experiments = json.load(json_file).get('experiments', [])
+        except (OSError, ValueError):
+            return
+        kept = {experimentArraysPath(project_dir, experiment['data']) for experiment in experiments}  # noqa: E501
+        for experiment in old_experiments:
+            if not isinstance(experiment, dict) or 'data' not in experiment:
+                continue
+            file_path = experimentArraysPath(project_dir, experiment['data'])
+            if file_path in kept or not os.path.isfile(file_path):
+                continue
+            try:
+                os.remove(file_path)
+            except OSError as exception:
+                # e.g. still memory-mapped on Windows
+                print(f'remove file {file_path}', exception)
+
     def default(self, obj):
         if type(obj).__module__ == np.__name__:
             if isinstance(obj, np.ndarray):
@@ -423,6 +531,7 @@ class StateLogic(QObject):
             return
         self._sample.phases[self._current_phase_index].name = name
         self._project_info['samples'] = name
+        self.invalidateParametersIndex()
 
     ####################################################################################################################
     ####################################################################################################################
@@ -473,35 +582,88 @@ class StateLogic(QObject):
         return current_system
 
     def setCurrentCrystalSystem(self, new_system: str):
-        new_system = new_system.lower()
-        space_group_numbers = SpacegroupInfo.get_ints_from_system(new_system)
-        top_space_group_number = space_group_numbers[0]
-        top_space_group_name = SpacegroupInfo.get_symbol_from_int_number(top_space_group_number)  # noqa: E501
+        space_groups = SpaceGroupTable.instance()
+        top_space_group_number = space_groups.spaceGroupNumbers(new_system)[0]
+        top_space_group_name = space_groups.symbol(top_space_group_number)
         self._setCurrentSpaceGroup(top_space_group_name)
 
     def phasesAsExtendedCif(self):
         if len(self._sample.phases) == 0:
             return
 
-        symm_ops = self._sample.phases[0].spacegroup.symmetry_opts
-        symm_ops_cif_loop = "loop_\n _symmetry_equiv_pos_as_xyz\n"
-        for symm_op in symm_ops:
-            symm_ops_cif_loop += f' {symm_op.as_xyz_string()}\n'
-        return self._phases_as_cif + symm_ops_cif_loop
+        spacegroup = self._sample.phases[0].spacegroup
+        setting = spacegroup.space_group_HM_name.raw_value
+        symm_ops_cif_loop = self._symm_ops_cif_loops.get(setting)
+        if symm_ops_cif_loop is None:
+            lines = ["loop_", " _symmetry_equiv_pos_as_xyz"]
+            lines.extend(f' {symm_op.as_xyz_string()}' for symm_op in spacegroup.symmetry_opts)  # noqa: E501
+            lines.append('')
+            symm_ops_cif_loop = '\n'.join(lines)
+            self._symm_ops_cif_loops[setting] = symm_ops_cif_loop
+        return ''.join((self._phases_as_cif, symm_ops_cif_loop))
 
     def phasesAsCif(self, phases_as_cif):
         if self._phases_as_cif == phases_as_cif:
             return
-        self._sample.phases = Phases.from_cif_str(phases_as_cif)
+        new_phases = Phases.from_cif_str(phases_as_cif)
+        # The CIF edit as a whole is already on the undo stack
+        stack_enabled = borg.stack.enabled
+        borg.stack.enabled = False
+        try:
+            structure_changed = updatePhasesInPlace(self._sample.phases, new_phases)  # noqa: E501
+        finally:
+            borg.stack.enabled = stack_enabled
+        if structure_changed is None:
+            self._sample.phases = new_phases
+            structure_changed = True
+        if structure_changed:
+            self.invalidateParametersIndex()
 
     def _setPhasesAsObj(self):
         self._phases_as_obj = self._sample.phases.as_dict(skip=['interface'])['data']
 
-    def _setPhasesAsXml(self):
-        self._phases_as_xml = dicttoxml(self._phases_as_obj, attr_type=True).decode()  # noqa: E501
+    def invalidatePhasesCif(self):
+        """
+        Mark the CIF blocks of all the phases as outdated, after a change
+        which may affect any of them (fit, undo/redo, structure edit, ...).
+        The edit of a single parameter only marks the phase holding it,
+        see editParameter
+        """
+        if not self._editing_parameter:
+            self._outdated_phase_ids = None
+
+    def _invalidatePhaseCif(self, obj):
+        # Symmetry only changes parameters of the same phase, but a user
+        # constraint on the parameter can change those of any phase
+        if self._outdated_phase_ids is None:
+            return
+        if getattr(obj, 'user_constraints', None):
+            self._outdated_phase_ids = None
+            return
+        for phase in self._sample.phases:
+            if any(par is obj for par in phase.get_parameters()):
+                self._outdated_phase_ids.add(id(phase))
 
     def _setPhasesAsCif(self):
-        self._phases_as_cif = str(self._sample.phases.cif)
+        """
+        Rebuild the CIF of all phases, re-rendering only the blocks of the
+        phases changed since the previous update
+        """
+        phases = self._sample.phases
+        blocks = {}
+        for phase in phases:
+            key = id(phase)
+            cached = self._phase_cif_blocks.get(key)
+            outdated = self._outdated_phase_ids is None or key in self._outdated_phase_ids  # noqa: E501
+            if outdated or cached is None or cached[0] is not phase:
+                cached = (phase, str(phase.cif).rstrip('\n'))
+            blocks[key] = cached
+        self._phase_cif_blocks = blocks
+        self._outdated_phase_ids = set()
+
+        # Same text whichever blocks were re-rendered: every block without
+        # its trailing newlines, followed by a single one
+        self._phases_as_cif = ''.join(f'{block}\n' for _, block in blocks.values())  # noqa: E501
 
     def _setCurrentSpaceGroup(self, new_name: str):
         phases = self._sample.phases
@@ -515,12 +677,12 @@ class StateLogic(QObject):
             return []
 
         current_number = self._currentSpaceGroupNumber()
-        settings = SpacegroupInfo.get_compatible_HM_from_int(current_number)
+        settings = SpaceGroupTable.instance().settings(current_number)
         return settings
 
     def _spaceGroupNumbers(self):
-        current_system = self.currentCrystalSystem().lower()
-        numbers = SpacegroupInfo.get_ints_from_system(current_system)
+        current_system = self.currentCrystalSystem()
+        numbers = SpaceGroupTable.instance().spaceGroupNumbers(current_system)
         return numbers
 
     def _currentSpaceGroupNumber(self):
@@ -529,45 +691,38 @@ class StateLogic(QObject):
         return current_number
 
     def getCurrentSpaceGroup(self):
-        def space_group_index(number, numbers):
-            if number in numbers:
-                return numbers.index(number)
-            return 0
-
         phases = self._sample.phases
         if not phases:
             return -1
 
-        space_group_numbers = self._spaceGroupNumbers()
+        current_system = self.currentCrystalSystem()
         current_number = self._currentSpaceGroupNumber()
-        current_idx = space_group_index(current_number, space_group_numbers)
+        current_idx = SpaceGroupTable.instance().spaceGroupIndex(current_system, current_number)  # noqa: E501
         return current_idx
 
     def currentSpaceGroup(self, new_idx: int):
         space_group_numbers = self._spaceGroupNumbers()
         space_group_number = space_group_numbers[new_idx]
-        space_group_name = SpacegroupInfo.get_symbol_from_int_number(space_group_number)  # noqa: E501
+        space_group_name = SpaceGroupTable.instance().symbol(space_group_number)  # noqa: E501
         self._setCurrentSpaceGroup(space_group_name)
 
     def formattedSpaceGroupList(self):
-        def format_display(num):
-            name = SpacegroupInfo.get_symbol_from_int_number(num)
-            return f"<font color='#999'>{num}</font> {name}"
-
-        space_group_numbers = self._spaceGroupNumbers()
-        display_list = [format_display(num) for num in space_group_numbers]
+        # Without phases the system is '', listed as SpacegroupInfo does
+        current_system = self.currentCrystalSystem()
+        display_list = SpaceGroupTable.instance().formattedSpaceGroups(current_system)  # noqa: E501
         return display_list
 
     def crystalSystemList(self):
-        systems = [system.capitalize() for system in SpacegroupInfo.get_all_systems()]  # noqa: E501
+        systems = SpaceGroupTable.instance().crystalSystems()
         return systems
 
     def formattedSpaceGroupSettingList(self):
-        def format_display(num, name):
-            return f"<font color='#999'>{num}</font> {name}"
+        phases = self._sample.phases
+        if not phases:
+            return []
 
-        raw_list = self._spaceGroupSettingList()
-        formatted_list = [format_display(i + 1, name) for i, name in enumerate(raw_list)]  # noqa: E501
+        current_number = self._currentSpaceGroupNumber()
+        formatted_list = SpaceGroupTable.instance().formattedSettings(current_number)  # noqa: E501
         return formatted_list
 
     def currentSpaceGroupSetting(self):
@@ -575,10 +730,10 @@ class StateLogic(QObject):
         if not phases:
             return 0
 
-        settings = self._spaceGroupSettingList()
+        current_number = self._currentSpaceGroupNumber()
         current_setting = phases[self._current_phase_index].spacegroup.space_group_HM_name.raw_value  # noqa: E501
-        current_number = settings.index(current_setting)
-        return current_number
+        current_idx = SpaceGroupTable.instance().settingIndex(current_number, current_setting)  # noqa: E501
+        return current_idx
 
     def setCurrentSpaceGroupSetting(self, new_number: int):
         settings = self._spaceGroupSettingList()
@@ -603,10 +758,11 @@ class StateLogic(QObject):
         del self._sample.phases[self._current_phase_index].atoms[atom_label]
 
     def setCurrentExperimentDatasetName(self, name):
-        if self._data.experiments[0].name == name:
+        if self._data.currentExperiment.name == name:
             return
-        self._data.experiments[0].name = name
+        self._data.currentExperiment.name = name
         self._project_info['experiments'] = name
+        self.invalidateParametersIndex()
 
     ####################################################################################################################
     # Simulation parameters
@@ -648,35 +804,42 @@ class StateLogic(QObject):
         parameters = self._sample.parameters.as_dict(skip=['interface'])
         self._instrument_parameters_as_obj = parameters
 
-    def _setInstrumentParametersAsXml(self):
-        parameters = [self._instrument_parameters_as_obj]
-        self._instrument_parameters_as_xml = dicttoxml(parameters, attr_type=True).decode()  # noqa: E501
-
     ####################################################################################################################
     # Calculated data
     ####################################################################################################################
+    @tracer.traced()
+    @profiler.profiled()
     def _updateCalculatedData(self):
         if not self._experiment_loaded and not self._experiment_skipped:
             return
 
         self._sample.output_index = self._current_phase_index
 
-        #  THIS IS WHERE WE WOULD LOOK UP CURRENT EXP INDEX
-        sim = self._data.simulations[0]
+        sim = self._data.byId(self._simulation_data_id)
 
         if self._experiment_loaded:
-            exp = self._data.experiments[0]
-            sim.x = exp.x
+            exp = self._data.currentExperiment
+            x = exp.x
 
         elif self._experiment_skipped:
             x_min = float(self._simulation_parameters_as_obj['x_min'])
             x_max = float(self._simulation_parameters_as_obj['x_max'])
             x_step = float(self._simulation_parameters_as_obj['x_step'])
             num_points = int((x_max - x_min) / x_step + 1)
-            sim.x = np.linspace(x_min, x_max, num_points)
-
-        sim.y = self._interface.fit_func(sim.x)
-        hkl = self._interface.get_hkl()
+            x = np.linspace(x_min, x_max, num_points)
+
+        cache_key = self._calculator_cache.key(self._interface.current_interface_name,  # noqa: E501
+                                               self._sample, x, self._sample.output_index)  # noqa: E501
+        cached = self._calculator_cache.get(cache_key)
+        if cached is None:
+            with profiler.timed('Calculator.fit_func'):
+                y = self._interface.fit_func(x)
+                hkl = self._interface.get_hkl()
+            self._calculator_cache.put(cache_key, y, hkl)
+        else:
+            y, hkl = cached
+        # Both columns at once, the number of points may have changed
+        sim.setData(x, y)
 
         self.parent.chartsLogic._plotting_1d_proxy.setCalculatedData(sim.x, sim.y)  # noqa: E501
         self.parent.chartsLogic._plotting_1d_proxy.setBraggData(hkl['ttheta'], hkl['h'], hkl['k'], hkl['l'])  # noqa: E501
@@ -685,9 +848,35 @@ class StateLogic(QObject):
     # Fitables (parameters table from analysis tab & ...)
     ####################################################################################################################
 
+    def invalidateParametersIndex(self):
+        """
+        Mark the parameters table structure (set of rows, labels) as
+        outdated, so that it is fully rebuilt on the next update
+        """
+        self._parameters_index_valid = False
+
+    @profiler.profiled()
     def _setParametersAsObj(self):
+        """
+        Update the parameters table and return the indices of the changed
+        rows, or None if the whole table has been rebuilt
+        """
+        if not self._parameters_index_valid:
+            self._buildParametersAsObj()
+            return None
+
+        # Every row is compared: an edit can cascade to other parameters
+        # (constraints, symmetry, fit), which are not known here
+        rows = range(len(self._parameters_as_obj))
+        changed_rows = [row for row in rows if self._updateParameterRow(row)]
+        return changed_rows
+
+    def _buildParametersAsObj(self):
         self._parameters_as_obj.clear()
+        self._parameters_objs.clear()
+        self._parameters_index.clear()
 
+        experiment_name = self.experimentDataAsObj()[0]["name"]
         par_ids, par_paths = generatePath(self._sample, True)
         for par_index, par_path in enumerate(par_paths):
             par_id = par_ids[par_index]
@@ -697,13 +886,15 @@ class StateLogic(QObject):
                 continue
 
             # add experimental dataset name
-            par_path = par_path.replace('Pars1D.', f'Instrument.{self.experimentDataAsObj()[0]["name"]}.')
-            par_path = par_path.replace('Pattern1D.', f'Instrument.{self.experimentDataAsObj()[0]["name"]}.')
-            # par_path = par_path.replace('Instrument.', f'Instrument.{self.experimentDataAsObj()[0]["name"]}.')
+            par_path = par_path.replace('Pars1D.', f'Instrument.{experiment_name}.')
+            par_path = par_path.replace('Pattern1D.', f'Instrument.{experiment_name}.')
+            # par_path = par_path.replace('Instrument.', f'Instrument.{experiment_name}.')
 
             if self._parameters_filter_criteria.lower() not in par_path.lower():  # noqa: E501
                 continue
 
+            self._parameters_index[str(par_id)] = len(self._parameters_as_obj)
+            self._parameters_objs.append(par)
             self._parameters_as_obj.append({
                 "id":     str(par_id),
                 "number": par_index + 1,
@@ -714,13 +905,30 @@ class StateLogic(QObject):
                 "fit":    int(not par.fixed)
             })
 
-    def _setParametersAsXml(self):
-        self._parameters_as_xml = dicttoxml(self._parameters_as_obj, attr_type=False).decode()  # noqa: E501
+        self._parameters_index_valid = True
+
+    def _updateParameterRow(self, row: int):
+        """
+        Refresh value, error and fit flag of a single row in place.
+        Return True if anything has changed
+        """
+        par = self._parameters_objs[row]
+        item = self._parameters_as_obj[row]
+        value = par.raw_value
+        error = float(par.error)
+        fit = int(not par.fixed)
+        if item["value"] == value and item["error"] == error and item["fit"] == fit:
+            return False
+        item["value"] = value
+        item["error"] = error
+        item["fit"] = fit
+        return True
 
     def setParametersFilterCriteria(self, new_criteria):
         if self._parameters_filter_criteria == new_criteria:
             return
         self._parameters_filter_criteria = new_criteria
+        self.invalidateParametersIndex()
 
     ####################################################################################################################
     # Any parameter
@@ -738,6 +946,7 @@ class StateLogic(QObject):
                 return
 
             obj.fixed = not new_value
+            self._invalidatePhaseCif(obj)
             self.parametersChanged.emit()
             self.undoRedoChanged.emit()
 
@@ -746,7 +955,13 @@ class StateLogic(QObject):
                 return
 
             obj.value = new_value
-            self.parent.parametersChanged.emit()
+            self._invalidatePhaseCif(obj)
+            # Only the phase of the parameter is outdated, not all of them
+            self._editing_parameter = True
+            try:
+                self.parent.parametersChanged.emit()
+            finally:
+                self._editing_parameter = False
 
     def _parameterObj(self, obj_id: str):
         if not obj_id:
@@ -817,12 +1032,26 @@ class StateLogic(QObject):
     ####################################################################################################################
 
     def _onCurrentCalculatorChanged(self):
-        data = self._data.simulations
-        data = data[0]
+        data = self._data.byId(self._simulation_data_id)
         data.name = f'{self._interface.current_interface_name} engine'
+        self.invalidateParametersIndex()
 
 
 # utilities. Should probably be moved away from here
+def experimentArraysFileName(name):
+    # Data set names are free text: keep the characters safe in a file
+    # name on every platform, so that the name cannot add path components
+    stem = re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('._')
+    return f'{stem or "experiment"}.npy'
+
+
+def experimentArraysPath(project_dir, relative_path):
+    # Only the file name of the stored path is used, so that a
+    # project.json cannot point outside the experiments directory
+    file_name = relative_path.replace('\\', '/').split('/')[-1]
+    return os.path.join(project_dir, 'experiments', file_name)
+
+
 def createFile(path, content):
     if os.path.exists(path):
         print(f'File already exists {path}. Overwriting...')
@@ -0,0 +1,117 @@
+from PySide2.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal
+
+from easyDiffractionApp.Logic.SignalTracer import tracer
+
+
+class UpdateScheduler(QObject):
+    """
+    Coalesces refresh requests made within one event-loop tick.
+
+    Every refresh is registered under a kind together with its position
+    in the dependency order. Scheduling a kind which is already pending is
+    counted as suppressed; on the next tick every pending kind runs once,
+    in the registration order. Without a running event loop, e.g. in
+    headless scripts, the refreshes run right away.
+    """
+
+    flushed = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._refreshes = {}
+        self._order = []
+        self._pending = set()
+        self._requested = {}
+        self._executed = {}
+        self._suppressed = {}
+        self._flushing = False
+        # User action which scheduled the pending refreshes, for the tracer
+        self._action = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    # Public
+
+    def register(self, kind: str, *callbacks):
+        """
+        Register the callbacks of a refresh kind. Kinds run in the order
+        they are first registered in.
+        """
+        if kind not in self._refreshes:
+            self._refreshes[kind] = []
+            self._order.append(kind)
+            self.resetCounters(kind)
+        self._refreshes[kind].extend(callbacks)
+
+    def schedule(self, *kinds: str):
+        for kind in kinds:
+            if kind not in self._refreshes:
+                raise KeyError(f'Unknown refresh kind: {kind}')
+            self._requested[kind] += 1
+            if self._action is None:
+                self._action = tracer.currentAction()
+            if kind in self._pending:
+                self._suppressed[kind] += 1
+                continue
+            self._pending.add(kind)
+        if not self._pending or self._flushing:
+            # Kinds scheduled by a refresh run in the current flush
+            return
+        if not UpdateScheduler.eventLoopRunning():
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """
+        Run the pending refreshes now, e.g. when the result is needed
+        before the event loop gets control back.
+        """
+        self._timer.stop()
+        if self._flushing or not self._pending:
+            return
+        self._flushing = True
+        action, self._action = self._action, None
+        try:
+            with tracer.resumed(action):
+                while self._pending:
+                    # Refreshes may schedule kinds which come later in the order
+                    kind = next(kind for kind in self._order if kind in self._pending)
+                    self._pending.discard(kind)
+                    self._executed[kind] += 1
+                    for callback in self._refreshes[kind]:
+                        callback()
+        finally:
+            self._flushing = False
+            self._action = None
+        self.flushed.emit()
+
+    def counters(self):
+        kinds = {
+            kind: {
+                'requested': self._requested[kind],
+                'executed': self._executed[kind],
+                'suppressed': self._suppressed[kind]
+            }
+            for kind in self._order
+        }
+        return {
+            'requested': sum(self._requested.values()),
+            'executed': sum(self._executed.values()),
+            'suppressed': sum(self._suppressed.values()),
+            'kinds': kinds
+        }
+
+    def resetCounters(self, kind: str = None):
+        kinds = self._order if kind is None else [kind]
+        for kind in kinds:
+            self._requested[kind] = 0
+            self._executed[kind] = 0
+            self._suppressed[kind] = 0
+
+    @staticmethod
+    def eventLoopRunning():
+        return QCoreApplication.instance() is not None and QThread.currentThread().loopLevel() > 0  # noqa: E501
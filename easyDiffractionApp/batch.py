@@ -0,0 +1,50 @@
+import os
+import sys
+import argparse
+import multiprocessing
+
+from easyDiffractionApp.Logic.BatchFitting import BatchFitter
+
+
+def main():
+    # Arguments
+    parser = argparse.ArgumentParser(
+        description='fit the model of a project to a series of data files, without the GUI')
+    parser.add_argument('project',
+                        help='project.json with the model and minimizer to start from')
+    parser.add_argument('data', nargs='+',
+                        help='data files (.xye), glob patterns are expanded, e.g. "data/T_*.xye"')
+    parser.add_argument('-o', '--output', default='results.csv',
+                        help='results table, one row per data file (default: results.csv)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(),
+                        help='number of fitting processes (default: number of CPUs)')
+    parser.add_argument('-s', '--sequential', action='store_true',
+                        help='fit the files one by one in the given order, each fit starting from the previous result')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not read or write the cache of parsed data files in the user directory')
+    args = parser.parse_args()
+
+    fitter = BatchFitter(use_cache=not args.no_cache)
+    try:
+        fitter.loadProject(os.path.abspath(args.project))
+    except (FileNotFoundError, ValueError) as ex:
+        sys.exit(f'ERROR: {ex}')
+
+    files = fitter.dataFiles(args.data)
+    if not files:
+        sys.exit('ERROR: No data files found')
+
+    if args.sequential:
+        results = fitter.fitSequential(files)
+    else:
+        results = fitter.fitParallel(files, max(args.workers, 1))
+
+    fitter.saveResults(results, args.output)
+    failed = sum(1 for row in results if not row['success'])
+    print(f"+ {len(results) - failed} of {len(results)} fits succeeded, results saved to {args.output}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    main()
@@ -3,45 +3,83 @@ import sys
 import pathlib
 import platform
 import argparse
-import darkdetect
+import multiprocessing
 
-# PySide
-from PySide2.QtCore import QUrl
-from PySide2.QtWidgets import QApplication
-from PySide2.QtGui import Qt, QIcon
-from PySide2.QtQml import QQmlApplicationEngine, qmlRegisterType
-from PySide2.QtWebEngine import QtWebEngine
-from PySide2.QtWebEngineWidgets import QWebEnginePage, QWebEngineView  # to call hook-PySide2.QtWebEngineWidgets.py
+# Startup timings, from the start of this module
+from easyDiffractionApp.Logic.StartupProfiler import StartupProfiler
+STARTUP_PROFILER = StartupProfiler()
 
 # easyScience
 import utils
-import easyApp as easyApp2
-from easyApp.Logic.Translate import Translator
-from easyApp.Logic.Maintenance import Updater
-from easyDiffractionApp.Logic.PyQmlProxy import PyQmlProxy
 
 # Global vars
 CONFIG = utils.conf()
 
 
-class App(QApplication):
-    def __init__(self, sys_argv):
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)  # DOESN'T WORK?!, USE SCRIPT INSTEAD
-        QApplication.setAttribute(Qt.AA_UseDesktopOpenGL)
-        super(App, self).__init__(sys_argv)
+def createApplication(sys_argv):
+    # PySide
+    from PySide2.QtWidgets import QApplication
+    from PySide2.QtGui import Qt
+
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)  # DOESN'T WORK?!, USE SCRIPT INSTEAD
+    QApplication.setAttribute(Qt.AA_UseDesktopOpenGL)
+    return QApplication(sys_argv)
+
+
+def createProxy(engine):
+    """
+    Create the Python proxy of the application logic, which imports
+    easyDiffractionLib and the calculators, and expose it to QML.
+    """
+    from easyDiffractionApp.Logic.PyQmlProxy import PyQmlProxy
+    py_qml_proxy_obj = PyQmlProxy()
+    engine.rootContext().setContextProperty('_pyQmlProxyObj', py_qml_proxy_obj)
+    return py_qml_proxy_obj
+
+
+def isSystemThemeDark():
+    import darkdetect
+    return darkdetect.isDark()
 
 
 def main():
+    startup = STARTUP_PROFILER
+
     # Arguments
     parser = argparse.ArgumentParser()
     parser.add_argument('-l', '--logtofile', action='store_true',
                         help='enable logging in the file easyDiffraction.log in the system directory tmp instead of the terminal')
     parser.add_argument('-t', '--testmode', action='store_true',
                     help='run the application in test mode: run the tutorial, record a video and exit the application')
+    parser.add_argument('-p', '--profile', nargs='?', const='profile.json', metavar='FILE',
+                        help='record the timings of the hot paths and save them on exit to FILE (.json or .csv, default: profile.json)')
+    parser.add_argument('--trace-signals', metavar='FILE',
+                        help='record the signal handlers run and the signals emitted per user action and save them on exit to FILE (.json, or .folded for flame graphs)')
+    parser.add_argument('--profile-startup', nargs='?', const='', metavar='FILE',
+                        help='print the import time of every module, as python -X importtime does, and the time to the main window, and save them to FILE (.json or text) if given')
+    parser.add_argument('--shell-first', action='store_true',
+                        help='show the main window before loading the calculators and the rest of the application logic, which are attached once the window is shown')
     args = parser.parse_args()
+    if args.profile_startup is not None:
+        startup.install()
     if args.logtofile:
         import easyApp.Logging
 
+    # PySide
+    from PySide2.QtCore import QUrl, QTimer
+    from PySide2.QtGui import QIcon
+    from PySide2.QtQml import QQmlApplicationEngine, qmlRegisterType
+    from PySide2.QtWebEngine import QtWebEngine
+    from PySide2.QtWebEngineWidgets import QWebEnginePage, QWebEngineView  # to call hook-PySide2.QtWebEngineWidgets.py
+
+    # easyScience
+    import easyApp as easyApp2
+    from easyApp.Logic.Translate import Translator
+    from easyApp.Logic.Maintenance import Updater
+    from easyDiffractionApp.Logic.Profiling import profiler
+    from easyDiffractionApp.Logic.SignalTracer import tracer
+    startup.mark('imports')
+
     # Paths
     app_name = CONFIG['tool']['poetry']['name']
     current_path = os.path.dirname(sys.argv[0])
@@ -62,11 +100,11 @@ def main():
     translations_dir = CONFIG['ci']['app']['translations']['dir']
     translations_path = os.path.join(package_path, *translations_dir.split('/'))
 
-    # QtWebEngine
+    # QtWebEngine, used by the bokeh charts, has to be initialized before the application is created
     QtWebEngine.initialize()
 
     # Application
-    app = App(sys.argv)
+    app = createApplication(sys.argv)
     app.setApplicationName(CONFIG['tool']['poetry']['name'])
     app.setApplicationVersion(CONFIG['tool']['poetry']['version'])
     app.setOrganizationName(CONFIG['tool']['poetry']['name'])
@@ -76,18 +114,34 @@ def main():
     app.setWindowIcon(QIcon(os.path.join(package_path, 'Gui', 'Resources', 'Logo', 'App.png')))
     # QML application engine
     engine = QQmlApplicationEngine()
+    startup.mark('application')
+
+    # Timings
+    if args.profile:
+        profiler.enabled = True
+        app.aboutToQuit.connect(lambda: profiler.dump(args.profile))
+
+    # Signal flow
+    if args.trace_signals:
+        tracer.setEnabled(True)
+        app.aboutToQuit.connect(lambda: tracer.dump(args.trace_signals))
 
     # Python objects to be exposed to QML
-    py_qml_proxy_obj = PyQmlProxy()
+    # In the shell first mode, QML uses the mock proxy until the real one is attached
+    py_qml_proxy_obj = None
+    if args.shell_first:
+        engine.rootContext().setContextProperty('_pyQmlProxyObj', None)
+    else:
+        py_qml_proxy_obj = createProxy(engine)
+        startup.mark('proxy')
     translator = Translator(app, engine, translations_path, languages)
 
     # Expose the Python objects to QML
-    engine.rootContext().setContextProperty('_pyQmlProxyObj', py_qml_proxy_obj)
     engine.rootContext().setContextProperty('_settingsPath', settings_path)
     engine.rootContext().setContextProperty('_translator', translator)
     engine.rootContext().setContextProperty('_projectConfig', CONFIG)
     engine.rootContext().setContextProperty('_isTestMode', args.testmode)
-    engine.rootContext().setContextProperty('_isSystemThemeDark', darkdetect.isDark())
+    engine.rootContext().setContextProperty('_isSystemThemeDark', isSystemThemeDark())
 
     # Register types to be instantiated in QML
     qmlRegisterType(Updater, 'easyApp.Logic.Maintenance', 1, 0, 'Updater')
@@ -98,17 +152,18 @@ def main():
 
     # Load the root QML file
     engine.load(main_qml_path)
+    startup.mark('qml loaded')
+
+    # Root application window
+    root_obj = engine.rootObjects()
+    if not root_obj:
+        sys.exit(-1)
+    root_window = root_obj[0]
 
     # Customize app window titlebar
     if platform.system() == "Darwin":
         import ctypes, objc, Cocoa
 
-        # Root application window
-        root_obj = engine.rootObjects()
-        if not root_obj:
-            sys.exit(-1)
-        root_window = root_obj[0]
-
         ptr = int(root_window.winId())
         view = objc.objc_object(c_void_p=ctypes.c_void_p(ptr))
         window = view._.window
@@ -117,11 +172,37 @@ def main():
         window.setTitlebarAppearsTransparent_(True)
         window.setTitleVisibility_(Cocoa.NSWindowTitleHidden)
 
+    # Startup completion: first frame of the window and, in the shell first mode, the proxy attached
+    def onStartupFinished():
+        if args.profile_startup is None:
+            return
+        startup.uninstall()
+        print(startup.report())
+        if args.profile_startup:
+            startup.dump(args.profile_startup)
+
+    def onShellShown():
+        nonlocal py_qml_proxy_obj
+        py_qml_proxy_obj = createProxy(engine)
+        startup.mark('proxy')
+        onStartupFinished()
+
+    def onWindowShown():
+        root_window.frameSwapped.disconnect(onWindowShown)
+        startup.mark('window shown')
+        if args.shell_first:
+            # Let the first frame be presented before blocking on the imports
+            QTimer.singleShot(0, onShellShown)
+        else:
+            onStartupFinished()
+
+    root_window.frameSwapped.connect(onWindowShown)
+
     # Event loop
-    if not engine.rootObjects():
-        sys.exit(-1)
     sys.exit(app.exec_())
 
 
 if __name__ == '__main__':
+    # Fits in a separate process re-run this module in frozen builds
+    multiprocessing.freeze_support()
     main()
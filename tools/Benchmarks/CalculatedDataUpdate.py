@@ -0,0 +1,55 @@
+"""
+Micro-benchmark of Plotting1dProxy.setCalculatedData, as called on every
+calculated pattern update (e.g. every fit progress step), with a measured
+pattern loaded: time per call and memory allocated by a call on top of
+the arrays kept by the proxy (tracemalloc peak).
+
+Usage: python tools/Benchmarks/CalculatedDataUpdate.py [repeat]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyDiffractionApp.Logic.Proxies.Plotting1d import Plotting1dProxy  # noqa: E402
+
+SIZES = [10000, 1000000]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    print(f'best of {repeat}')
+    print(f'{"points":>8}{"ms per call":>13}{"peak alloc, MiB":>17}')
+    for size in SIZES:
+        x = np.linspace(1.0, 160.0, size)
+        y = 1000.0 * np.exp(-(x - 80.0) ** 2) + 100.0
+        proxy = Plotting1dProxy()
+        proxy.setMeasuredData(x, y, np.sqrt(y))
+
+        # A few calculated patterns, as from consecutive fit steps
+        calculated = [y * scale for scale in np.linspace(0.9, 1.1, 4)]
+        step = iter(range(10 ** 9))
+
+        def update():
+            proxy.setCalculatedData(x, calculated[next(step) % len(calculated)])
+
+        update()
+        time = min(timeit.repeat(update, number=1, repeat=repeat)) * 1000
+
+        tracemalloc.start()
+        update()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f'{size:>8}{time:>13.2f}{peak / 2 ** 20:>17.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Memory held per pattern by the experiment data set and the 1D plotting
+proxy arrays (measured, calculated and difference series with their
+level-of-detail pyramids), measured with tracemalloc.
+
+'legacy' reproduces the previous layout: three separate x, y, e arrays,
+and precomputed upper/lower error bands and 64-bit pyramid indices in the
+plotting proxy. The others use DataSet1D and Plotting1dProxy as they are,
+with float64 and float32 data set buffers.
+
+Usage: python tools/Benchmarks/DataSetMemory.py [points] [patterns]
+"""
+
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyDiffractionApp.Logic.DataStore import DataSet1D  # noqa: E402
+from easyDiffractionApp.Logic.Proxies.Plotting1d import Plotting1dProxy  # noqa: E402
+
+
+def legacyPyramidBytes(size):
+    # Levels of 2 * ceil(size / 2**k) int64 indices, k >= 1
+    total, bins = 0, size
+    while bins > 1:
+        bins = (bins + 1) // 2
+        total += 2 * bins * 8
+    return total
+
+
+def legacyPattern(columns, y_calc):
+    x, y, e = columns
+    arrays = {
+        'x': x, 'y': y, 'e': e,
+        'measured_upper': y + e, 'measured_lower': y - e,
+        'difference': y - y_calc,
+    }
+    arrays['difference_upper'] = arrays['difference'] + e
+    arrays['difference_lower'] = arrays['difference'] - e
+    # Three pyramids: measured, calculated and difference
+    pyramids = np.empty(3 * legacyPyramidBytes(x.size), dtype=np.uint8)
+    return arrays, pyramids
+
+
+def currentPattern(columns, y_calc, dtype):
+    data = DataSet1D(name='pattern', data_type='experiment', dtype=dtype)
+    data.setColumns(columns)
+    proxy = Plotting1dProxy()
+    proxy._setMeasuredDataArrays(data.x, data.y, data.e)
+    proxy._setCalculatedDataArrays(data.x, y_calc)
+    proxy._setDifferenceDataArrays()
+    # The pyramids are built on the first decimated draw
+    for pyramid in (proxy._measured_pyramid, proxy._calculated_pyramid, proxy._difference_pyramid):  # noqa: E501
+        pyramid.indices(pixels=100)
+    return data, proxy
+
+
+def measure(build, patterns):
+    tracemalloc.start()
+    kept = [build() for _ in range(patterns)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size / patterns
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    patterns = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    x = np.linspace(1.0, 160.0, points)
+    y = 1000.0 * np.exp(-(x - 80.0) ** 2) + 100.0
+    columns = np.vstack((x, y, np.sqrt(y)))
+    # The calculated pattern is owned by the calculator, not counted
+    y_calc = y * 0.98
+
+    # Every pattern gets the fresh (3, n) array of a parsed data file
+    results = [
+        ('legacy', measure(lambda: legacyPattern(columns.copy(), y_calc), patterns)),
+        ('float64', measure(lambda: currentPattern(columns.copy(), y_calc, np.float64), patterns)),
+        ('float32', measure(lambda: currentPattern(columns.copy(), y_calc, np.float32), patterns))
+    ]
+
+    legacy_size = results[0][1]
+    print(f'points: {points}, patterns: {patterns}, memory per pattern')
+    for name, size in results:
+        print(f'{name:>8}: {size / 2 ** 20:8.2f} MiB ({size / legacy_size * 100:5.1f} %)')
+
+
+if __name__ == '__main__':
+    main()
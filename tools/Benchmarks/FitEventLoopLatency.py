@@ -0,0 +1,87 @@
+"""
+Responsiveness of the GUI process during a fit: the lateness of a 10 ms
+periodic tick on the main thread (standing in for the Qt event loop)
+while a GIL-bound fit runs in a thread of the same process, as in the
+'thread' fit mode, or in a spawned worker process, as in the 'process'
+fit mode.
+
+The fit function evaluates its peaks in a Python loop, so that, like the
+Python side of a calculator, it holds the GIL for most of the fit.
+
+Usage: python tools/Benchmarks/FitEventLoopLatency.py [points] [peaks]
+"""
+
+import sys
+import time
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.optimize import least_squares
+
+TICK = 0.010
+
+
+def pattern(x, pars, num_peaks):
+    scale, width, shift = pars
+    y = np.full_like(x, 10.0)
+    for center in np.linspace(x[0] + 5, x[-1] - 5, num_peaks) + shift:
+        # Python-level work per peak, as in the calculator bindings
+        for start in range(0, x.size, 256):
+            dx = (x[start:start + 256] - center) / width
+            y[start:start + 256] += scale * (0.5 * np.exp(-np.log(2) * dx ** 2) + 0.5 / (1 + dx ** 2))  # noqa: E501
+    return y
+
+
+def fit(points, num_peaks):
+    x = np.linspace(5, 150, points)
+    y = pattern(x, [100, 0.1, 0.0], num_peaks) + np.random.default_rng(0).normal(0, 1, points)  # noqa: E501
+    weights = 1 / np.sqrt(np.abs(y))
+    res = least_squares(lambda pars: (y - pattern(x, pars, num_peaks)) * weights,
+                        [80, 0.15, 0.02], method='lm')
+    return res.x
+
+
+def tickLateness(done):
+    lateness = []
+    next_tick = time.perf_counter() + TICK
+    while not done():
+        time.sleep(max(next_tick - time.perf_counter(), 0))
+        now = time.perf_counter()
+        lateness.append(now - next_tick)
+        next_tick = now + TICK
+    return np.array(lateness) * 1000
+
+
+def report(mode, elapsed, lateness):
+    print(f'{mode:>8}{elapsed:>9.2f}{lateness.size:>8}{np.median(lateness):>10.2f}'
+          f'{np.percentile(lateness, 95):>10.2f}{lateness.max():>10.2f}')
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    num_peaks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    print(f'points: {points}, peaks: {num_peaks}, tick: {TICK * 1000:.0f} ms')
+    print(f'{"mode":>8}{"fit, s":>9}{"ticks":>8}{"median":>10}{"p95":>10}{"max":>10}   (tick lateness, ms)')  # noqa: E501
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=fit, args=(points, num_peaks))
+    thread.start()
+    lateness = tickLateness(lambda: not thread.is_alive())
+    report('thread', time.perf_counter() - start, lateness)
+
+    # The worker is started and warmed up beforehand, as the fit process
+    # pool of the application is reused between the fits
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:  # noqa: E501
+        executor.submit(fit, 100, 1).result()
+        start = time.perf_counter()
+        future = executor.submit(fit, points, num_peaks)
+        lateness = tickLateness(future.done)
+        future.result()
+        report('process', time.perf_counter() - start, lateness)
+
+
+if __name__ == '__main__':
+    main()
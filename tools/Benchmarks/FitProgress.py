@@ -0,0 +1,67 @@
+"""
+Overhead of the fit progress reporting (FitProgressMonitor) on the fit
+wall-clock: a synthetic powder pattern (sum of pseudo-Voigt peaks) is
+fitted with scipy.optimize.least_squares, once with the plain fit
+function and once wrapped by the monitor publishing at 10 Hz.
+
+Usage: python tools/Benchmarks/FitProgress.py [points] [repeat]
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+from scipy.optimize import least_squares
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyDiffractionApp.Logic.FitProgress import FitProgressMonitor  # noqa: E402
+
+NUM_PEAKS = 200
+
+
+def pattern(x, pars):
+    scale, width, shift = pars
+    centers = np.linspace(x[0] + 5, x[-1] - 5, NUM_PEAKS) + shift
+    dx = (x[:, np.newaxis] - centers) / width
+    peaks = 0.5 * np.exp(-np.log(2) * dx ** 2) + 0.5 / (1 + dx ** 2)
+    return scale * peaks.sum(axis=1) + 10
+
+
+def run(fit_func, x, y, weights):
+    def residuals(pars):
+        return (y - fit_func(x, pars)) * weights
+    return least_squares(residuals, [80, 0.15, 0.02], method='lm').x
+
+
+def main():
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 6000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    x = np.linspace(5, 150, points)
+    y = pattern(x, [100, 0.1, 0.0]) + np.random.default_rng(0).normal(0, 1, points)
+    weights = 1 / np.sqrt(np.abs(y))
+
+    snapshots = []
+    monitor = FitProgressMonitor(pattern, publish=snapshots.append, interval=0.1)
+
+    def monitored():
+        monitor.start(x, y, weights, num_pars=3)
+        result = run(monitor, x, y, weights)
+        monitor.stop()
+        return result
+
+    plain_time = min(timeit.repeat(lambda: run(pattern, x, y, weights), number=1, repeat=repeat))
+    snapshots.clear()
+    monitored_time = min(timeit.repeat(monitored, number=1, repeat=repeat))
+
+    print(f'points: {points}, best of {repeat}')
+    print(f'plain:     {plain_time:.3f} s')
+    print(f'monitored: {monitored_time:.3f} s ({(monitored_time / plain_time - 1) * 100:+.1f} %), '
+          f'{len(snapshots) / repeat:.0f} snapshots per fit')
+
+
+if __name__ == '__main__':
+    main()
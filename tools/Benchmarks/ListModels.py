@@ -0,0 +1,89 @@
+"""
+Benchmark of the data sent to the QML table views: XML strings built with
+dicttoxml (and parsed back by XmlListModel in QML) against DictListModel,
+which exposes the same dicts directly as model roles.
+
+The dicts are taken from the example projects, so only the Python side is
+timed here. The XmlListModel parsing in QML, which is not included, comes
+on top of the dicttoxml time.
+
+Usage: python tools/Benchmarks/ListModels.py [repeat]
+"""
+
+import os
+import sys
+import json
+import timeit
+
+from dicttoxml import dicttoxml
+from PySide2.QtCore import QCoreApplication
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyDiffractionApp.Logic.DisplayModels.DictListModel import DictListModel  # noqa: E402
+
+PROJECTS = ['PbSO4', 'Dy3Al5O12']
+
+
+def parametersTable(obj, path='', rows=None):
+    # Flat list of the parameters table rows, as built by State._buildParametersAsObj
+    if rows is None:
+        rows = []
+    if isinstance(obj, dict):
+        if obj.get('@class') == 'Parameter':
+            rows.append({
+                'id': str(obj['@id']),
+                'number': len(rows) + 1,
+                'label': path,
+                'value': obj['value'],
+                'unit': obj.get('units', ''),
+                'error': float(obj.get('error', 0.0)),
+                'fit': int(not obj.get('fixed', True))
+            })
+            return rows
+        for key, value in obj.items():
+            if key != 'interface':
+                parametersTable(value, f'{path}.{key}' if path else key, rows)
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            parametersTable(value, f'{path}.{index}', rows)
+    return rows
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+
+    print(f'best of {repeat}')
+    print(f'{"project":<12}{"table":<12}{"rows":>6}{"xml, ms":>10}{"model, ms":>11}{"edit xml, ms":>14}{"edit model, ms":>16}')  # noqa: E501
+    for name in PROJECTS:
+        with open(os.path.join(ROOT_DIR, 'examples', name, 'project.json'), 'r') as file:
+            sample = json.load(file)['sample']
+
+        phases = sample['phases']['data']
+        tables = {
+            'phases': (phases, ['name', 'spacegroup', 'cell', 'atoms']),
+            'atoms': (phases[0]['atoms']['data'], ['label', 'specie', 'fract_x', 'fract_y', 'fract_z', 'occupancy', 'adp']),  # noqa: E501
+            'parameters': (parametersTable(sample), ['id', 'number', 'label', 'value', 'unit', 'error', 'fit'])  # noqa: E501
+        }
+
+        for table_name, (items, roles) in tables.items():
+            model = DictListModel(roles)
+            xml_time = best(lambda: dicttoxml(items, attr_type=True).decode(), repeat)
+            model_time = best(lambda: (model.clear(), model.setItems(items)), repeat)
+
+            # Single edited row: full XML rebuild against a single row update
+            edited = dict(items[0])
+            edit_xml_time = best(lambda: dicttoxml([edited] + items[1:], attr_type=True).decode(), repeat)  # noqa: E501
+            edit_model_time = best(lambda: model.setRow(0, edited), repeat)
+
+            print(f'{name:<12}{table_name:<12}{len(items):>6}{xml_time:>10.3f}{model_time:>11.3f}{edit_xml_time:>14.3f}{edit_model_time:>16.3f}')  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
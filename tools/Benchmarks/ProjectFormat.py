@@ -0,0 +1,84 @@
+"""
+Benchmark of the project.json format: the legacy format with the
+experiment arrays stored as JSON float lists against the current one,
+where the arrays are stored as raw .npy files next to project.json.
+
+Usage: python tools/Benchmarks/ProjectFormat.py [repeat]
+"""
+
+import os
+import sys
+import glob
+import json
+import timeit
+import tempfile
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+def default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError('Unknown type:', type(obj))
+
+
+def saveLegacy(descr, arrays, project_dir):
+    descr = dict(descr, experiments=list(arrays))
+    with open(os.path.join(project_dir, 'project.json'), 'w') as file:
+        file.write(json.dumps(descr, indent=4, default=default))
+
+
+def loadLegacy(project_dir):
+    with open(os.path.join(project_dir, 'project.json'), 'r') as file:
+        descr = json.load(file)
+    return [np.array(descr['experiments'][idx]) for idx in range(3)]
+
+
+def saveCompact(descr, arrays, project_dir):
+    os.makedirs(os.path.join(project_dir, 'experiments'), exist_ok=True)
+    np.save(os.path.join(project_dir, 'experiments', 'data.npy'), np.vstack(arrays).astype('<f8'))
+    descr = dict(descr, experiments=[{'name': 'data', 'data': 'experiments/data.npy'}])
+    with open(os.path.join(project_dir, 'project.json'), 'w') as file:
+        file.write(json.dumps(descr, indent=4, default=default))
+
+
+def loadCompact(project_dir):
+    with open(os.path.join(project_dir, 'project.json'), 'r') as file:
+        descr = json.load(file)
+    relative_path = descr['experiments'][0]['data']
+    arrays = np.load(os.path.join(project_dir, *relative_path.split('/')), mmap_mode='r')
+    return arrays[0], arrays[1], arrays[2]
+
+
+def dirSize(project_dir):
+    return sum(os.path.getsize(os.path.join(path, name))
+               for path, _, names in os.walk(project_dir) for name in names)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    formats = [('legacy', saveLegacy, loadLegacy), ('compact', saveCompact, loadCompact)]
+
+    print(f'best of {repeat}')
+    print(f'{"project":<12}{"format":<10}{"size, KB":>10}{"save, ms":>10}{"load, ms":>10}')
+    for project_path in sorted(glob.glob(os.path.join(ROOT_DIR, 'examples', '*', 'project.json'))):
+        with open(project_path, 'r') as file:
+            descr = json.load(file)
+        arrays = [np.array(descr['experiments'][idx]) for idx in range(3)]
+        del descr['experiments']
+        name = os.path.basename(os.path.dirname(project_path))
+
+        for format_name, save, load in formats:
+            with tempfile.TemporaryDirectory() as project_dir:
+                save_time = min(timeit.repeat(lambda: save(descr, arrays, project_dir), number=1, repeat=repeat))
+                load_time = min(timeit.repeat(lambda: load(project_dir), number=1, repeat=repeat))
+                loaded = load(project_dir)
+                assert all(np.array_equal(a, b) for a, b in zip(arrays, loaded))
+                size = dirSize(project_dir) / 1024
+            print(f'{name:<12}{format_name:<10}{size:>10.1f}{save_time * 1000:>10.2f}{load_time * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark of the experimental data readers: np.loadtxt (the previous
+loader) against easyDiffractionApp.Logic.ColumnReader.readColumns.
+
+Usage: python tools/Benchmarks/ReadColumns.py [repeat]
+"""
+
+import os
+import sys
+import glob
+import timeit
+import tempfile
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyDiffractionApp.Logic.ColumnReader import readColumns  # noqa: E402
+
+
+def loadtxt(file_path):
+    return np.loadtxt(file_path, unpack=True)
+
+
+def syntheticFile(dir_path, num_points, num_columns):
+    x = np.linspace(5.0, 150.0, num_points)
+    y = 1000.0 + 500.0 * np.sin(x) ** 2
+    columns = [x, y, np.sqrt(y)][:num_columns]
+    file_path = os.path.join(dir_path, f'synthetic_{num_points}_{num_columns}col.xye')
+    header = 'synthetic pattern: 2theta intensity sigma'
+    np.savetxt(file_path, np.column_stack(columns), fmt='%.6f', header=header)
+    return file_path
+
+
+def benchmark(file_path, repeat):
+    loaders = [('np.loadtxt', loadtxt), ('readColumns', readColumns)]
+    times = {}
+    for name, loader in loaders:
+        try:
+            times[name] = min(timeit.repeat(lambda: loader(file_path), number=1, repeat=repeat))
+        except ValueError:
+            times[name] = None  # e.g. np.loadtxt with unpack on 2-column files
+    return times
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    files = sorted(glob.glob(os.path.join(ROOT_DIR, 'tests', '*.xye')))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files.append(syntheticFile(tmp_dir, 1000000, 3))
+        files.append(syntheticFile(tmp_dir, 1000000, 2))
+
+        print(f'numpy {np.__version__}, best of {repeat}')
+        print(f'{"file":<40}{"points":>10}{"np.loadtxt, s":>16}{"readColumns, s":>16}{"speedup":>10}')
+        for file_path in files:
+            num_points = readColumns(file_path).shape[1]
+            times = benchmark(file_path, repeat)
+            old, new = times['np.loadtxt'], times['readColumns']
+            old_str = f'{old:.4f}' if old is not None else 'n/a'
+            speedup = f'{old / new:.1f}x' if old is not None else 'n/a'
+            name = os.path.basename(file_path)
+            print(f'{name:<40}{num_points:>10}{old_str:>16}{new:>16.4f}{speedup:>10}')
+
+
+if __name__ == '__main__':
+    main()
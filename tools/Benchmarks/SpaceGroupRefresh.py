@@ -0,0 +1,73 @@
+"""
+Time of a full structure editor refresh, i.e. of the symmetry properties
+read by QML on every structureParametersChanged: crystal systems, space
+groups of the current system, current space group, its settings and the
+current setting.
+
+'legacy' recomputes the lists from SpacegroupInfo, as StateLogic did
+before; 'table' serves them from SpaceGroupTable (the first refresh,
+which builds the entries it reads, is reported separately). The space
+group lists of every system, trigonal and the empty system of a sample
+without phases included, are checked to be the same.
+
+Usage: python tools/Benchmarks/SpaceGroupRefresh.py [repeat]
+"""
+
+import os
+import sys
+import timeit
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, ROOT_DIR)
+
+from easyCore.Symmetry.tools import SpacegroupInfo  # noqa: E402
+from easyDiffractionApp.Logic.SpaceGroups import SpaceGroupTable  # noqa: E402
+
+# Current space group of the refreshed phase: system, number and setting
+CURRENT = ('tetragonal', 138, 'P 42/n c m:1')
+
+
+def legacyRefresh(system, number, setting):
+    systems = [system.capitalize() for system in SpacegroupInfo.get_all_systems()]
+    numbers = SpacegroupInfo.get_ints_from_system(system)
+    space_groups = [f"<font color='#999'>{num}</font> {SpacegroupInfo.get_symbol_from_int_number(num)}"
+                    for num in numbers]
+    space_group_index = numbers.index(number) if number in numbers else 0
+    settings = SpacegroupInfo.get_compatible_HM_from_int(number)
+    formatted_settings = [f"<font color='#999'>{i + 1}</font> {name}" for i, name in enumerate(settings)]
+    setting_index = settings.index(setting)
+    return systems, space_groups, space_group_index, formatted_settings, setting_index
+
+
+def tableRefresh(system, number, setting):
+    table = SpaceGroupTable.instance()
+    return (table.crystalSystems(),
+            table.formattedSpaceGroups(system),
+            table.spaceGroupIndex(system, number),
+            table.formattedSettings(number),
+            table.settingIndex(number, setting))
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    build = timeit.timeit(lambda: tableRefresh(*CURRENT), number=1) * 1000
+    legacy = min(timeit.repeat(lambda: legacyRefresh(*CURRENT), number=1, repeat=repeat)) * 1000
+    table = min(timeit.repeat(lambda: tableRefresh(*CURRENT), number=1, repeat=repeat)) * 1000
+
+    assert [list(item) if isinstance(item, (list, tuple)) else item for item in legacyRefresh(*CURRENT)] == \
+           [list(item) if isinstance(item, (list, tuple)) else item for item in tableRefresh(*CURRENT)]
+
+    for system in SpacegroupInfo.get_all_systems() + ['trigonal', '']:
+        numbers = SpacegroupInfo.get_ints_from_system(system)
+        assert legacyRefresh(system, numbers[0], SpacegroupInfo.get_compatible_HM_from_int(numbers[0])[0])[1] == \
+               SpaceGroupTable.instance().formattedSpaceGroups(system)
+
+    print(f'best of {repeat}, ms per refresh')
+    print(f'{"legacy":>12}: {legacy:10.4f}')
+    print(f'{"table build":>12}: {build:10.4f} (once per process)')
+    print(f'{"table":>12}: {table:10.4f}')
+
+
+if __name__ == '__main__':
+    main()